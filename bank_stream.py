@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""Write a question bank without holding it in memory.
+
+``build_question_bank.main()`` keeps the compiled bank in memory, because
+validation, anchors and shards need all of it. Translated and synthetic
+load-test banks can have hundreds of thousands of questions, so this writer
+takes sections whose questions are produced lazily and encodes them one
+question at a time into buffered files. Each file is written under a
+temporary name and moved over the target only when complete.
+
+Streaming ``questions/`` gives the same bytes as the build's ``questions.json``,
+anchors included (they come from the committed ``questions/anchors.json``, not
+from the compile cache). Next to the JSON goes an NDJSON file with one question
+per line, tagged with its section id and position.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import textwrap
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from build_question_bank import compile_section, q, section_ids
+
+BUFFER_SIZE = 1 << 20
+TOPICS = ["Python", "Django", "HTML", "CSS", "Git", "PythonAnywhere", "templates", "ORM", "views", "URLs"]
+WORDS = ["what", "which", "does", "command", "file", "model", "list", "näkymä", "sivu", "tietokanta", "función", "dépôt"]
+
+
+class AtomicFile:
+    """Buffered binary file written under a temporary name and moved into place on success.
+
+    The content is hashed while it is written; when the existing file has the
+    same bytes it is left alone (``changed`` is then False).
+    """
+
+    def __init__(self, path: Path, buffer_size: int = BUFFER_SIZE) -> None:
+        self.path = path
+        self.temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        self.buffer_size = buffer_size
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.changed = True
+
+    def __enter__(self) -> "AtomicFile":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.temporary, "wb", buffering=self.buffer_size)
+        return self
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.digest.update(data)
+        self.size += len(data)
+        self._handle.write(data)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._handle.close()
+        if exc_type is not None:
+            self.temporary.unlink()
+            return
+        if self._same_as_target():
+            self.changed = False
+            self.temporary.unlink()
+        else:
+            os.replace(self.temporary, self.path)
+
+    def _same_as_target(self) -> bool:
+        if not self.path.is_file() or self.path.stat().st_size != self.size:
+            return False
+        existing = hashlib.sha256()
+        with self.path.open("rb") as handle:
+            for block in iter(lambda: handle.read(self.buffer_size), b""):
+                existing.update(block)
+        return existing.digest() == self.digest.digest()
+
+
+def indented(value: object, prefix: str) -> str:
+    return textwrap.indent(json.dumps(value, indent=2, ensure_ascii=False), prefix)
+
+
+def write_section(bank: AtomicFile, lines: AtomicFile, section: Dict[str, object]) -> int:
+    """One entry of the ``sections`` list, as ``render_fragment`` lays it out; returns the question count."""
+    fields = [key for key in section if key != "questions"]
+    bank.write("    {\n")
+    for key in fields:
+        bank.write(f"      {json.dumps(key)}: {json.dumps(section[key], ensure_ascii=False)},\n")
+    bank.write('      "questions": [')
+    count = 0
+    for count, question in enumerate(section["questions"], start=1):
+        bank.write(",\n" if count > 1 else "\n")
+        bank.write(indented(question, "        "))
+        record = {"section": section["id"], "number": count - 1, **question}
+        lines.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    bank.write("\n      ]\n    }" if count else "]\n    }")
+    return count
+
+
+def write_bank(sections: Iterable[Dict[str, object]], output: Path, ndjson: Path) -> Tuple[int, int, bool, bool]:
+    """Stream ``sections`` to ``output`` and ``ndjson``; returns (sections, questions, changed flags)."""
+    written_sections = written_questions = 0
+    with AtomicFile(output) as bank, AtomicFile(ndjson) as lines:
+        bank.write('{\n  "sections": [')
+        for section in sections:
+            bank.write(",\n" if written_sections else "\n")
+            written_questions += write_section(bank, lines, section)
+            written_sections += 1
+        bank.write("\n  ]\n}\n" if written_sections else "]\n}\n")
+    return written_sections, written_questions, bank.changed, lines.changed
+
+
+def source_sections() -> Iterator[Dict[str, object]]:
+    """The compiled sections of ``questions/``, with their stored anchors, one at a time.
+
+    Unlike ``load_section`` nothing is kept in memory once a section is written.
+    """
+    for section_id in section_ids():
+        yield compile_section(section_id)[0]["section"]
+
+
+def synthetic_questions(section_number: int, count: int, seed: int) -> Iterator[Dict[str, object]]:
+    rng = random.Random(f"{seed}:{section_number}")
+    for number in range(count):
+        topic = rng.choice(TOPICS)
+        prompt = f"{' '.join(rng.choices(WORDS, k=6)).capitalize()} {topic} #{section_number}.{number}?"
+        options = [f"{topic} {' '.join(rng.choices(WORDS, k=3))} ({option})" for option in "abcd"]
+        explanation = f"See the {topic} chapter." if number % 3 == 0 else None
+        yield q(prompt, options, rng.randrange(4), explanation)
+
+
+def synthetic_sections(questions: int, per_section: int, seed: int = 0) -> Iterator[Dict[str, object]]:
+    """A generated bank of ``questions`` questions; nothing is built before it is written."""
+    for section_number, start in enumerate(range(0, questions, per_section)):
+        yield {
+            "id": f"synthetic-{section_number}",
+            "title": f"Synthetic section {section_number}",
+            "tutorialPath": "../tutorial/index.html",
+            "questions": synthetic_questions(section_number, min(per_section, questions - start), seed),
+        }
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", type=Path, help="Where to write the bank JSON.")
+    parser.add_argument(
+        "--ndjson",
+        type=Path,
+        help="Where to write one question per line (default: the output with an .ndjson suffix).",
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        metavar="QUESTIONS",
+        help="Write a generated bank with this many questions instead of questions/.",
+    )
+    parser.add_argument("--per-section", type=int, default=10, help="Questions per synthetic section (default: 10).")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic bank (default: 0).")
+    parser.add_argument("--memory", action="store_true", help="Report the peak memory Python allocated while writing.")
+    args = parser.parse_args(argv)
+    if args.per_section < 1:
+        parser.error("--per-section must be at least 1")
+    if args.synthetic is not None and args.synthetic < 0:
+        parser.error("--synthetic must not be negative")
+    return args
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    ndjson = args.ndjson or args.output.with_suffix(".ndjson")
+    if args.synthetic is not None:
+        sections = synthetic_sections(args.synthetic, args.per_section, args.seed)
+    else:
+        sections = source_sections()
+    if args.memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    section_count, question_count, bank_changed, lines_changed = write_bank(sections, args.output, ndjson)
+    elapsed = time.perf_counter() - started
+    for path, changed in ((args.output, bank_changed), (ndjson, lines_changed)):
+        print(f"Wrote {path}" if changed else f"{path} is up to date")
+    print(f"Streamed {question_count} questions in {section_count} sections in {elapsed:.2f}s")
+    if args.memory:
+        print(f"Peak traced memory: {tracemalloc.get_traced_memory()[1] / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
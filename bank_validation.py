@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""Structural checks and near-duplicate detection for the quiz question bank."""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Sequence, Set, Tuple
+
+try:  # Optional: without NumPy only the structural checks run.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+OPTION_COUNT = 4
+QUIZ_DIR = Path("docs/quiz")
+TUTORIAL_DIR = Path("docs/tutorial")
+DEFAULT_THRESHOLD = 0.8
+SHINGLE_SIZE = 5
+# 8 bands of 4 rows: a pair at 0.8 similarity becomes a candidate with ~98% probability.
+NUM_PERM = 32
+BANDS = 8
+# N-gram hashes permuted per NumPy batch; bounds memory at NUM_PERM * 4 bytes each.
+BATCH_SHINGLES = 1 << 16
+WORD_RE = re.compile(r"[\W_]+")
+
+
+@dataclass
+class Issue:
+    level: str  # "error" or "warning"
+    where: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.level}: {self.where}: {self.message}"
+
+
+def canonical(text: str) -> str:
+    """Case and whitespace folded; what counts as "the same" text."""
+    return " ".join(text.casefold().split())
+
+
+def normalize(text: str) -> str:
+    """Only letters and digits, for similarity: punctuation is ignored."""
+    return WORD_RE.sub(" ", text.casefold()).strip()
+
+
+@dataclass
+class GramIndex:
+    """Hashed byte n-grams and MinHash signatures for a list of texts.
+
+    Byte n-grams of the normalized UTF-8 text need no tokenizer, so every
+    language is handled the same way, and the whole corpus is hashed with a
+    handful of vector operations instead of a Python loop per n-gram.
+    """
+
+    hashes: "np.ndarray"
+    starts: "np.ndarray"
+    ends: "np.ndarray"
+    signatures: "np.ndarray"
+
+    @classmethod
+    def build(cls, texts: Sequence[str], seed: int = 1) -> "GramIndex":
+        encoded = [normalize(text).encode("utf-8").ljust(SHINGLE_SIZE, b"\0") for text in texts]
+        lengths = np.fromiter((len(item) for item in encoded), dtype=np.int64, count=len(encoded))
+        buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint32)
+        owner = np.repeat(np.arange(len(encoded)), lengths)
+        windows = len(buffer) - SHINGLE_SIZE + 1
+        hashes = np.zeros(windows, dtype=np.uint32)
+        with np.errstate(over="ignore"):
+            for offset in range(SHINGLE_SIZE):
+                hashes = hashes * np.uint32(16_777_619) + buffer[offset : offset + windows]
+        # Drop the windows that straddle two texts.
+        hashes = hashes[owner[:windows] == owner[SHINGLE_SIZE - 1 :]]
+        ends = np.cumsum(lengths - SHINGLE_SIZE + 1)
+        starts = ends - (lengths - SHINGLE_SIZE + 1)
+        return cls(hashes, starts, ends, minhash_signatures(hashes, starts, ends, seed))
+
+    def grams(self, index: int) -> Set[int]:
+        return set(self.hashes[self.starts[index] : self.ends[index]].tolist())
+
+
+def minhash_signatures(hashes: "np.ndarray", starts: "np.ndarray", ends: "np.ndarray", seed: int) -> "np.ndarray":
+    """One ``NUM_PERM``-wide MinHash signature per text.
+
+    Each permutation is ``a * h + b`` modulo 2**32. That is a weak hash family,
+    but the signatures only nominate candidates that are checked exactly.
+    """
+    rng = np.random.default_rng(seed)
+    multipliers = rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint32) | np.uint32(1)
+    offsets = rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint32)
+    signatures = np.empty((len(starts), NUM_PERM), dtype=np.uint32)
+    first = 0
+    while first < len(starts):
+        # Whole texts per batch, about BATCH_SHINGLES hashes at a time.
+        last = max(first + 1, int(np.searchsorted(ends, starts[first] + BATCH_SHINGLES, side="right")))
+        batch = hashes[starts[first] : ends[last - 1]]
+        with np.errstate(over="ignore"):
+            permuted = multipliers[:, None] * batch[None, :] + offsets[:, None]
+        signatures[first:last] = np.minimum.reduceat(permuted, starts[first:last] - starts[first], axis=1).T
+        first = last
+    return signatures
+
+
+def lsh_candidates(signatures: "np.ndarray") -> Set[Tuple[int, int]]:
+    """Pairs of rows that agree on every value of at least one band."""
+    rows = NUM_PERM // BANDS
+    candidates: Set[Tuple[int, int]] = set()
+    for band in range(BANDS):
+        block = signatures[:, band * rows : (band + 1) * rows].astype(np.uint64)
+        keys = block[:, 0]
+        with np.errstate(over="ignore"):
+            for column in range(1, rows):
+                keys = keys * np.uint64(0x9E3779B97F4A7C15) + block[:, column]
+        order = np.argsort(keys, kind="stable")
+        ordered = keys[order]
+        # Runs of equal keys are the buckets; nearly all of them hold one row.
+        boundaries = np.flatnonzero(np.concatenate(([True], ordered[1:] != ordered[:-1], [True])))
+        for begin, end in zip(boundaries[:-1], boundaries[1:]):
+            if end - begin > 1:
+                members = sorted(order[begin:end].tolist())
+                for position, left in enumerate(members):
+                    for right in members[position + 1 :]:
+                        candidates.add((left, right))
+    return candidates
+
+
+def jaccard(left: Set[int], right: Set[int]) -> float:
+    return len(left & right) / len(left | right)
+
+
+def near_duplicate_pairs(texts: Sequence[str], threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[int, int, float]]:
+    """Index pairs whose n-gram Jaccard similarity is at least ``threshold``.
+
+    LSH banding over MinHash signatures proposes candidate pairs in roughly
+    linear time; each candidate is then confirmed with the exact Jaccard.
+    """
+    if len(texts) < 2:
+        return []
+    index = GramIndex.build(texts)
+    return confirm_pairs(lsh_candidates(index.signatures), index.grams, threshold)
+
+
+def confirm_pairs(candidates: Set[Tuple[int, int]], grams, threshold: float) -> List[Tuple[int, int, float]]:
+    cache: Dict[int, Set[int]] = {}
+
+    def cached(index: int) -> Set[int]:
+        if index not in cache:
+            cache[index] = grams(index)
+        return cache[index]
+
+    pairs = []
+    for left, right in sorted(candidates):
+        similarity = jaccard(cached(left), cached(right))
+        if similarity >= threshold:
+            pairs.append((left, right, similarity))
+    return pairs
+
+
+def tutorial_target(tutorial_path: str, quiz_dir: Path, tutorial_dir: Path) -> Path | None:
+    """The file a section links to, or ``None`` if it is not a page under ``tutorial_dir``."""
+    target = (quiz_dir / tutorial_path.split("#", 1)[0]).resolve()
+    if not target.is_relative_to(tutorial_dir.resolve()) or not target.is_file():
+        return None
+    return target
+
+
+def validate_structure(
+    sections: List[Dict[str, object]], quiz_dir: Path = QUIZ_DIR, tutorial_dir: Path = TUTORIAL_DIR
+) -> List[Issue]:
+    issues: List[Issue] = []
+    seen_ids: Set[object] = set()
+    seen_prompts: Dict[str, str] = {}
+    for section in sections:
+        section_id = section.get("id")
+        if not isinstance(section_id, str) or not section_id:
+            issues.append(Issue("error", repr(section_id), "section id must be a non-empty string"))
+        elif section_id in seen_ids:
+            issues.append(Issue("error", section_id, "duplicate section id"))
+        seen_ids.add(section_id)
+        tutorial_path = section.get("tutorialPath")
+        if not isinstance(tutorial_path, str) or tutorial_target(tutorial_path, quiz_dir, tutorial_dir) is None:
+            issues.append(Issue("error", str(section_id), f"tutorialPath {tutorial_path!r} is not a file under {tutorial_dir}"))
+
+        for number, question in enumerate(section.get("questions", [])):
+            where = f"{section_id}#{number}"
+            prompt = question.get("prompt")
+            options = question.get("options")
+            answer_index = question.get("answerIndex")
+            if not isinstance(prompt, str) or not prompt.strip():
+                issues.append(Issue("error", where, "prompt must be a non-empty string"))
+            else:
+                key = canonical(prompt)
+                if key in seen_prompts:
+                    issues.append(Issue("error", where, f"same prompt as {seen_prompts[key]}"))
+                seen_prompts.setdefault(key, where)
+            if not isinstance(options, list) or not all(isinstance(option, str) and option.strip() for option in options):
+                issues.append(Issue("error", where, "options must be a list of non-empty strings"))
+                continue
+            if len(options) != OPTION_COUNT:
+                issues.append(Issue("error", where, f"expected {OPTION_COUNT} options, found {len(options)}"))
+            if len({canonical(option) for option in options}) != len(options):
+                issues.append(Issue("error", where, "options are not unique"))
+            if isinstance(answer_index, bool) or not isinstance(answer_index, int) or not 0 <= answer_index < len(options):
+                issues.append(Issue("error", where, f"answerIndex {answer_index!r} is out of range"))
+            difficulty = question.get("difficulty", 0.0)
+            if isinstance(difficulty, bool) or not isinstance(difficulty, (int, float)) or not -6 <= difficulty <= 6:
+                issues.append(Issue("error", where, f"difficulty {difficulty!r} must be a number of logits in [-6, 6]"))
+    return issues
+
+
+def validate_near_duplicates(sections: List[Dict[str, object]], threshold: float = DEFAULT_THRESHOLD) -> List[Issue]:
+    issues: List[Issue] = []
+    locations: List[str] = []
+    prompts: List[str] = []
+    option_texts: List[str] = []
+    for section in sections:
+        for number, question in enumerate(section.get("questions", [])):
+            options = [str(option) for option in question.get("options", [])]
+            locations.append(f"{section.get('id')}#{number}")
+            prompts.append(str(question.get("prompt", "")))
+            # Option order is shuffled in the quiz, so compare the option set.
+            option_texts.append(" | ".join(sorted(options)))
+
+    if len(prompts) < 2:
+        return issues
+    prompt_index = GramIndex.build(prompts)
+    option_index = GramIndex.build(option_texts)
+    reported: Set[Tuple[int, int]] = set()
+    for left, right, similarity in confirm_pairs(lsh_candidates(prompt_index.signatures), prompt_index.grams, threshold):
+        reported.add((left, right))
+        if similarity < 1.0:  # Exact duplicates are reported by validate_structure.
+            issues.append(Issue("warning", locations[right], f"prompt is {similarity:.0%} similar to {locations[left]}"))
+
+    # The MinHash of a union is the element-wise minimum, so whole questions
+    # (prompt plus options) are compared without hashing anything again.
+    question_signatures = np.minimum(prompt_index.signatures, option_index.signatures)
+    question_grams = lambda index: prompt_index.grams(index) | option_index.grams(index)  # noqa: E731
+    for left, right, similarity in confirm_pairs(lsh_candidates(question_signatures), question_grams, threshold):
+        if (left, right) not in reported:
+            issues.append(
+                Issue("warning", locations[right], f"prompt and options are {similarity:.0%} similar to {locations[left]}")
+            )
+    return issues
+
+
+def validate_bank(
+    sections: List[Dict[str, object]],
+    threshold: float = DEFAULT_THRESHOLD,
+    quiz_dir: Path = QUIZ_DIR,
+    tutorial_dir: Path = TUTORIAL_DIR,
+) -> List[Issue]:
+    issues = validate_structure(sections, quiz_dir, tutorial_dir)
+    if np is not None:
+        issues += validate_near_duplicates(sections, threshold)
+    return issues
+
+
+def report(issues: List[Issue], strict: bool = False) -> bool:
+    """Print the issues to stderr; return whether the bank is acceptable."""
+    for issue in issues:
+        print(issue, file=sys.stderr)
+    if np is None:
+        print("NumPy is not installed; skipped near-duplicate detection.", file=sys.stderr)
+    return not any(issue.level == "error" or strict for issue in issues)
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Jaccard similarity reported as a near-duplicate (default: {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument("--strict", action="store_true", help="Fail on warnings as well as errors.")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    from build_question_bank import load_bank
+
+    started = time.perf_counter()
+    sections = load_bank()
+    issues = validate_bank(sections, args.threshold)
+    elapsed = time.perf_counter() - started
+    questions = sum(len(section["questions"]) for section in sections)
+    ok = report(issues, args.strict)
+    print(f"Checked {questions} questions in {len(sections)} sections in {elapsed:.2f}s: {len(issues)} issues")
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Build the quiz page's content-hashed CSS/JS assets and point the shell at them."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SOURCE_DIR = Path("quiz_src")
+QUIZ_DIR = Path("docs/quiz")
+ASSET_DIR_NAME = "assets"
+HASH_LENGTH = 10
+
+# Published bundle name -> source files concatenated into it, in order.
+BUNDLES: Dict[str, List[str]] = {
+    "quiz.css": ["quiz.css"],
+    "quiz.js": ["bank.js", "bank-cache.js", "responses.js", "adaptive.js", "quiz.js", "analytics.js"],
+}
+
+STRING_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')")
+CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+CSS_SPACE_RE = re.compile(r"\s+")
+CSS_PUNCTUATION_RE = re.compile(r"\s*([{};,>])\s*")
+# Only the space after a colon is safe to drop: "a :hover" differs from "a:hover".
+CSS_COLON_RE = re.compile(r":\s+")
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--source",
+        type=Path,
+        default=SOURCE_DIR,
+        help=f"Directory with the readable quiz sources (default: {SOURCE_DIR}).",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=QUIZ_DIR,
+        help=f"Published quiz directory holding index.html (default: {QUIZ_DIR}).",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only report whether the published assets are up to date; exit 1 if not.",
+    )
+    return parser.parse_args(argv)
+
+
+def minify_css(css: str) -> str:
+    parts = STRING_RE.split(CSS_COMMENT_RE.sub("", css))
+    minified: List[str] = []
+    for index, part in enumerate(parts):
+        if index % 2:
+            # Quoted string: keep verbatim.
+            minified.append(part)
+            continue
+        part = CSS_SPACE_RE.sub(" ", part)
+        part = CSS_PUNCTUATION_RE.sub(r"\1", part)
+        minified.append(CSS_COLON_RE.sub(":", part))
+    return "".join(minified).replace(";}", "}").strip() + "\n"
+
+
+def minify_js(js: str) -> str:
+    """Drop indentation, blank lines and whole-line comments.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as
+    in the source, and lines inside multi-line template literals are left
+    untouched. gzip on the wire takes care of the rest.
+    """
+    lines: List[str] = []
+    in_template = False
+    for line in js.splitlines():
+        if in_template:
+            lines.append(line)
+        else:
+            stripped = line.strip()
+            if stripped and not stripped.startswith("//"):
+                lines.append(stripped)
+        if len(re.findall(r"(?<!\\)`", line)) % 2:
+            in_template = not in_template
+    return "\n".join(lines) + "\n"
+
+
+def build_bundle(source: Path, name: str) -> bytes:
+    text = "\n".join(
+        (source / part).read_text(encoding="utf-8") for part in BUNDLES[name]
+    )
+    minified = minify_css(text) if name.endswith(".css") else minify_js(text)
+    return minified.encode("utf-8")
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    stem, suffix = name.rsplit(".", 1)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return f"{stem}.{digest}.{suffix}"
+
+
+def rewrite_shell(html: str, references: Dict[str, str]) -> str:
+    """Point every ``data-asset="<bundle>"`` tag's href/src at its hashed file."""
+
+    def replace_tag(match: re.Match) -> str:
+        tag = match.group(0)
+        name = match.group(1)
+        if name not in references:
+            raise SystemExit(f"index.html references unknown asset bundle {name!r}")
+        return re.sub(r'\b(href|src)="[^"]*"', rf'\1="{references[name]}"', tag, count=1)
+
+    rewritten, count = re.subn(r'<(?:link|script)\b[^>]*\bdata-asset="([^"]+)"[^>]*>', replace_tag, html)
+    if count == 0:
+        raise SystemExit('index.html has no data-asset tags to rewrite')
+    return rewritten
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    asset_dir = args.output / ASSET_DIR_NAME
+    shell_path = args.output / "index.html"
+
+    files: Dict[str, bytes] = {}
+    references: Dict[str, str] = {}
+    for name in BUNDLES:
+        data = build_bundle(args.source, name)
+        filename = hashed_name(name, data)
+        files[filename] = data
+        references[name] = f"{ASSET_DIR_NAME}/{filename}"
+
+    shell = shell_path.read_text(encoding="utf-8")
+    rewritten = rewrite_shell(shell, references)
+    existing = {path.name for path in asset_dir.glob("*")} if asset_dir.exists() else set()
+    stale = sorted(existing - set(files))
+
+    if args.check:
+        missing = sorted(set(files) - existing)
+        problems = [f"missing {asset_dir / name}" for name in missing]
+        problems += [f"stale {asset_dir / name}" for name in stale]
+        if rewritten != shell:
+            problems.append(f"{shell_path} does not reference the current assets")
+        for problem in problems:
+            print(problem, file=sys.stderr)
+        if problems:
+            raise SystemExit(1)
+        print("Quiz assets are up to date.")
+        return
+
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    for filename, data in files.items():
+        target = asset_dir / filename
+        if not target.exists():
+            target.write_bytes(data)
+            print(f"Wrote {target}")
+    for filename in stale:
+        (asset_dir / filename).unlink()
+        print(f"Removed {asset_dir / filename}")
+    if rewritten != shell:
+        shell_path.write_text(rewritten, encoding="utf-8")
+        print(f"Wrote {shell_path}")
+
+
+if __name__ == "__main__":
+    main()
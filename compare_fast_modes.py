@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""Check that fast conversion modes produce the same DOM as the reference pipeline."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+import zipfile
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from convert_epub import ConversionOptions, Converter, Output, load_plugin
+from deploy_manifest import MANIFEST_NAME
+from output_sinks import MemorySink
+
+WHITESPACE_RE = re.compile(r"\s+")
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+PRESERVE_TAGS = {"pre", "textarea"}
+
+# A 1x1 transparent PNG for synthetic chapters.
+TINY_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+    "1f15c4890000000d49444154789c6360000002000001e221bc330000000049454e44ae426082"
+)
+
+
+@dataclass
+class Node:
+    tag: str
+    attrs: Tuple[Tuple[str, str], ...] = ()
+    children: List["Node | str"] = field(default_factory=list)
+
+    def describe(self) -> str:
+        attrs = "".join(f' {name}="{value}"' for name, value in self.attrs)
+        return f"<{self.tag}{attrs}>"
+
+
+class DomBuilder(HTMLParser):
+    """Build a whitespace-normalized tree; formatting-only differences vanish."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document")
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str | None]]) -> None:
+        node = Node(tag, tuple(sorted((name, value or "") for name, value in attrs)))
+        self.stack[-1].children.append(node)
+        if tag not in VOID_TAGS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, str | None]]) -> None:
+        self.stack[-1].children.append(Node(tag, tuple(sorted((name, value or "") for name, value in attrs))))
+
+    def handle_endtag(self, tag: str) -> None:
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data: str) -> None:
+        children = self.stack[-1].children
+        if children and isinstance(children[-1], str):
+            children[-1] += data
+        else:
+            children.append(data)
+
+    def finish(self) -> Node:
+        self.close()
+        normalize(self.root, preserve=False)
+        return self.root
+
+
+def normalize(node: Node, preserve: bool) -> None:
+    preserve = preserve or node.tag in PRESERVE_TAGS
+    children: List[Node | str] = []
+    for child in node.children:
+        if isinstance(child, str):
+            text = child if preserve else WHITESPACE_RE.sub(" ", child).strip()
+            if text:
+                children.append(text)
+        else:
+            normalize(child, preserve)
+            children.append(child)
+    node.children = children
+
+
+def parse_dom(html_text: str) -> Node:
+    builder = DomBuilder()
+    builder.feed(html_text)
+    return builder.finish()
+
+
+def first_difference(reference: Node, candidate: Node, path: str = "") -> str | None:
+    """Return a readable description of the first node where the trees differ."""
+    here = f"{path}/{reference.tag}" if path else reference.tag
+    if reference.tag != candidate.tag or reference.attrs != candidate.attrs:
+        return f"{here}: expected {reference.describe()}, got {candidate.describe()}"
+    for index, (ref_child, cand_child) in enumerate(zip(reference.children, candidate.children)):
+        location = f"{here}[{index}]"
+        if isinstance(ref_child, str) or isinstance(cand_child, str):
+            if ref_child != cand_child:
+                return f"{location}: expected {summarize(ref_child)}, got {summarize(cand_child)}"
+            continue
+        found = first_difference(ref_child, cand_child, location)
+        if found:
+            return found
+    if len(reference.children) != len(candidate.children):
+        shorter = min(len(reference.children), len(candidate.children))
+        ref_extra = reference.children[shorter] if shorter < len(reference.children) else None
+        cand_extra = candidate.children[shorter] if shorter < len(candidate.children) else None
+        return f"{here}[{shorter}]: expected {summarize(ref_extra)}, got {summarize(cand_extra)}"
+    return None
+
+
+def summarize(value: "Node | str | None") -> str:
+    if value is None:
+        return "nothing"
+    if isinstance(value, Node):
+        return value.describe()
+    text = value if len(value) <= 60 else value[:57] + "..."
+    return repr(text)
+
+
+def skip_format(converter: Converter) -> None:
+    """Publish the raw rendered markup instead of BeautifulSoup-prettified HTML."""
+    converter.replace_stage("format", lambda state, output: Output(output.path, output.data))
+
+
+BUILTIN_MODES: Dict[str, Callable[[Converter], None]] = {
+    "skip-format": skip_format,
+}
+
+# Converter options each fast mode is checked under, so reader fragments, lite
+# pages, pruned stylesheets and inlined images are compared too.
+OUTPUT_MODES: Dict[str, ConversionOptions] = {
+    "default": ConversionOptions(),
+    "reader": ConversionOptions(reader_mode=True),
+    "lite": ConversionOptions(lite=True),
+    "prune-css": ConversionOptions(prune_stylesheets=True),
+    "inline-images": ConversionOptions(inline_threshold=8192),
+}
+
+
+@dataclass
+class RunResult:
+    files: Dict[str, bytes]
+    seconds: float
+
+
+@dataclass
+class ModeReport:
+    mode: str
+    options: str
+    source: str
+    speedup: float
+    differences: Dict[str, str]
+
+
+def run_converter(
+    epub_path: Path,
+    plugins: Sequence[Callable[[Converter], None]],
+    repeat: int,
+    options: ConversionOptions | None = None,
+) -> RunResult:
+    best = float("inf")
+    files: Dict[str, bytes] = {}
+    for _ in range(max(1, repeat)):
+        converter = Converter(options or ConversionOptions())
+        for plugin in plugins:
+            converter.use(plugin)
+        sink = MemorySink()
+        started = time.perf_counter()
+        with sink:
+            converter.run(epub_path, sink)
+        best = min(best, time.perf_counter() - started)
+        files = sink.files
+    return RunResult(files, best)
+
+
+def compare_outputs(reference: Dict[str, bytes], candidate: Dict[str, bytes]) -> Dict[str, str]:
+    differences: Dict[str, str] = {}
+    for path in sorted(set(reference) | set(candidate)):
+        if path not in candidate:
+            differences[path] = "missing from fast mode output"
+            continue
+        if path not in reference:
+            differences[path] = "only produced by fast mode"
+            continue
+        ref_data, cand_data = reference[path], candidate[path]
+        if ref_data == cand_data:
+            continue
+        if path == MANIFEST_NAME:
+            # The deploy manifest hashes the bytes, so it differs whenever formatting does.
+            continue
+        if not path.endswith(".html"):
+            differences[path] = "bytes differ"
+            continue
+        found = first_difference(
+            parse_dom(ref_data.decode("utf-8")), parse_dom(cand_data.decode("utf-8"))
+        )
+        if found:
+            differences[path] = found
+    return differences
+
+
+def write_synthetic_epub(target: Path, seed: int, chapters: int = 12) -> None:
+    """Write a small EPUB exercising lists, tables, code, images and cross links."""
+    rng = random.Random(seed)
+    words = (
+        "django python model view template url form queryset admin server deploy browser "
+        "request response database migration shell editor blog post comment"
+    ).split()
+
+    def sentence() -> str:
+        return " ".join(rng.choice(words) for _ in range(rng.randint(4, 14))).capitalize() + "."
+
+    names = [f"chapter{number}.xhtml" for number in range(chapters)]
+    manifest_items = ['<item id="img" href="images/dot.png" media-type="image/png"/>']
+    spine_items = []
+    files: Dict[str, str | bytes] = {"images/dot.png": TINY_PNG}
+    for number, name in enumerate(names):
+        blocks = [f'<h1 id="top">Chapter {number}: {rng.choice(words).title()}</h1>']
+        for section in range(rng.randint(2, 5)):
+            blocks.append(f'<h2 id="s{section}">{sentence()}</h2>')
+            for _ in range(rng.randint(1, 4)):
+                kind = rng.choice(("p", "p", "list", "pre", "table", "img", "link"))
+                if kind == "p":
+                    blocks.append(f"<p>{sentence()} <em>{rng.choice(words)}</em> <code>{rng.choice(words)}()</code> {sentence()}</p>")
+                elif kind == "list":
+                    items = "".join(f"<li>{sentence()}</li>" for _ in range(rng.randint(2, 5)))
+                    list_tag = rng.choice(("ul", "ol"))
+                    blocks.append(f'<{list_tag} class="calibre2">{items}</{list_tag}>')
+                elif kind == "pre":
+                    lines = "\n".join("    " * rng.randint(0, 2) + f"{rng.choice(words)} = {rng.randint(0, 99)}" for _ in range(4))
+                    blocks.append(f'<pre><code class="lang-python">{lines}</code></pre>')
+                elif kind == "table":
+                    rows = "".join(f"<tr><td>{rng.choice(words)}</td><td>{rng.randint(0, 9)}</td></tr>" for _ in range(3))
+                    blocks.append(f"<table><tbody>{rows}</tbody></table>")
+                elif kind == "img":
+                    blocks.append('<p><img src="images/dot.png" alt="Figure" class="calibre8"/></p>')
+                else:
+                    other = rng.choice(names)
+                    blocks.append(f'<p>See <a href="{other}#s0">{sentence()}</a> and <a href="https://example.org/">the web</a>.</p>')
+        files[name] = (
+            "<?xml version='1.0' encoding='utf-8'?>\n"
+            '<html xmlns="http://www.w3.org/1999/xhtml" lang="en"><head>'
+            f"<title>Chapter {number}</title>"
+            '<link rel="stylesheet" type="text/css" href="stylesheet.css"/></head>'
+            f"<body><div class=\"page\">{''.join(blocks)}</div></body></html>"
+        )
+        manifest_items.append(f'<item id="c{number}" href="{name}" media-type="application/xhtml+xml"/>')
+        spine_items.append(f'<itemref idref="c{number}"/>')
+    files["stylesheet.css"] = ".calibre2 { margin: 1em 0; }\n.calibre8 { width: auto; }\n"
+    manifest_items.append('<item id="css" href="stylesheet.css" media-type="text/css"/>')
+    files["content.opf"] = (
+        "<?xml version='1.0' encoding='utf-8'?>\n"
+        '<package xmlns="http://www.idpf.org/2007/opf" version="2.0">'
+        f"<manifest>{''.join(manifest_items)}</manifest>"
+        f"<spine>{''.join(spine_items)}</spine></package>"
+    )
+    files["META-INF/container.xml"] = (
+        '<?xml version="1.0"?>\n'
+        '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">'
+        '<rootfiles><rootfile full-path="content.opf" media-type="application/oebps-package+xml"/>'
+        "</rootfiles></container>"
+    )
+    with zipfile.ZipFile(target, "w") as archive:
+        archive.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        for name, data in files.items():
+            archive.writestr(name, data, compress_type=zipfile.ZIP_DEFLATED)
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Convert EPUBs with the reference pipeline and with fast modes, then diff the DOM."
+    )
+    parser.add_argument(
+        "epubs",
+        type=Path,
+        nargs="*",
+        help="EPUB files to check (default: django-girls-tutorial_en.epub if present).",
+    )
+    parser.add_argument(
+        "--mode",
+        action="append",
+        default=[],
+        metavar="NAME|MODULE[:ATTR]",
+        help=f"Fast mode to check; built-in: {', '.join(BUILTIN_MODES)} (default: all built-in modes).",
+    )
+    parser.add_argument(
+        "--options",
+        action="append",
+        default=[],
+        choices=list(OUTPUT_MODES),
+        help="Converter output mode to compare under (repeatable; default: all of them).",
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Also check N generated EPUBs (default: 3).",
+    )
+    parser.add_argument("--seed", type=int, default=2024, help="Seed for the synthetic EPUBs.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing per run (default: 3).")
+    return parser.parse_args(argv)
+
+
+def resolve_mode(spec: str) -> Callable[[Converter], None]:
+    return BUILTIN_MODES.get(spec) or load_plugin(spec)
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = parse_args(argv)
+    modes = {spec: resolve_mode(spec) for spec in (args.mode or list(BUILTIN_MODES))}
+    output_modes = {name: OUTPUT_MODES[name] for name in (args.options or list(OUTPUT_MODES))}
+    epubs = list(args.epubs)
+    default_epub = Path("django-girls-tutorial_en.epub")
+    if not epubs and default_epub.exists():
+        epubs.append(default_epub)
+
+    reports: List[ModeReport] = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for number in range(args.synthetic):
+            target = Path(workdir, f"synthetic-{number}.epub")
+            write_synthetic_epub(target, seed=args.seed + number)
+            epubs.append(target)
+        if not epubs:
+            raise SystemExit("Nothing to compare: pass an EPUB or use --synthetic N.")
+
+        for epub_path in epubs:
+            for options_name, options in output_modes.items():
+                reference = run_converter(epub_path, [], args.repeat, options)
+                for name, plugin in modes.items():
+                    candidate = run_converter(epub_path, [plugin], args.repeat, options)
+                    reports.append(
+                        ModeReport(
+                            mode=name,
+                            options=options_name,
+                            source=epub_path.name,
+                            speedup=reference.seconds / candidate.seconds if candidate.seconds else float("inf"),
+                            differences=compare_outputs(reference.files, candidate.files),
+                        )
+                    )
+
+    failed = False
+    for report in reports:
+        status = "OK" if not report.differences else f"{len(report.differences)} differing files"
+        print(f"{report.mode:<16} {report.options:<14} {report.source:<36} {report.speedup:5.2f}x  {status}")
+        for path, difference in report.differences.items():
+            failed = True
+            print(f"    {path}: {difference}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,17 +4,35 @@
 from __future__ import annotations
 
 import argparse
+import base64
+import copy
+import html
+import importlib
+import json
+import mimetypes
 import posixpath
 import re
-import shutil
+import sys
 import textwrap
+import time
 import zipfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Set, Tuple
 import xml.etree.ElementTree as ET
 from bs4 import BeautifulSoup, Doctype
 
+from css_prune import DEFAULT_SAFELIST, UsedSelectors, collect_usage, prune_css
+from deploy_manifest import MANIFEST_NAME, dump_manifest
+from output_sinks import (
+    ArchiveSink,
+    DirectorySink,
+    OutputSink,
+    WriteBehindSink,
+    archive_format,
+    normalize_output_path,
+)
+
 NS = {
     "container": "urn:oasis:names:tc:opendocument:xmlns:container",
     "opf": "http://www.idpf.org/2007/opf",
@@ -39,7 +57,35 @@ RELATIVE_PREFIX_BLOCKLIST = (
 SRC_TAGS = {"img", "script", "iframe", "audio", "video", "embed"}
 SRCSET_TAGS = {"img", "source"}
 HREF_TAGS = {"link"}
+ANCHOR_TAGS = {"a", "area"}
 DATA_TAGS = {"object"}
+HEADING_TAGS = {"h2", "h3", "h4", "h5", "h6"}
+
+READER_FRAGMENTS_DIR = "fragments"
+READER_SHELL_NAME = "reader.html"
+# JSON script block listing the chapters nav.js links between.
+READER_CHAPTERS_ID = "tutorial-chapters"
+# Scripts the reader-mode pages load. They are maintained by hand next to the
+# published pages and copied into every conversion, so pages written elsewhere
+# work and --force does not prune them from docs/tutorial.
+READER_SCRIPTS_DIR = Path(__file__).resolve().parent / "docs" / "tutorial"
+READER_SCRIPTS = ("nav.js", "rum.js")
+
+LITE_DIR = "lite"
+LITE_DROP_TAGS = {"script", "noscript", "style", "link"}
+LITE_EMBED_TAGS = {"iframe", "video", "audio", "embed", "object"}
+LITE_STRIP_ATTRS = ("class", "style", "width", "height")
+PRE_BLOCK_RE = re.compile(r"(<pre\b.*?</pre>)", re.DOTALL | re.IGNORECASE)
+WHITESPACE_RUN_RE = re.compile(r"\s+")
+LITE_CSS = (
+    "body{margin:0 auto;max-width:42em;padding:0 1em;font:1rem/1.6 system-ui,sans-serif;color:#222}"
+    "nav{display:flex;flex-wrap:wrap;gap:.5em 1em;margin:1em 0}"
+    "pre{overflow-x:auto;background:#f2f2f2;padding:.6em;font-size:.9em}"
+    "code{font-family:ui-monospace,monospace}"
+    "blockquote{margin:1em 0;padding-left:1em;border-left:3px solid #ccc}"
+    "a.lite-image{display:block;margin:.5em 0;padding:.6em;border:1px dashed #999;text-decoration:none}"
+    "table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:.3em}"
+)
 
 
 @dataclass
@@ -49,6 +95,54 @@ class PageData:
     head_html: str
     body_html: str
     output_name: str
+    lite_body_html: str = ""
+
+
+@dataclass
+class ImageInliner:
+    """Decide which images become data URIs, using a per-build size index.
+
+    Sizes come from the EPUB's central directory, so deciding never reads a
+    file; encoded data URIs are cached so repeated references are free.
+    """
+
+    zip_file: zipfile.ZipFile
+    threshold: int
+    sizes: Dict[str, int] = field(default_factory=dict)
+    data_uris: Dict[str, str] = field(default_factory=dict)
+    inlined: Set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        if not self.sizes:
+            self.sizes = {info.filename: info.file_size for info in self.zip_file.infolist()}
+
+    def inline(self, value: str, parent_dir: str) -> str | None:
+        resolved = resolve_resource_path(value, parent_dir)
+        if not resolved:
+            return None
+        member = resolved[len("content/"):]
+        size = self.sizes.get(member)
+        if size is None or size >= self.threshold:
+            return None
+        mime_type = mimetypes.guess_type(member)[0]
+        if not mime_type or not mime_type.startswith("image/"):
+            return None
+        data_uri = self.data_uris.get(member)
+        if data_uri is None:
+            encoded = base64.b64encode(self.zip_file.read(member)).decode("ascii")
+            data_uri = f"data:{mime_type};base64,{encoded}"
+            self.data_uris[member] = data_uri
+        self.inlined.add(member)
+        return data_uri
+
+    def unpublished(self, stylesheets: Dict[str, str], referenced: Set[str]) -> Set[str]:
+        """Inlined members that nothing else (pages or stylesheets) still links to."""
+        candidates = self.inlined - referenced
+        return {
+            member
+            for member in candidates
+            if not any(posixpath.basename(member) in css for css in stylesheets.values())
+        }
 
 
 def parse_args() -> argparse.Namespace:
@@ -70,9 +164,88 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Delete the output directory before converting.",
+        help=(
+            "Convert into an existing output directory: changed files are replaced, "
+            "unchanged ones left alone and files this run did not write are removed."
+        ),
+    )
+    parser.add_argument(
+        "--archive",
+        default=None,
+        help=(
+            "Stream the output into a .zip/.tar/.tar.gz archive instead of output_dir "
+            "(use '-' with --archive-format to write to stdout)."
+        ),
+    )
+    parser.add_argument(
+        "--archive-format",
+        choices=[".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tar.xz"],
+        default=None,
+        help="Archive format when it cannot be inferred from the --archive name.",
+    )
+    parser.add_argument(
+        "--plugin",
+        action="append",
+        default=[],
+        metavar="MODULE[:ATTR]",
+        help="Load a converter plugin (callable taking the Converter; default attribute: register).",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-stage timings and counters to stderr.",
+    )
+    parser.add_argument(
+        "--writers",
+        type=int,
+        default=4,
+        help="Writer threads that flush output behind the renderer (default: 4; 0 writes inline).",
+    )
+    parser.add_argument(
+        "--inline-images-below",
+        type=int,
+        default=0,
+        metavar="BYTES",
+        help="Embed images smaller than BYTES as base64 data URIs (default: 0, disabled).",
+    )
+    parser.add_argument(
+        "--reader-mode",
+        action="store_true",
+        help=(
+            f"Also emit every chapter body as a fragment under {READER_FRAGMENTS_DIR}/ plus a "
+            f"{READER_SHELL_NAME} shell so nav.js can swap chapters without full reloads."
+        ),
+    )
+    parser.add_argument(
+        "--lite",
+        action="store_true",
+        help=(
+            f"Also emit a low-bandwidth edition under {LITE_DIR}/: no scripts, screenshots behind "
+            "tap-to-open links and a small inline stylesheet."
+        ),
+    )
+    parser.add_argument(
+        "--prune-css",
+        action="store_true",
+        help="Remove rules from the EPUB stylesheets that match nothing in the generated pages.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--css-safelist",
+        action="append",
+        default=[],
+        metavar="CLASS[,CLASS...]",
+        help=(
+            "Extra classes to keep when pruning CSS (added at runtime by scripts). "
+            f"Always kept: {', '.join(sorted(DEFAULT_SAFELIST))}."
+        ),
+    )
+    args = parser.parse_args()
+    if args.archive and not args.archive_format:
+        try:
+            archive_format(args.archive)
+        except ValueError as error:
+            parser.error(f"{error} Or pass --archive-format.")
+    return args
 
 
 def slugify(value: str) -> str:
@@ -167,36 +340,99 @@ def rewrite_srcset(value: str, parent_dir: str) -> str:
     return ", ".join(rewritten)
 
 
-def adjust_resource_paths(head: ET.Element | None, body: ET.Element | None, parent_dir: str) -> None:
+def note_reference(referenced: Set[str] | None, resolved: str) -> None:
+    if referenced is not None and resolved.startswith("content/"):
+        referenced.add(resolved[len("content/"):].split("#", 1)[0])
+
+
+def rewrite_anchor(value: str, parent_dir: str, link_index: Dict[str, str]) -> str | None:
+    """Point links at generated pages when they target a spine document."""
+    path, hash_sign, fragment = value.partition("#")
+    if not should_rewrite_path(path):
+        return None
+    member = posixpath.normpath(posixpath.join(parent_dir, path))
+    output_name = link_index.get(member)
+    if output_name is None:
+        return resolve_resource_path(value, parent_dir)
+    return f"{output_name}{hash_sign}{fragment}"
+
+
+def adjust_resource_paths(
+    head: ET.Element | None,
+    body: ET.Element | None,
+    parent_dir: str,
+    inliner: ImageInliner | None = None,
+    link_index: Dict[str, str] | None = None,
+    referenced: Set[str] | None = None,
+) -> None:
+    def rewrite(value: str) -> str | None:
+        new_value = resolve_resource_path(value, parent_dir)
+        if new_value:
+            note_reference(referenced, new_value)
+        return new_value
+
     for section in filter(None, (head, body)):
         for node in section.iter():
             tag_name = local_tag(node.tag)
             if tag_name in HREF_TAGS and "href" in node.attrib:
-                new_value = resolve_resource_path(node.attrib["href"], parent_dir)
+                new_value = rewrite(node.attrib["href"])
                 if new_value:
                     node.set("href", new_value)
+            if tag_name in ANCHOR_TAGS and "href" in node.attrib and link_index is not None:
+                new_value = rewrite_anchor(node.attrib["href"], parent_dir, link_index)
+                if new_value:
+                    note_reference(referenced, new_value)
+                    node.set("href", new_value)
             if tag_name in SRC_TAGS and "src" in node.attrib:
-                new_value = resolve_resource_path(node.attrib["src"], parent_dir)
+                data_uri = inliner.inline(node.attrib["src"], parent_dir) if inliner and tag_name == "img" else None
+                new_value = data_uri or rewrite(node.attrib["src"])
                 if new_value:
                     node.set("src", new_value)
             if tag_name in SRCSET_TAGS and "srcset" in node.attrib:
-                node.set("srcset", rewrite_srcset(node.attrib["srcset"], parent_dir))
+                srcset = rewrite_srcset(node.attrib["srcset"], parent_dir)
+                for entry in srcset.split(","):
+                    if entry.strip():
+                        note_reference(referenced, entry.split()[0])
+                node.set("srcset", srcset)
             if tag_name in DATA_TAGS and "data" in node.attrib:
-                new_value = resolve_resource_path(node.attrib["data"], parent_dir)
+                new_value = rewrite(node.attrib["data"])
                 if new_value:
                     node.set("data", new_value)
 
 
-def build_head_chunks(head: ET.Element) -> Tuple[str, str, str]:
+def assign_heading_ids(body: ET.Element) -> int:
+    """Give h2-h6 headings without an id one made from their text, so quiz questions can link to them."""
+    used = {node.get("id") for node in body.iter() if node.get("id")}
+    added = 0
+    for node in body.iter():
+        if local_tag(node.tag) not in HEADING_TAGS or node.get("id"):
+            continue
+        base = slugify("".join(node.itertext()))
+        anchor, suffix = base, 2
+        while anchor in used:
+            anchor, suffix = f"{base}-{suffix}", suffix + 1
+        node.set("id", anchor)
+        used.add(anchor)
+        added += 1
+    return added
+
+
+def head_title(head: ET.Element) -> str:
     title_text = "Untitled"
+    for child in head:
+        if local_tag(child.tag) == "title" and child.text:
+            title_text = child.text.strip()
+    return title_text
+
+
+def build_head_chunks(head: ET.Element) -> Tuple[str, str, str]:
+    title_text = head_title(head)
     additional_parts: List[str] = []
     metas: List[str] = []
 
     for child in head:
         tag_name = local_tag(child.tag)
         if tag_name == "title":
-            if child.text:
-                title_text = child.text.strip()
             continue
         if tag_name == "base":
             continue
@@ -218,18 +454,64 @@ def extract_body_inner(body: ET.Element) -> str:
     return "".join(parts)
 
 
-def ensure_destination(output_dir: Path, force: bool) -> None:
-    if output_dir.exists():
-        if not force:
-            raise SystemExit(
-                f"Output directory {output_dir} already exists. Use --force to overwrite."
-            )
-        shutil.rmtree(output_dir)
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-
-def write_css(output_dir: Path) -> None:
-    css = textwrap.dedent(
+def compact_html(text: str) -> str:
+    """Collapse whitespace runs everywhere except inside <pre> blocks."""
+    parts = PRE_BLOCK_RE.split(text)
+    for index in range(0, len(parts), 2):
+        parts[index] = WHITESPACE_RUN_RE.sub(" ", parts[index])
+    return "".join(parts).strip()
+
+
+def format_size(size: int) -> str:
+    return f"{max(1, round(size / 1024))} KB"
+
+
+def build_lite_body(body: ET.Element, sizes: Dict[str, int]) -> str:
+    """Serialize a copy of the rewritten body for the lite edition.
+
+    Images and embeds become plain links so nothing heavy loads until tapped,
+    presentational attributes are dropped and paths are made relative to
+    ``lite/``.
+    """
+    lite = copy.deepcopy(body)
+    anchor_tag = f"{{{NS['xhtml']}}}a"
+    for parent in list(lite.iter()):
+        for position, child in enumerate(list(parent)):
+            tag_name = local_tag(child.tag)
+            if tag_name in LITE_DROP_TAGS:
+                parent.remove(child)
+                continue
+            if tag_name != "img" and tag_name not in LITE_EMBED_TAGS:
+                continue
+            source = child.get("src") or child.get("data") or ""
+            if tag_name == "img" and source.startswith("data:"):
+                # Already inlined below the --inline-images-below threshold.
+                continue
+            label = child.get("alt") or child.get("title") or posixpath.basename(source) or tag_name
+            if source.startswith("content/"):
+                size = sizes.get(source[len("content/"):])
+                if size is not None:
+                    label = f"{label} ({format_size(size)})"
+                source = f"../{source}"
+            kind = "Screenshot" if tag_name == "img" else "Media"
+            placeholder = ET.Element(anchor_tag, {"href": source, "class": "lite-image"})
+            placeholder.text = f"{kind}: {label} – tap to open"
+            placeholder.tail = child.tail
+            parent.remove(child)
+            parent.insert(position, placeholder)
+    for node in lite.iter():
+        for attr in LITE_STRIP_ATTRS:
+            if attr in node.attrib and not (attr == "class" and node.get(attr) == "lite-image"):
+                del node.attrib[attr]
+        for attr in ("href", "src"):
+            value = node.get(attr)
+            if value and value.startswith("content/"):
+                node.set(attr, f"../{value}")
+    return compact_html(extract_body_inner(lite))
+
+
+def render_css() -> str:
+    return textwrap.dedent(
         """
         :root {
             color-scheme: light;
@@ -398,7 +680,6 @@ nav.book-nav a:focus-visible {
         }
         """
     ).strip()
-    (output_dir / "book.css").write_text(css, encoding="utf-8")
 
 
 def build_navigation(
@@ -436,6 +717,9 @@ def render_page(
     body_html: str,
     prev_link: str | None,
     next_link: str | None,
+    chapter_slug: str | None = None,
+    lite_link: str | None = None,
+    chapter_list: str = "",
 ) -> str:
     navigation_top = textwrap.indent(
         build_navigation(prev_link, next_link, include_home=True, position="top"), "    "
@@ -445,6 +729,21 @@ def render_page(
     )
     body_compact = body_html.strip("\n")
     indented_body = textwrap.indent(body_compact, "        ") if body_compact else ""
+    body_attrs = ""
+    scripts = ""
+    if chapter_slug:
+        # Reader mode: nav.js swaps in fragments/<page> instead of reloading.
+        body_attrs = f' data-chapter="{chapter_slug}" data-fragments="{READER_FRAGMENTS_DIR}/"'
+        scripts = (
+            f"\n    {chapter_list}"
+            '\n    <script defer src="nav.js"></script>\n    <script defer src="rum.js"></script>'
+        )
+    edition_switch = ""
+    if lite_link:
+        edition_switch = (
+            f'\n        <p class="page-subtitle"><a href="{lite_link}">Switch to the lite edition</a>'
+            " (faster on mobile data)</p>"
+        )
     template = f"""\
 <!DOCTYPE html>
 <html lang="en">
@@ -455,9 +754,9 @@ def render_page(
     <link rel="stylesheet" href="book.css" />
     {metas_html}{head_html}
 </head>
-<body>
+<body{body_attrs}>
     <header class="book-header">
-        <p class="page-title" role="heading" aria-level="1">{title}</p>
+        <p class="page-title" role="heading" aria-level="1">{title}</p>{edition_switch}
     </header>
 {navigation_top}
     <main>
@@ -466,7 +765,7 @@ def render_page(
 {navigation_bottom}
     <footer class="book-footer">
         <p>Generated from the original EPUB. Content © respective authors under CC BY-SA 4.0.</p>
-    </footer>
+    </footer>{scripts}
 </body>
 </html>
 """
@@ -509,6 +808,98 @@ def render_index(chapters: Sequence[Tuple[str, str]]) -> str:
     return template.strip()
 
 
+def build_lite_navigation(prev_link: str | None, next_link: str | None, full_link: str) -> str:
+    parts = ['<nav><a href="index.html">Contents</a>']
+    if prev_link:
+        parts.append(f'<a href="{prev_link}">← Previous</a>')
+    if next_link:
+        parts.append(f'<a href="{next_link}">Next →</a>')
+    parts.append(f'<a href="{full_link}">Full edition</a></nav>')
+    return "".join(parts)
+
+
+def render_lite_page(
+    title: str,
+    body_html: str,
+    prev_link: str | None,
+    next_link: str | None,
+    full_link: str,
+) -> str:
+    navigation = build_lite_navigation(prev_link, next_link, full_link)
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{title}</title><style>{LITE_CSS}</style></head>"
+        f"<body><header><h1>{title}</h1>{navigation}</header><main>{body_html}</main>"
+        f"{navigation}<footer><p>Content © respective authors under CC BY-SA 4.0.</p></footer>"
+        "</body></html>\n"
+    )
+
+
+def render_lite_index(chapters: Sequence[Tuple[str, str]]) -> str:
+    items = "".join(f'<li><a href="{output_file}">{title}</a></li>' for title, output_file in chapters)
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>Django Girls Tutorial – Lite Edition</title><style>{LITE_CSS}</style></head>"
+        "<body><header><h1>Django Girls Tutorial</h1>"
+        '<nav><a href="../index.html">Full edition</a></nav></header>'
+        f"<main><h2>Table of Contents</h2><ul>{items}</ul></main>"
+        "<footer><p>Content © respective authors under CC BY-SA 4.0.</p></footer>"
+        "</body></html>\n"
+    )
+
+
+def render_fragment(title: str, body_html: str) -> str:
+    body_compact = body_html.strip("\n")
+    return (
+        f'<article class="chapter-fragment" data-title="{html.escape(title)}">\n'
+        f"{body_compact}\n"
+        "</article>\n"
+    )
+
+
+def render_chapter_list(pages: Sequence[PageData]) -> str:
+    """The contents page and every chapter, as the JSON block nav.js builds its navigation from."""
+    chapters = [{"slug": "index", "file": "index.html", "title": "Contents"}]
+    chapters += [{"slug": Path(page.output_name).stem, "file": page.output_name, "title": page.title} for page in pages]
+    data = json.dumps(chapters, ensure_ascii=False).replace("</", "<\\/")
+    return f'<script type="application/json" id="{READER_CHAPTERS_ID}">{data}</script>'
+
+
+def render_reader_shell(first_chapter: str, chapter_list: str) -> str:
+    template = f"""\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1" />
+    <title>Django Girls Tutorial – Reader</title>
+    <link rel="stylesheet" href="book.css" />
+    <link rel="stylesheet" href="content/stylesheet.css" />
+    <link rel="stylesheet" href="content/page_styles.css" />
+    <link rel="preload" href="{READER_FRAGMENTS_DIR}/{first_chapter}" as="fetch" crossorigin />
+</head>
+<body data-chapter="" data-fragments="{READER_FRAGMENTS_DIR}/" data-shell="{first_chapter}">
+    <header class="book-header">
+        <p class="page-title" role="heading" aria-level="1">Django Girls Tutorial</p>
+    </header>
+    <main>
+        <p>Loading chapter…</p>
+        <noscript><p><a href="index.html">Open the table of contents</a>.</p></noscript>
+    </main>
+    <footer class="book-footer">
+        <p>Generated from the original EPUB. Content © respective authors under CC BY-SA 4.0.</p>
+    </footer>
+    {chapter_list}
+    <script defer src="nav.js"></script>
+    <script defer src="rum.js"></script>
+</body>
+</html>
+"""
+    return template.strip()
+
+
 def format_html(html_text: str) -> str:
     soup = BeautifulSoup(html_text, "html.parser")
     # Preserve existing DOCTYPE if present, otherwise add HTML5 doctype.
@@ -519,23 +910,109 @@ def format_html(html_text: str) -> str:
     return pretty
 
 
-def convert(epub_path: Path, output_dir: Path, force: bool) -> None:
-    ensure_destination(output_dir, force)
-    content_root = output_dir / "content"
-    content_root.mkdir(parents=True, exist_ok=True)
+STAGES = ("open", "manifest", "parse", "rewrite", "render", "format", "write", "post_process")
+
+
+@dataclass
+class ConversionOptions:
+    inline_threshold: int = 0
+    reader_mode: bool = False
+    lite: bool = False
+    prune_stylesheets: bool = False
+    css_safelist: Sequence[str] = ()
+
+
+@dataclass
+class Output:
+    """One file on its way from the render stage to the sink."""
+
+    path: str
+    data: str | bytes
+    needs_format: bool = False
+
+
+@dataclass
+class SpineDocument:
+    index: int
+    source_rel: str
+    output_name: str
+    head: ET.Element
+    body: ET.Element
+
+
+@dataclass
+class StageEvent:
+    stage: str
+    seconds: float
+    counters: Dict[str, int]
+
+
+@dataclass
+class BuildState:
+    """Everything the stages share while converting one EPUB."""
+
+    epub_path: Path
+    sink: OutputSink
+    options: ConversionOptions
+    zip_file: zipfile.ZipFile | None = None
+    members: Set[str] = field(default_factory=set)
+    sizes: Dict[str, int] = field(default_factory=dict)
+    opf_path: str = ""
+    manifest: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    spine_ids: List[str] = field(default_factory=list)
+    inliner: ImageInliner | None = None
+    documents: List[SpineDocument] = field(default_factory=list)
+    link_index: Dict[str, str] = field(default_factory=dict)
+    referenced: Set[str] = field(default_factory=set)
+    skipped: Set[str] = field(default_factory=set)
+    stylesheets: Dict[str, str] = field(default_factory=dict)
+    pruned_members: Set[str] = field(default_factory=set)
+    pages: List[PageData] = field(default_factory=list)
+    used: UsedSelectors = field(default_factory=UsedSelectors)
+    counters: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    events: List[StageEvent] = field(default_factory=list)
+
+    def count(self, stage: str, name: str, amount: int = 1) -> None:
+        stage_counters = self.counters.setdefault(stage, {})
+        stage_counters[name] = stage_counters.get(name, 0) + amount
+
+
+def content_outputs(state: BuildState, skip: Set[str]) -> Iterator[Output]:
+    assert state.zip_file is not None
+    for member in state.zip_file.infolist():
+        if member.is_dir() or member.filename in skip:
+            continue
+        try:
+            name = normalize_output_path(member.filename)
+        except ValueError:
+            # Same policy as ZipFile.extractall: never escape the content root.
+            continue
+        yield Output(f"content/{name}", state.zip_file.read(member))
+
+
+def stage_open(state: BuildState) -> None:
+    state.zip_file = zipfile.ZipFile(state.epub_path)
+    infos = state.zip_file.infolist()
+    state.members = {info.filename for info in infos}
+    state.sizes = {info.filename: info.file_size for info in infos}
+    state.count("open", "members", len(infos))
 
-    with zipfile.ZipFile(epub_path) as zip_file:
-        opf_path = read_container(zip_file)
-        manifest, spine_ids = parse_opf(zip_file, opf_path)
-        zip_file.extractall(content_root)
 
-    write_css(output_dir)
+def stage_manifest(state: BuildState) -> None:
+    assert state.zip_file is not None
+    state.opf_path = read_container(state.zip_file)
+    state.manifest, state.spine_ids = parse_opf(state.zip_file, state.opf_path)
+    if state.options.inline_threshold > 0:
+        state.inliner = ImageInliner(state.zip_file, state.options.inline_threshold, sizes=state.sizes)
+    state.count("manifest", "items", len(state.manifest))
+    state.count("manifest", "spine", len(state.spine_ids))
 
-    pages: List[PageData] = []
-    base_dir = Path(opf_path).parent
 
-    for index, item_id in enumerate(spine_ids, start=1):
-        manifest_item = manifest.get(item_id)
+def stage_parse(state: BuildState) -> None:
+    assert state.zip_file is not None
+    base_dir = Path(state.opf_path).parent
+    for index, item_id in enumerate(state.spine_ids, start=1):
+        manifest_item = state.manifest.get(item_id)
         if not manifest_item:
             continue
         media_type = manifest_item.get("media-type", "")
@@ -543,11 +1020,10 @@ def convert(epub_path: Path, output_dir: Path, force: bool) -> None:
             continue
         href = manifest_item["href"]
         source_rel = Path(base_dir, href).as_posix() if base_dir else href
-        source_path = content_root / source_rel
-        if not source_path.exists():
+        if source_rel not in state.members:
             continue
 
-        xml_content = source_path.read_bytes()
+        xml_content = state.zip_file.read(source_rel)
         try:
             document = ET.fromstring(xml_content)
         except ET.ParseError as exc:
@@ -558,29 +1034,88 @@ def convert(epub_path: Path, output_dir: Path, force: bool) -> None:
         if head is None or body is None:
             continue
 
-        parent_posix = Path(source_rel).parent.as_posix()
-        resource_parent = "" if parent_posix in ("", ".") else parent_posix
-        adjust_resource_paths(head, body, resource_parent)
-
-        title_text, metas_html, head_html = build_head_chunks(head)
-        body_html = extract_body_inner(body)
-
-        slug = slugify(title_text or Path(href).stem)
+        slug = slugify(head_title(head) or Path(href).stem)
         output_name = f"{index:03d}-{slug}.html"
+        # Every spine document is known before any anchor is rewritten,
+        # so forward links to later chapters resolve too.
+        state.link_index[posixpath.normpath(source_rel)] = output_name
+        state.documents.append(SpineDocument(index, source_rel, output_name, head, body))
+        state.count("parse", "documents")
+        state.count("parse", "bytes", len(xml_content))
+
+    if not state.documents:
+        raise RuntimeError("No XHTML content found in the EPUB spine.")
+
 
-        pages.append(
+def stage_rewrite(state: BuildState) -> None:
+    assert state.zip_file is not None
+    options = state.options
+    for document in state.documents:
+        parent_posix = Path(document.source_rel).parent.as_posix()
+        resource_parent = "" if parent_posix in ("", ".") else parent_posix
+        adjust_resource_paths(
+            document.head, document.body, resource_parent, state.inliner, state.link_index, state.referenced
+        )
+        state.count("rewrite", "heading_ids", assign_heading_ids(document.body))
+    state.count("rewrite", "references", len(state.referenced))
+
+    # Raw XHTML copies are only published if something still links to them.
+    base_dir = Path(state.opf_path).parent
+    state.skipped = {
+        posixpath.normpath(Path(base_dir, item["href"]).as_posix())
+        for item in state.manifest.values()
+        if item.get("media-type") in ("application/xhtml+xml", "text/html")
+    } - state.referenced
+
+    if state.inliner is not None or options.prune_stylesheets:
+        state.stylesheets = {
+            name: state.zip_file.read(name).decode("utf-8", "replace")
+            for name in state.members
+            if name.endswith(".css")
+        }
+    if options.prune_stylesheets:
+        state.pruned_members = {name for name in state.stylesheets if name in state.referenced}
+    if state.inliner is not None:
+        inliner = state.inliner
+        unpublished = inliner.unpublished(state.stylesheets, state.referenced)
+        saved = sum(inliner.sizes[name] for name in unpublished)
+        # Report to stderr so `--archive -` output stays clean.
+        print(
+            f"Inlined {len(inliner.inlined)} images; {len(unpublished)} files ({saved} bytes) no longer published:",
+            file=sys.stderr,
+        )
+        for name in sorted(unpublished):
+            print(f"  content/{name}", file=sys.stderr)
+        state.skipped |= unpublished
+        state.count("rewrite", "inlined_images", len(inliner.inlined))
+    state.count("rewrite", "skipped_members", len(state.skipped))
+
+
+def stage_render(state: BuildState) -> Iterator[Output]:
+    options = state.options
+    yield Output("book.css", render_css())
+    # Stylesheets linked from pages are written after pruning instead.
+    for output in content_outputs(state, state.skipped | state.pruned_members):
+        state.count("render", "content_files")
+        yield output
+
+    for document in state.documents:
+        title_text, metas_html, head_html = build_head_chunks(document.head)
+        state.pages.append(
             PageData(
-                title=title_text or f"Chapter {index}",
+                title=title_text or f"Chapter {document.index}",
                 metas_html=metas_html,
                 head_html=head_html,
-                body_html=body_html,
-                output_name=output_name,
+                body_html=extract_body_inner(document.body),
+                output_name=document.output_name,
+                lite_body_html=build_lite_body(document.body, state.sizes) if options.lite else "",
             )
         )
 
-    if not pages:
-        raise RuntimeError("No XHTML content found in the EPUB spine.")
-
+    state.used.add_safelist(DEFAULT_SAFELIST)
+    state.used.add_safelist(options.css_safelist)
+    pages = state.pages
+    chapter_list = render_chapter_list(pages) if options.reader_mode else ""
     for idx, page in enumerate(pages):
         prev_link = pages[idx - 1].output_name if idx > 0 else None
         next_link = pages[idx + 1].output_name if idx + 1 < len(pages) else None
@@ -591,17 +1126,232 @@ def convert(epub_path: Path, output_dir: Path, force: bool) -> None:
             body_html=page.body_html,
             prev_link=prev_link,
             next_link=next_link,
+            chapter_slug=Path(page.output_name).stem if options.reader_mode else None,
+            lite_link=f"{LITE_DIR}/{page.output_name}" if options.lite else None,
+            chapter_list=chapter_list,
         )
-        (output_dir / page.output_name).write_text(format_html(html_text), encoding="utf-8")
+        if state.pruned_members:
+            collect_usage(state.used, html_text)
+        state.count("render", "pages")
+        yield Output(page.output_name, html_text, needs_format=True)
+        if options.reader_mode:
+            state.count("render", "fragments")
+            yield Output(f"{READER_FRAGMENTS_DIR}/{page.output_name}", render_fragment(page.title, page.body_html))
+        if options.lite:
+            state.count("render", "lite_pages")
+            yield Output(
+                f"{LITE_DIR}/{page.output_name}",
+                render_lite_page(
+                    title=page.title,
+                    body_html=page.lite_body_html,
+                    prev_link=prev_link,
+                    next_link=next_link,
+                    full_link=f"../{page.output_name}",
+                ),
+            )
+
+    if options.reader_mode:
+        yield Output(READER_SHELL_NAME, render_reader_shell(pages[0].output_name, chapter_list), needs_format=True)
+        for name in READER_SCRIPTS:
+            yield Output(name, (READER_SCRIPTS_DIR / name).read_bytes())
 
     chapters_meta = [(page.title, page.output_name) for page in pages]
-    index_html = render_index(chapters_meta)
-    (output_dir / "index.html").write_text(format_html(index_html), encoding="utf-8")
+    yield Output("index.html", render_index(chapters_meta), needs_format=True)
+    if options.lite:
+        yield Output(f"{LITE_DIR}/index.html", render_lite_index(chapters_meta))
+
+    for name in sorted(state.pruned_members):
+        original = state.stylesheets[name]
+        pruned = prune_css(original, state.used)
+        print(f"Pruned content/{name}: {len(original.encode())} -> {len(pruned.encode())} bytes", file=sys.stderr)
+        state.count("render", "pruned_stylesheets")
+        yield Output(f"content/{name}", pruned)
+
+
+def stage_format(state: BuildState, output: Output) -> Output:
+    if output.needs_format and isinstance(output.data, str):
+        state.count("format", "documents")
+        return Output(output.path, format_html(output.data))
+    return output
+
+
+def stage_write(state: BuildState, output: Output) -> None:
+    data = output.data.encode("utf-8") if isinstance(output.data, str) else output.data
+    state.sink.write_bytes(output.path, data)
+    state.count("write", "files")
+    state.count("write", "bytes", len(data))
+
+
+def stage_post_process(state: BuildState) -> None:
+    if state.zip_file is not None:
+        state.zip_file.close()
+        state.zip_file = None
+    # Describe the finished tree so deploys can upload and purge only what changed.
+    state.sink.write_text(MANIFEST_NAME, dump_manifest(state.sink.manifest))
+    state.count("post_process", "manifest_entries", len(state.sink.manifest))
+
+
+class Converter:
+    """EPUB to HTML pipeline made of replaceable, timed stages.
+
+    ``open``, ``manifest``, ``parse``, ``rewrite`` and ``post_process`` run
+    once per build; ``render`` yields outputs that stream through ``format``
+    and ``write`` one at a time. Each stage can be swapped with
+    :meth:`replace_stage`, wrapped with ``before:<stage>``/``after:<stage>``
+    hooks, and reports a :class:`StageEvent` (seconds plus counters) to the
+    ``event`` hooks. Plugins are callables taking the converter, or objects
+    with a ``register(converter)`` method.
+    """
+
+    def __init__(self, options: ConversionOptions | None = None) -> None:
+        self.options = options or ConversionOptions()
+        self.stages: Dict[str, Callable[..., Any]] = {
+            "open": stage_open,
+            "manifest": stage_manifest,
+            "parse": stage_parse,
+            "rewrite": stage_rewrite,
+            "render": stage_render,
+            "format": stage_format,
+            "write": stage_write,
+            "post_process": stage_post_process,
+        }
+        self.hooks: Dict[str, List[Callable[..., None]]] = {}
+
+    def replace_stage(self, name: str, func: Callable[..., Any]) -> None:
+        if name not in STAGES:
+            raise ValueError(f"Unknown stage {name!r}; expected one of {', '.join(STAGES)}.")
+        self.stages[name] = func
+
+    def add_hook(self, event: str, func: Callable[..., None]) -> None:
+        self.hooks.setdefault(event, []).append(func)
+
+    def use(self, plugin: Any) -> None:
+        register = getattr(plugin, "register", plugin)
+        register(self)
+
+    def _emit(self, event: str, *args: Any) -> None:
+        for func in self.hooks.get(event, []):
+            func(*args)
+
+    def _finish_stage(self, state: BuildState, stage: str, seconds: float) -> None:
+        event = StageEvent(stage, seconds, dict(state.counters.get(stage, {})))
+        state.events.append(event)
+        self._emit(f"after:{stage}", state)
+        self._emit("event", event)
+
+    def _run_once(self, state: BuildState, stage: str) -> None:
+        self._emit(f"before:{stage}", state)
+        started = time.perf_counter()
+        self.stages[stage](state)
+        self._finish_stage(state, stage, time.perf_counter() - started)
+
+    def _run_streaming(self, state: BuildState) -> None:
+        for stage in ("render", "format", "write"):
+            self._emit(f"before:{stage}", state)
+        timings = {"render": 0.0, "format": 0.0, "write": 0.0}
+        render, format_output, write = self.stages["render"], self.stages["format"], self.stages["write"]
+        outputs = iter(render(state))
+        while True:
+            started = time.perf_counter()
+            output = next(outputs, None)
+            formatted_at = time.perf_counter()
+            timings["render"] += formatted_at - started
+            if output is None:
+                break
+            output = format_output(state, output)
+            written_at = time.perf_counter()
+            timings["format"] += written_at - formatted_at
+            write(state, output)
+            timings["write"] += time.perf_counter() - written_at
+        for stage in ("render", "format", "write"):
+            self._finish_stage(state, stage, timings[stage])
+
+    def run(self, epub_path: Path, sink: OutputSink) -> BuildState:
+        state = BuildState(epub_path=epub_path, sink=sink, options=self.options)
+        try:
+            for stage in ("open", "manifest", "parse", "rewrite"):
+                self._run_once(state, stage)
+            self._run_streaming(state)
+            self._run_once(state, "post_process")
+        finally:
+            if state.zip_file is not None:
+                state.zip_file.close()
+                state.zip_file = None
+        return state
+
+
+def convert(
+    epub_path: Path,
+    sink: OutputSink,
+    inline_threshold: int = 0,
+    reader_mode: bool = False,
+    lite: bool = False,
+    prune_stylesheets: bool = False,
+    css_safelist: Sequence[str] = (),
+) -> BuildState:
+    options = ConversionOptions(
+        inline_threshold=inline_threshold,
+        reader_mode=reader_mode,
+        lite=lite,
+        prune_stylesheets=prune_stylesheets,
+        css_safelist=css_safelist,
+    )
+    return Converter(options).run(epub_path, sink)
+
+
+def load_plugin(spec: str) -> Any:
+    module_name, _, attribute = spec.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute or "register")
+
+
+def print_stage_event(event: StageEvent) -> None:
+    counters = ", ".join(f"{name}={value}" for name, value in event.counters.items())
+    print(f"{event.stage:>12} {event.seconds * 1000:8.1f} ms  {counters}", file=sys.stderr)
+
+
+def open_sink(args: argparse.Namespace) -> OutputSink:
+    if args.archive:
+        sink: OutputSink = ArchiveSink(args.archive, fmt=args.archive_format)
+    else:
+        sink = DirectorySink(args.output_dir, force=args.force)
+    if args.writers > 0:
+        sink = WriteBehindSink(sink, workers=args.writers)
+    return sink
+
+
+def report_writes(sink: OutputSink, elapsed: float) -> None:
+    target = sink.inner if isinstance(sink, WriteBehindSink) else sink
+    summary = f"{len(sink.manifest)} files"
+    if isinstance(target, DirectorySink):
+        summary += f" ({target.written} written, {target.unchanged} unchanged)"
+    # Report to stderr so `--archive -` output stays clean.
+    print(
+        f"{summary} in {elapsed:.2f}s; writes blocked the pipeline for {sink.blocked_seconds:.2f}s",
+        file=sys.stderr,
+    )
 
 
 def main() -> None:
     args = parse_args()
-    convert(args.epub_path, args.output_dir, args.force)
+    options = ConversionOptions(
+        inline_threshold=args.inline_images_below,
+        reader_mode=args.reader_mode,
+        lite=args.lite,
+        prune_stylesheets=args.prune_css,
+        css_safelist=[name for value in args.css_safelist for name in value.split(",") if name],
+    )
+    converter = Converter(options)
+    for spec in args.plugin:
+        converter.use(load_plugin(spec))
+    if args.timings:
+        converter.add_hook("event", print_stage_event)
+
+    started = time.perf_counter()
+    sink = open_sink(args)
+    with sink:
+        converter.run(args.epub_path, sink)
+    report_writes(sink, time.perf_counter() - started)
 
 
 if __name__ == "__main__":
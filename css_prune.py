@@ -0,0 +1,146 @@
+"""Drop CSS rules whose selectors cannot match any generated page."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Iterable, List, Set, Tuple
+
+# Classes that only exist at runtime (added by nav.js, toc.js and chapter-quiz.js).
+DEFAULT_SAFELIST = frozenset({"open", "visible", "is-active", "disabled"})
+
+# Elements every rendered document has even if the markup omits them.
+IMPLICIT_TAGS = frozenset({"html", "head", "body"})
+
+# At-rules whose block holds further style rules that can be pruned.
+NESTED_AT_RULES = ("@media", "@supports", "@document", "@layer")
+
+COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+PSEUDO_RE = re.compile(r"::?[a-zA-Z-]+(\((?:[^()]|\([^()]*\))*\))?")
+ATTRIBUTE_RE = re.compile(r"\[\s*([a-zA-Z_:][-a-zA-Z0-9_:.]*)[^\]]*\]")
+CLASS_RE = re.compile(r"\.(-?[_a-zA-Z][-_a-zA-Z0-9]*)")
+ID_RE = re.compile(r"#(-?[_a-zA-Z][-_a-zA-Z0-9]*)")
+TAG_RE = re.compile(r"(?:^|[\s>+~(])([a-zA-Z][a-zA-Z0-9-]*)")
+
+
+@dataclass
+class UsedSelectors:
+    """Tags, classes, ids and attribute names seen across the generated pages."""
+
+    tags: Set[str] = field(default_factory=lambda: set(IMPLICIT_TAGS))
+    classes: Set[str] = field(default_factory=set)
+    ids: Set[str] = field(default_factory=set)
+    attributes: Set[str] = field(default_factory=set)
+
+    def add_safelist(self, classes: Iterable[str]) -> None:
+        self.classes.update(classes)
+
+
+class UsageCollector(HTMLParser):
+    def __init__(self, used: UsedSelectors) -> None:
+        super().__init__(convert_charrefs=True)
+        self.used = used
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str | None]]) -> None:
+        self.used.tags.add(tag.lower())
+        for name, value in attrs:
+            self.used.attributes.add(name.lower())
+            if name == "class" and value:
+                self.used.classes.update(value.split())
+            elif name == "id" and value:
+                self.used.ids.add(value)
+
+    handle_startendtag = handle_starttag
+
+
+def collect_usage(used: UsedSelectors, html_text: str) -> None:
+    collector = UsageCollector(used)
+    collector.feed(html_text)
+    collector.close()
+
+
+def split_top_level(text: str, separator: str = ",") -> List[str]:
+    parts: List[str] = []
+    depth = 0
+    current: List[str] = []
+    for char in text:
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def selector_may_match(selector: str, used: UsedSelectors) -> bool:
+    """Conservative check: every tag/class/id/attribute named must occur somewhere.
+
+    Pseudo-classes (including ``:not(...)``) and combinators are ignored, so a
+    selector is only dropped when it names something no page contains.
+    """
+    bare = PSEUDO_RE.sub("", selector)
+    for name in ATTRIBUTE_RE.findall(bare):
+        if name.lower() not in used.attributes:
+            return False
+    bare = ATTRIBUTE_RE.sub("", bare)
+    if any(name not in used.classes for name in CLASS_RE.findall(bare)):
+        return False
+    if any(name not in used.ids for name in ID_RE.findall(bare)):
+        return False
+    bare = CLASS_RE.sub("", ID_RE.sub("", bare))
+    return all(name.lower() in used.tags for name in TAG_RE.findall(bare))
+
+
+def find_block_end(css: str, start: int) -> int:
+    """Return the index just past the ``}`` matching the ``{`` at ``start``."""
+    depth = 0
+    for index in range(start, len(css)):
+        if css[index] == "{":
+            depth += 1
+        elif css[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+    return len(css)
+
+
+def prune_rules(css: str, used: UsedSelectors) -> List[str]:
+    kept: List[str] = []
+    position = 0
+    while position < len(css):
+        brace = css.find("{", position)
+        semicolon = css.find(";", position)
+        if brace == -1:
+            break
+        prelude = css[position:brace].strip()
+        if prelude.startswith("@") and semicolon != -1 and semicolon < brace:
+            # Block-less at-rule such as @import or @charset.
+            kept.append(css[position : semicolon + 1].strip())
+            position = semicolon + 1
+            continue
+        end = find_block_end(css, brace)
+        block = css[brace + 1 : end - 1]
+        if prelude.startswith(NESTED_AT_RULES):
+            inner = prune_rules(block, used)
+            if inner:
+                kept.append(f"{prelude} {{\n" + "\n".join(inner) + "\n}")
+        elif prelude.startswith("@"):
+            # @font-face, @keyframes, @page: keep verbatim.
+            kept.append(f"{prelude} {{{block}}}")
+        else:
+            selectors = [sel for sel in split_top_level(prelude) if selector_may_match(sel, used)]
+            if selectors:
+                kept.append(",\n".join(selectors) + f" {{{block}}}")
+        position = end
+    return kept
+
+
+def prune_css(css: str, used: UsedSelectors) -> str:
+    pruned = prune_rules(COMMENT_RE.sub("", css), used)
+    return "\n".join(pruned) + ("\n" if pruned else "")
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Build and diff deploy manifests so only changed files are published."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+MANIFEST_NAME = "deploy-manifest.json"
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1 << 16
+
+Manifest = Dict[str, Dict[str, object]]
+
+
+@dataclass
+class ManifestDiff:
+    upload: List[str] = field(default_factory=list)
+    delete: List[str] = field(default_factory=list)
+    purge: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "upload": self.upload,
+            "delete": self.delete,
+            "purge": self.purge,
+            "unchanged": self.unchanged,
+        }
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Build deploy manifests and compute the minimal upload/delete/purge set."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build = subparsers.add_parser("build", help="Write a manifest for a published directory.")
+    build.add_argument("root", type=Path, help="Directory to describe (e.g. docs).")
+    build.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help=f"Where to write the manifest (default: <root>/{MANIFEST_NAME}).",
+    )
+
+    diff = subparsers.add_parser("diff", help="Compare two manifests.")
+    diff.add_argument("old", type=Path, help="Manifest of the currently published tree.")
+    diff.add_argument("new", type=Path, help="Manifest of the freshly built tree.")
+    diff.add_argument(
+        "--base-url",
+        default="",
+        help="Prefix purge entries with this URL (e.g. https://example.github.io/mentor-quiz/).",
+    )
+    diff.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the result as JSON instead of plain lists.",
+    )
+    return parser.parse_args(argv)
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_entry(data: bytes) -> Dict[str, object]:
+    return {"size": len(data), "sha256": hash_bytes(data)}
+
+
+def build_manifest(root: Path, exclude: Iterable[str] = (MANIFEST_NAME,)) -> Manifest:
+    """Describe every file below ``root`` by POSIX-relative path, size and hash."""
+    excluded = set(exclude)
+    manifest: Manifest = {}
+    for path in sorted(root.rglob("*")):
+        if not path.is_file():
+            continue
+        relative = path.relative_to(root).as_posix()
+        if relative in excluded:
+            continue
+        manifest[relative] = {"size": path.stat().st_size, "sha256": hash_file(path)}
+    return manifest
+
+
+def dump_manifest(manifest: Manifest) -> str:
+    data = {"version": MANIFEST_VERSION, "files": dict(sorted(manifest.items()))}
+    return json.dumps(data, indent=2) + "\n"
+
+
+def write_manifest(manifest: Manifest, output: Path) -> None:
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(dump_manifest(manifest), encoding="utf-8")
+
+
+def load_manifest(path: Path) -> Manifest:
+    if not path.exists():
+        # A missing manifest means nothing has been published yet.
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("version") != MANIFEST_VERSION:
+        raise RuntimeError(f"Unsupported manifest version in {path}: {data.get('version')!r}")
+    return data["files"]
+
+
+def purge_targets(path: str, base_url: str) -> List[str]:
+    targets = [f"{base_url}{path}"]
+    if path == "index.html" or path.endswith("/index.html"):
+        # Directory URLs are served from the same object and cached separately.
+        targets.append(f"{base_url}{path[: -len('index.html')]}")
+    return targets
+
+
+def diff_manifests(old: Manifest, new: Manifest, base_url: str = "") -> ManifestDiff:
+    diff = ManifestDiff()
+    for path, entry in sorted(new.items()):
+        previous = old.get(path)
+        if previous is None:
+            diff.upload.append(path)
+        elif previous.get("sha256") != entry.get("sha256") or previous.get("size") != entry.get("size"):
+            diff.upload.append(path)
+            diff.purge.extend(purge_targets(path, base_url))
+        else:
+            diff.unchanged += 1
+    for path in sorted(old):
+        if path not in new:
+            diff.delete.append(path)
+            diff.purge.extend(purge_targets(path, base_url))
+    return diff
+
+
+def print_diff(diff: ManifestDiff) -> None:
+    for label, paths in (("upload", diff.upload), ("delete", diff.delete), ("purge", diff.purge)):
+        print(f"# {label} ({len(paths)})")
+        for path in paths:
+            print(path)
+    print(f"# unchanged ({diff.unchanged})")
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.command == "build":
+        output = args.output or args.root / MANIFEST_NAME
+        exclude = [output.relative_to(args.root).as_posix()] if output.is_relative_to(args.root) else []
+        write_manifest(build_manifest(args.root, exclude), output)
+        print(f"Wrote {output}")
+        return
+
+    diff = diff_manifests(load_manifest(args.old), load_manifest(args.new), args.base_url)
+    if args.json:
+        json.dump(diff.to_dict(), sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        print_diff(diff)
+
+
+if __name__ == "__main__":
+    main()
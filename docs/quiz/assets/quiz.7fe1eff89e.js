@@ -0,0 +1,941 @@
+(function () {
+const VERSION = 1;
+function checkVersion(data) {
+if (!data || data.v !== VERSION) {
+throw new Error(`Unsupported question bank encoding: ${data && data.v}`);
+}
+}
+function decodeQuestion(row, strings, anchor) {
+const question = {
+prompt: strings[row[0]],
+options: row[1].map((index) => strings[index]),
+answerIndex: row[2],
+};
+if (row.length > 3) {
+question.explanation = strings[row[3]];
+}
+if (anchor !== undefined && anchor !== null) {
+question.anchor = strings[anchor];
+}
+return question;
+}
+function decodeSections(data) {
+checkVersion(data);
+const strings = data.s;
+return data.b.map((row, position) => {
+const section = {
+id: strings[row[0]],
+title: strings[row[1]],
+tutorialPath: strings[row[2]],
+count: row[3],
+};
+if (row.length > 4) {
+const anchors = (data.a && data.a[position]) || [];
+section.questions = row[4].map((item, index) => decodeQuestion(item, strings, anchors[index]));
+}
+if (data.d) {
+section.difficulties = data.d[position];
+}
+if (data.h) {
+section.hash = data.h[position];
+}
+return section;
+});
+}
+function decodeQuestions(data) {
+checkVersion(data);
+const anchors = data.a || [];
+return data.q.map((row, index) => decodeQuestion(row, data.s, anchors[index]));
+}
+window.QuizBank = { decodeSections, decodeQuestions };
+})();
+(function () {
+const PREFIX = 'quiz:bank:';
+const entries = new Map();
+function storage() {
+try {
+return window.localStorage;
+} catch (error) {
+return null;
+}
+}
+function read(store, key) {
+try {
+return JSON.parse(store.getItem(key));
+} catch (error) {
+return null;
+}
+}
+function sync(sections) {
+const store = storage();
+if (!store) {
+return;
+}
+const hashes = new Map(sections.map((section) => [section.id, section.hash]));
+const keys = [];
+for (let i = 0; i < store.length; i++) {
+keys.push(store.key(i));
+}
+keys
+.filter((key) => key && key.startsWith(PREFIX))
+.forEach((key) => {
+const id = key.slice(PREFIX.length);
+const entry = read(store, key);
+if (entry && entry.hash && entry.hash === hashes.get(id)) {
+entries.set(id, entry);
+} else {
+store.removeItem(key);
+}
+});
+}
+function current(section) {
+const entry = entries.get(section.id);
+return section.hash && entry && entry.hash === section.hash ? entry : null;
+}
+function entryFor(section) {
+let entry = current(section);
+if (!entry) {
+entry = { hash: section.hash, questions: {} };
+entries.set(section.id, entry);
+}
+return entry;
+}
+function save(section, entry) {
+const store = storage();
+if (!store) {
+return;
+}
+try {
+store.setItem(PREFIX + section.id, JSON.stringify(entry));
+} catch (error) {
+store.removeItem(PREFIX + section.id);
+}
+}
+function question(section, number) {
+const entry = current(section);
+if (!entry) {
+return null;
+}
+if (entry.questions[number]) {
+return entry.questions[number];
+}
+const whole = entry.section;
+if (whole && whole.q[number]) {
+const shard = { v: whole.v, s: whole.s, q: [whole.q[number]] };
+if (whole.a) {
+shard.a = [whole.a[number]];
+}
+return shard;
+}
+return null;
+}
+function sectionShard(section) {
+const entry = current(section);
+return entry && entry.section ? entry.section : null;
+}
+function storeQuestion(section, number, data) {
+if (!section.hash) {
+return;
+}
+const entry = entryFor(section);
+if (!entry.section) {
+entry.questions[number] = data;
+save(section, entry);
+}
+}
+function storeSection(section, data) {
+if (!section.hash) {
+return;
+}
+const entry = entryFor(section);
+entry.section = data;
+entry.questions = {};
+save(section, entry);
+}
+window.QuizBankCache = { sync, question, section: sectionShard, storeQuestion, storeSection };
+})();
+(function () {
+const ENDPOINT = '';
+const STORAGE_KEY = 'quiz:share-responses';
+const meta = document.querySelector('meta[name="quiz-response-endpoint"]');
+const endpoint = meta ? meta.content : ENDPOINT;
+function promptHash(text) {
+let hash = 0x811c9dc5;
+new TextEncoder().encode(text).forEach((byte) => {
+hash = Math.imul(hash ^ byte, 0x01000193) >>> 0;
+});
+return hash.toString(16).padStart(8, '0');
+}
+function attemptId() {
+if (window.crypto && crypto.randomUUID) {
+return crypto.randomUUID();
+}
+return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+}
+function attemptRecords(responses) {
+const attempt = attemptId();
+const time = new Date().toISOString();
+return responses.map((resp) => ({
+attempt,
+time,
+section: resp.sectionId,
+question: resp.questionNumber,
+prompt: promptHash(resp.prompt),
+order: resp.optionOrder,
+answer: resp.optionOrder[resp.answerIndex],
+selected: resp.optionOrder[resp.selectedIndex],
+}));
+}
+function toJsonl(records) {
+return records.map((record) => `${JSON.stringify(record)}\n`).join('');
+}
+function optedIn() {
+try {
+return window.localStorage.getItem(STORAGE_KEY) === '1';
+} catch (error) {
+return false;
+}
+}
+function setOptIn(value) {
+try {
+window.localStorage.setItem(STORAGE_KEY, value ? '1' : '0');
+} catch (error) {
+}
+}
+function send(records) {
+if (!endpoint || !optedIn() || !records.length) {
+return false;
+}
+const body = new Blob([toJsonl(records)], { type: 'text/plain' });
+if (navigator.sendBeacon && navigator.sendBeacon(endpoint, body)) {
+return true;
+}
+fetch(endpoint, { method: 'POST', body, keepalive: true, mode: 'no-cors' }).catch(() => {});
+return true;
+}
+function download(records) {
+const url = URL.createObjectURL(new Blob([toJsonl(records)], { type: 'application/x-ndjson' }));
+const link = document.createElement('a');
+link.href = url;
+link.download = `quiz-responses-${records.length ? records[0].time.slice(0, 10) : 'empty'}.jsonl`;
+document.body.appendChild(link);
+link.click();
+link.remove();
+setTimeout(() => URL.revokeObjectURL(url), 0);
+}
+window.QuizResponses = {
+canShare: Boolean(endpoint),
+attemptRecords,
+optedIn,
+setOptIn,
+send,
+download,
+};
+})();
+(function () {
+const GRID = Array.from({ length: 81 }, (_, index) => -4 + index * 0.1);
+const BANDS = [0.8, 0.5, 0.3];
+const INTERVAL = 0.9;
+const MIN_QUESTIONS = 4;
+function band(score) {
+const index = BANDS.findIndex((edge) => score >= edge);
+return index === -1 ? BANDS.length : index;
+}
+function shuffle(array) {
+const arr = array.slice();
+for (let i = arr.length - 1; i > 0; i--) {
+const j = Math.floor(Math.random() * (i + 1));
+[arr[i], arr[j]] = [arr[j], arr[i]];
+}
+return arr;
+}
+function createSession(sections) {
+const points = GRID.length;
+const items = shuffle(
+sections.flatMap((section) =>
+Array.from({ length: section.count }, (_, number) => ({
+section,
+number,
+difficulty: (section.difficulties && section.difficulties[number]) || 0,
+}))
+)
+);
+const probabilities = new Float64Array(items.length * points);
+items.forEach((item, index) => {
+GRID.forEach((ability, g) => {
+probabilities[index * points + g] = 1 / (1 + Math.exp(item.difficulty - ability));
+});
+});
+const expectedScore = GRID.map((_, g) => {
+const perSection = new Map();
+items.forEach((item, index) => {
+const entry = perSection.get(item.section) || { sum: 0, count: 0 };
+entry.sum += probabilities[index * points + g];
+entry.count += 1;
+perSection.set(item.section, entry);
+});
+let total = 0;
+perSection.forEach((entry) => {
+total += entry.sum / entry.count;
+});
+return total / perSection.size;
+});
+const logPosterior = new Float64Array(GRID.map((ability) => (-ability * ability) / 2));
+const asked = new Set();
+const askedSections = new Set();
+const answers = [];
+function posterior(log) {
+const max = Math.max(...log);
+const weights = Array.from(log, (value) => Math.exp(value - max));
+const total = weights.reduce((sum, value) => sum + value, 0);
+return weights.map((value) => value / total);
+}
+function updated(log, itemIndex, correct) {
+const next = Float64Array.from(log);
+for (let g = 0; g < points; g++) {
+const p = probabilities[itemIndex * points + g];
+next[g] += Math.log(correct ? p : 1 - p);
+}
+return next;
+}
+function choose(log, excluded, excludedSection) {
+const weights = posterior(log);
+const uncovered = items.some(
+(item, index) =>
+index !== excluded &&
+!asked.has(index) &&
+!askedSections.has(item.section) &&
+item.section !== excludedSection
+);
+let best = -1;
+let bestInformation = -1;
+items.forEach((item, index) => {
+if (index === excluded || asked.has(index)) {
+return;
+}
+if (uncovered && (askedSections.has(item.section) || item.section === excludedSection)) {
+return;
+}
+let information = 0;
+for (let g = 0; g < points; g++) {
+const p = probabilities[index * points + g];
+information += weights[g] * p * (1 - p);
+}
+if (information > bestInformation) {
+best = index;
+bestInformation = information;
+}
+});
+return best === -1 ? null : best;
+}
+function interval() {
+const weights = posterior(logPosterior);
+const tail = (1 - INTERVAL) / 2;
+let cumulative = 0;
+let low = -1;
+let high = -1;
+weights.forEach((weight, g) => {
+cumulative += weight;
+if (low === -1 && cumulative >= tail) {
+low = g;
+}
+if (high === -1 && cumulative >= 1 - tail) {
+high = g;
+}
+});
+const score = weights.reduce((sum, weight, g) => sum + weight * expectedScore[g], 0);
+return { score, low: expectedScore[low], high: expectedScore[high], weights };
+}
+return {
+next() {
+const index = choose(logPosterior, -1, null);
+return index === null ? null : { ...items[index], index };
+},
+nextAfter(item, correct) {
+const index = choose(updated(logPosterior, item.index, correct), item.index, item.section);
+return index === null ? null : { ...items[index], index };
+},
+record(item, correct) {
+logPosterior.set(updated(logPosterior, item.index, correct));
+asked.add(item.index);
+askedSections.add(item.section);
+answers.push({ item, correct });
+},
+finished() {
+if (answers.length >= sections.length || asked.size === items.length) {
+return true;
+}
+if (answers.length < MIN_QUESTIONS) {
+return false;
+}
+const { low, high } = interval();
+return band(low) === band(high);
+},
+result() {
+const { score, low, high, weights } = interval();
+const weak = [];
+sections.forEach((section) => {
+const sectionAnswers = answers.filter((answer) => answer.item.section === section);
+if (sectionAnswers.length) {
+if (sectionAnswers.some((answer) => !answer.correct)) {
+weak.push({ section, asked: true });
+}
+return;
+}
+let chance = 0;
+let count = 0;
+items.forEach((item, index) => {
+if (item.section === section) {
+for (let g = 0; g < points; g++) {
+chance += weights[g] * probabilities[index * points + g];
+}
+count += 1;
+}
+});
+if (count && chance / count < 0.5) {
+weak.push({ section, asked: false });
+}
+});
+return { score, low, high, weak };
+},
+};
+}
+window.QuizAdaptive = { createSession };
+})();
+(function () {
+const screens = {
+start: document.getElementById('screen-start'),
+question: document.getElementById('screen-question'),
+results: document.getElementById('screen-results'),
+};
+const elements = {
+questionCount: document.getElementById('question-count'),
+questionProgress: document.getElementById('question-progress'),
+questionTitle: document.getElementById('question-title'),
+optionList: document.getElementById('option-list'),
+tutorialLink: document.getElementById('tutorial-link'),
+alertSelection: document.getElementById('alert-selection'),
+btnStart: document.getElementById('btn-start'),
+btnAdaptive: document.getElementById('btn-adaptive'),
+btnNext: document.getElementById('btn-next'),
+btnQuit: document.getElementById('btn-quit'),
+btnRetake: document.getElementById('btn-retake'),
+questionForm: document.getElementById('question-form'),
+reviewList: document.getElementById('review-list'),
+scoreSummary: document.getElementById('score-summary'),
+scoreMessage: document.getElementById('score-message'),
+scoreBanner: document.getElementById('score-banner'),
+questionBank: document.getElementById('question-bank'),
+questionBankSections: document.getElementById('question-bank-sections'),
+shareResponses: document.getElementById('share-responses'),
+shareResponsesInput: document.getElementById('share-responses-input'),
+btnDownload: document.getElementById('btn-download'),
+weakSections: document.getElementById('weak-sections'),
+weakSectionsList: document.getElementById('weak-sections-list'),
+};
+const state = {
+sections: [],
+quizQuestions: [],
+responses: [],
+attemptRecords: [],
+currentIndex: 0,
+questionRendered: false,
+mode: 'fixed',
+session: null,
+pendingItem: null,
+};
+elements.btnStart.disabled = true;
+elements.btnAdaptive.disabled = true;
+const canMeasure = Boolean(window.performance && performance.mark && performance.measure);
+function markStart(name) {
+if (canMeasure) {
+performance.mark(`quiz:${name}:start`);
+}
+}
+function measureSince(name) {
+if (canMeasure) {
+performance.measure(`quiz:${name}`, `quiz:${name}:start`);
+}
+}
+function timed(name, fn) {
+markStart(name);
+const result = fn();
+measureSince(name);
+return result;
+}
+function shuffle(array) {
+const arr = array.slice();
+for (let i = arr.length - 1; i > 0; i--) {
+const j = Math.floor(Math.random() * (i + 1));
+[arr[i], arr[j]] = [arr[j], arr[i]];
+}
+return arr;
+}
+const BANK_URL = 'bank/';
+const shardCache = new Map();
+function fetchJson(path) {
+if (!shardCache.has(path)) {
+const request = fetch(`${BANK_URL}${path}`).then((response) => {
+if (!response.ok) {
+throw new Error(`Failed to load ${path}: ${response.status}`);
+}
+return response.json();
+});
+request.catch(() => shardCache.delete(path));
+shardCache.set(path, request);
+}
+return shardCache.get(path);
+}
+function versioned(section, path) {
+return section.hash ? `${path}?v=${section.hash}` : path;
+}
+function loadQuestion(section, number) {
+const cached = window.QuizBankCache.question(section, number);
+if (cached) {
+return Promise.resolve(cached);
+}
+return fetchJson(versioned(section, `${section.id}/${number}.json`)).then((data) => {
+window.QuizBankCache.storeQuestion(section, number, data);
+return data;
+});
+}
+function loadSection(section) {
+const cached = window.QuizBankCache.section(section);
+if (cached) {
+return Promise.resolve(cached);
+}
+return fetchJson(versioned(section, `${section.id}.json`)).then((data) => {
+window.QuizBankCache.storeSection(section, data);
+return data;
+});
+}
+function loadSampledQuestions() {
+return Promise.all(
+state.sections.map((section) => {
+const number = Math.floor(Math.random() * section.count);
+return loadQuestion(section, number).then((data) =>
+pickQuestion(section, window.QuizBank.decodeQuestions(data)[0], number)
+);
+})
+);
+}
+function pickQuestion(section, question, number) {
+const paired = question.options.map((text, idx) => ({
+text,
+index: idx,
+isCorrect: idx === question.answerIndex,
+}));
+const shuffled = shuffle(paired);
+const answerIndex = shuffled.findIndex((opt) => opt.isCorrect);
+return {
+sectionId: section.id,
+sectionTitle: section.title,
+tutorialPath: question.anchor ? `${section.tutorialPath}#${question.anchor}` : section.tutorialPath,
+hasAnchor: Boolean(question.anchor),
+questionNumber: number,
+prompt: question.prompt,
+options: shuffled.map((opt) => opt.text),
+optionOrder: shuffled.map((opt) => opt.index),
+answerIndex,
+};
+}
+function loadAdaptiveQuestion(item) {
+return loadQuestion(item.section, item.number).then((data) => ({
+...pickQuestion(item.section, window.QuizBank.decodeQuestions(data)[0], item.number),
+adaptiveItem: item,
+}));
+}
+function prefetchAdaptive(item) {
+[true, false].forEach((correct) => {
+const next = state.session.nextAfter(item, correct);
+if (next) {
+loadQuestion(next.section, next.number).catch(() => {});
+}
+});
+}
+function setStartButtonsDisabled(disabled) {
+elements.btnStart.disabled = disabled;
+elements.btnAdaptive.disabled = disabled;
+elements.btnRetake.disabled = disabled;
+}
+function prepareQuiz(mode) {
+if (!state.sections.length) {
+return Promise.resolve();
+}
+setStartButtonsDisabled(true);
+state.mode = mode;
+state.pendingItem = null;
+markStart('fetch-sampled-questions');
+let loading;
+if (mode === 'adaptive') {
+state.session = window.QuizAdaptive.createSession(state.sections);
+loading = loadAdaptiveQuestion(state.session.next()).then((question) => [question]);
+} else {
+state.session = null;
+loading = loadSampledQuestions();
+}
+return loading
+.then((questions) => {
+measureSince('fetch-sampled-questions');
+startQuiz(questions);
+})
+.catch((error) => {
+console.error(error);
+alert("We couldn't load the questions. Please check your connection and try again.");
+})
+.finally(() => {
+setStartButtonsDisabled(false);
+});
+}
+function loadNextAdaptive(item) {
+elements.btnNext.disabled = true;
+loadAdaptiveQuestion(item)
+.then((question) => {
+state.pendingItem = null;
+state.quizQuestions.push(question);
+state.currentIndex += 1;
+renderQuestion();
+})
+.catch((error) => {
+console.error(error);
+state.pendingItem = item;
+alert("We couldn't load the next question. Please check your connection and press Next again.");
+})
+.finally(() => {
+elements.btnNext.disabled = false;
+});
+}
+function advanceAdaptive() {
+const response = state.responses[state.responses.length - 1];
+state.session.record(response.adaptiveItem, response.isCorrect);
+if (state.session.finished()) {
+finishQuiz();
+return;
+}
+loadNextAdaptive(timed('adaptive-next', () => state.session.next()));
+}
+function startQuiz(questions) {
+state.quizQuestions = questions;
+state.responses = [];
+state.currentIndex = 0;
+elements.btnNext.textContent = 'Next';
+showScreen('question');
+if (state.questionRendered) {
+renderQuestion();
+} else {
+timed('first-render-question', renderQuestion);
+state.questionRendered = true;
+}
+}
+function renderQuestion() {
+const current = state.quizQuestions[state.currentIndex];
+elements.questionProgress.textContent =
+state.mode === 'adaptive'
+? `Question ${state.currentIndex + 1}`
+: `Question ${state.currentIndex + 1} of ${state.quizQuestions.length}`;
+elements.questionTitle.textContent = current.prompt;
+elements.tutorialLink.href = current.tutorialPath;
+elements.tutorialLink.textContent = `Read more in “${current.sectionTitle}”`;
+elements.optionList.innerHTML = '';
+elements.alertSelection.style.display = 'none';
+current.options.forEach((option, index) => {
+const id = `option-${state.currentIndex}-${index}`;
+const wrapper = document.createElement('label');
+wrapper.className = 'option';
+wrapper.setAttribute('for', id);
+const radio = document.createElement('input');
+radio.type = 'radio';
+radio.name = 'answer';
+radio.value = String(index);
+radio.id = id;
+const span = document.createElement('span');
+span.textContent = option;
+wrapper.appendChild(radio);
+wrapper.appendChild(span);
+elements.optionList.appendChild(wrapper);
+});
+if (state.mode === 'fixed' && state.currentIndex === state.quizQuestions.length - 1) {
+elements.btnNext.textContent = 'Finish quiz';
+} else {
+elements.btnNext.textContent = 'Next';
+}
+if (state.mode === 'adaptive') {
+prefetchAdaptive(current.adaptiveItem);
+}
+}
+function renderQuestionBank() {
+const container = elements.questionBank;
+const sectionList = elements.questionBankSections;
+if (!container || !sectionList) {
+return;
+}
+if (!state.sections.length) {
+container.hidden = true;
+sectionList.innerHTML = '';
+return;
+}
+sectionList.innerHTML = '';
+state.sections.forEach((section) => {
+const details = document.createElement('details');
+details.className = 'question-bank__item';
+const summary = document.createElement('summary');
+summary.textContent = `${section.title} (${section.count})`;
+details.appendChild(summary);
+if (section.count) {
+const list = document.createElement('ol');
+list.className = 'question-bank__questions';
+details.appendChild(list);
+details.addEventListener('toggle', () => {
+if (details.open && !list.childElementCount) {
+renderSectionQuestions(section, list);
+}
+});
+}
+sectionList.appendChild(details);
+});
+container.hidden = false;
+}
+function renderSectionQuestions(section, list) {
+const loading = document.createElement('li');
+loading.textContent = 'Loading questions…';
+list.appendChild(loading);
+loadSection(section)
+.then((data) => {
+list.innerHTML = '';
+window.QuizBank.decodeQuestions(data).forEach((question) => {
+const item = document.createElement('li');
+item.textContent = question.prompt;
+list.appendChild(item);
+});
+})
+.catch((error) => {
+console.error(error);
+list.innerHTML = '';
+const details = list.closest('details');
+if (details) {
+details.open = false;
+}
+});
+}
+function recordResponse(selectedIndex) {
+const question = state.quizQuestions[state.currentIndex];
+const isCorrect = Number(selectedIndex) === question.answerIndex;
+state.responses.push({
+...question,
+selectedIndex: Number(selectedIndex),
+isCorrect,
+});
+}
+function showScreen(target) {
+screens.start.hidden = target !== 'start';
+screens.question.hidden = target !== 'question';
+screens.results.hidden = target !== 'results';
+}
+function evaluateScore() {
+const total = state.responses.length;
+const correct = state.responses.filter((resp) => resp.isCorrect).length;
+let percentage = Math.round((correct / total) * 100);
+let summary = `You answered ${correct} of ${total} questions correctly (${percentage}%).`;
+if (state.mode === 'adaptive') {
+const result = state.session.result();
+percentage = Math.round(result.score * 100);
+summary =
+`You answered ${correct} of ${total} questions correctly. ` +
+`Your estimated score on the full quiz is ${percentage}% ` +
+`(most likely between ${Math.round(result.low * 100)}% and ${Math.round(result.high * 100)}%).`;
+renderWeakSections(result.weak);
+} else {
+renderWeakSections([]);
+}
+let message = '';
+let bannerClass = 'success';
+if (percentage >= 80) {
+message = "Fantastic! You're ready to be a coach for this course.";
+bannerClass = 'success';
+} else if (percentage >= 50) {
+message = "You're almost ready—review a few chapters and you'll be confident.";
+bannerClass = 'mid';
+} else if (percentage >= 30) {
+message = "You're on the right path. A little more reading and practice will get you there.";
+bannerClass = 'mid';
+} else {
+message = "Take some extra time with the tutorial to build up your confidence.";
+bannerClass = 'low';
+}
+elements.scoreSummary.textContent = summary;
+elements.scoreMessage.textContent = message;
+elements.scoreBanner.classList.remove('success', 'mid', 'low');
+elements.scoreBanner.classList.add(bannerClass);
+timed('render-review', renderReview);
+}
+function renderWeakSections(weak) {
+if (!elements.weakSections) {
+return;
+}
+const list = elements.weakSectionsList;
+list.innerHTML = '';
+weak.forEach(({ section, asked }) => {
+const item = document.createElement('li');
+const anchor = document.createElement('a');
+anchor.href = section.tutorialPath;
+anchor.target = '_blank';
+anchor.rel = 'noopener';
+anchor.textContent = section.title;
+item.appendChild(anchor);
+if (!asked) {
+item.appendChild(document.createTextNode(' (not asked, but likely hard for you)'));
+}
+list.appendChild(item);
+});
+elements.weakSections.hidden = !weak.length;
+}
+function renderReview() {
+const list = elements.reviewList;
+list.innerHTML = '';
+state.responses.forEach((resp, index) => {
+const item = document.createElement('article');
+item.className = `review-item ${resp.isCorrect ? 'correct' : 'incorrect'}`;
+const heading = document.createElement('h3');
+heading.textContent = `Question ${index + 1}: ${resp.sectionTitle}`;
+const prompt = document.createElement('p');
+prompt.innerHTML = `<strong>Prompt:</strong> ${resp.prompt}`;
+const userAnswer = document.createElement('p');
+userAnswer.innerHTML = `<strong>Your answer:</strong> ${resp.options[resp.selectedIndex] || 'No answer selected'}`;
+const correctAnswer = document.createElement('p');
+correctAnswer.innerHTML = `<strong>Correct answer:</strong> ${resp.options[resp.answerIndex]}`;
+const status = document.createElement('p');
+status.innerHTML = resp.isCorrect
+? '✅ Well done!'
+: '❌ Take another look at this topic.';
+const link = document.createElement('p');
+const anchor = document.createElement('a');
+anchor.href = resp.tutorialPath;
+anchor.target = '_blank';
+anchor.rel = 'noopener';
+anchor.textContent = resp.hasAnchor
+? `Review this topic in “${resp.sectionTitle}”`
+: `Review the “${resp.sectionTitle}” chapter`;
+link.appendChild(anchor);
+item.appendChild(heading);
+item.appendChild(prompt);
+item.appendChild(userAnswer);
+item.appendChild(correctAnswer);
+item.appendChild(status);
+item.appendChild(link);
+list.appendChild(item);
+});
+}
+function finishQuiz() {
+state.attemptRecords = window.QuizResponses.attemptRecords(state.responses);
+window.QuizResponses.send(state.attemptRecords);
+showScreen('results');
+evaluateScore();
+window.scrollTo({ top: 0, behavior: 'smooth' });
+}
+elements.questionForm.addEventListener('submit', (event) => {
+event.preventDefault();
+const data = new FormData(elements.questionForm);
+const selected = data.get('answer');
+if (state.pendingItem) {
+loadNextAdaptive(state.pendingItem);
+return;
+}
+if (selected === null) {
+elements.alertSelection.style.display = 'block';
+return;
+}
+elements.alertSelection.style.display = 'none';
+recordResponse(selected);
+if (state.mode === 'adaptive') {
+advanceAdaptive();
+} else if (state.currentIndex === state.quizQuestions.length - 1) {
+finishQuiz();
+} else {
+state.currentIndex += 1;
+renderQuestion();
+}
+});
+elements.btnQuit.addEventListener('click', () => {
+if (confirm('End the quiz and return to the introduction?')) {
+showScreen('start');
+}
+});
+elements.btnRetake.addEventListener('click', () => {
+prepareQuiz(state.mode);
+});
+elements.btnStart.addEventListener('click', () => {
+prepareQuiz('fixed');
+});
+elements.btnAdaptive.addEventListener('click', () => {
+prepareQuiz('adaptive');
+});
+if (elements.btnDownload) {
+elements.btnDownload.addEventListener('click', () => {
+window.QuizResponses.download(state.attemptRecords);
+});
+}
+if (elements.shareResponses && window.QuizResponses.canShare) {
+elements.shareResponsesInput.checked = window.QuizResponses.optedIn();
+elements.shareResponsesInput.addEventListener('change', () => {
+window.QuizResponses.setOptIn(elements.shareResponsesInput.checked);
+});
+elements.shareResponses.hidden = false;
+}
+markStart('fetch-questions');
+fetch(`${BANK_URL}index.json`, { cache: 'no-cache' })
+.then((response) => {
+if (!response.ok) {
+throw new Error(`HTTP ${response.status}`);
+}
+return response.text();
+})
+.then((text) => {
+measureSince('fetch-questions');
+return timed('parse-questions', () => window.QuizBank.decodeSections(JSON.parse(text)));
+})
+.then((sections) => {
+window.QuizBankCache.sync(sections);
+state.sections = sections;
+elements.questionCount.textContent = String(sections.length);
+elements.btnStart.disabled = false;
+elements.btnAdaptive.disabled = false;
+timed('render-question-bank', renderQuestionBank);
+})
+.catch((error) => {
+console.error('Failed to load the question bank index', error);
+screens.start.innerHTML = `
+        <h2>Quiz unavailable</h2>
+        <p>We couldn't load the question bank. Please refresh the page or try again later.</p>
+        <div class="quiz-actions">
+          <a class="secondary button-like" href="../index.html" role="button">Return home</a>
+        </div>
+      `;
+});
+})();
+(function () {
+const MEASUREMENT_ID = 'G-BN9REN07NH';
+window.dataLayer = window.dataLayer || [];
+window.gtag = function gtag() {
+window.dataLayer.push(arguments);
+};
+window.gtag('js', new Date());
+window.gtag('config', MEASUREMENT_ID);
+function loadTag() {
+const script = document.createElement('script');
+script.async = true;
+script.src = `https://www.googletagmanager.com/gtag/js?id=${MEASUREMENT_ID}`;
+document.head.appendChild(script);
+}
+function scheduleLoad() {
+if ('requestIdleCallback' in window) {
+window.requestIdleCallback(loadTag, { timeout: 3000 });
+} else {
+window.setTimeout(loadTag, 1);
+}
+}
+if (document.readyState === 'complete') {
+scheduleLoad();
+} else {
+window.addEventListener('load', scheduleLoad, { once: true });
+}
+})();
@@ -1,9 +1,4 @@
 (function () {
-  const containers = Array.from(document.querySelectorAll('.chapter-quiz[data-section-id]'));
-  if (!containers.length) {
-    return;
-  }
-
   function shuffle(list) {
     const arr = list.slice();
     for (let i = arr.length - 1; i > 0; i -= 1) {
@@ -240,9 +235,8 @@
 
   function handleData(container, sectionId, data) {
     const app = container.querySelector('.chapter-quiz__app');
-    const sections = Array.isArray(data.sections) ? data.sections : [];
-    const section = sections.find((item) => item.id === sectionId);
-    if (!section || !Array.isArray(section.questions) || !section.questions.length) {
+    const section = { id: sectionId, questions: data.questions };
+    if (!Array.isArray(section.questions) || !section.questions.length) {
       if (app) {
         app.innerHTML = '';
         app.appendChild(createEl('p', 'chapter-quiz__error', 'No quiz questions available yet for this chapter.'));
@@ -252,39 +246,93 @@
     setupQuiz(container, section);
   }
 
-  const dataPromise = fetch('../quiz/questions.json')
-    .then((response) => {
-      if (!response.ok) {
-        throw new Error(`Failed to load questions.json: ${response.status}`);
+  // Same compact encoding as quiz_src/bank.js decodeQuestions():
+  // {"v": 1, "s": [strings], "q": [[prompt, [options], answerIndex, explanation?], ...]}.
+  function decodeQuestions(data) {
+    if (!data || data.v !== 1) {
+      throw new Error(`Unsupported question bank encoding: ${data && data.v}`);
+    }
+    const strings = data.s;
+    return data.q.map((row) => ({
+      prompt: strings[row[0]],
+      options: row[1].map((index) => strings[index]),
+      answerIndex: row[2]
+    }));
+  }
+
+  const dataPromises = new Map();
+  let indexPromise = null;
+
+  // The bank index lists each section's content hash ("h"). Putting it in the
+  // shard URL, as the quiz page does, keeps an edited section from being
+  // served out of a stale HTTP cache entry.
+  function sectionHash(sectionId) {
+    if (!indexPromise) {
+      indexPromise = fetch('../quiz/bank/index.json', { cache: 'no-cache' })
+        .then((response) => (response.ok ? response.json() : null))
+        .catch(() => null);
+    }
+    return indexPromise.then((index) => {
+      if (!index || !index.h) {
+        return null;
       }
-      return response.json();
-    })
-    .catch((error) => {
-      console.error('Failed to fetch chapter quiz data', error);
-      return Promise.reject(error);
+      const position = index.b.findIndex((row) => index.s[row[0]] === sectionId);
+      return position === -1 ? null : index.h[position];
     });
+  }
 
-  containers.forEach((container) => {
-    const sectionId = container.dataset.sectionId;
-    if (!sectionId) {
-      return;
+  // Only this chapter's shard of the bank (see build_question_bank.py).
+  function loadData(sectionId) {
+    if (!dataPromises.has(sectionId)) {
+      const url = `../quiz/bank/${encodeURIComponent(sectionId)}.json`;
+      const promise = sectionHash(sectionId)
+        // Without a hash, at least revalidate the unversioned shard.
+        .then((hash) => (hash ? fetch(`${url}?v=${hash}`) : fetch(url, { cache: 'no-cache' })))
+        .then((response) => {
+          if (!response.ok) {
+            throw new Error(`Failed to load the ${sectionId} questions: ${response.status}`);
+          }
+          return response.json();
+        })
+        .then((data) => ({ questions: decodeQuestions(data) }))
+        .catch((error) => {
+          console.error('Failed to fetch chapter quiz data', error);
+          dataPromises.delete(sectionId);
+          return Promise.reject(error);
+        });
+      dataPromises.set(sectionId, promise);
     }
-    const app = container.querySelector('.chapter-quiz__app');
-    dataPromise
-      .then((data) => {
-        handleData(container, sectionId, data);
-      })
-      .catch(() => {
-        if (app) {
-          app.innerHTML = '';
-          app.appendChild(
-            createEl(
-              'p',
-              'chapter-quiz__error',
-              'We could not load the quiz questions. Please refresh and try again.'
-            )
-          );
-        }
-      });
-  });
+    return dataPromises.get(sectionId);
+  }
+
+  function init() {
+    const containers = Array.from(document.querySelectorAll('.chapter-quiz[data-section-id]'));
+    containers.forEach((container) => {
+      const sectionId = container.dataset.sectionId;
+      if (!sectionId) {
+        return;
+      }
+      const app = container.querySelector('.chapter-quiz__app');
+      loadData(sectionId)
+        .then((data) => {
+          handleData(container, sectionId, data);
+        })
+        .catch(() => {
+          if (app) {
+            app.innerHTML = '';
+            app.appendChild(
+              createEl(
+                'p',
+                'chapter-quiz__error',
+                'We could not load the quiz questions. Please refresh and try again.'
+              )
+            );
+          }
+        });
+    });
+  }
+
+  init();
+  // nav.js swaps chapters in place when fragments are available.
+  document.addEventListener('tutorial:chapterchange', init);
 })();
@@ -1,32 +1,20 @@
 (function () {
-  const chapters = [
-    { slug: 'index', file: 'index.html', title: 'Contents' },
-    { slug: '001-cover', file: '001-cover.html', title: 'Cover' },
-    { slug: '003-introduction', file: '003-introduction.html', title: 'Introduction' },
-    { slug: '004-installation', file: '004-installation.html', title: 'Installation' },
-    { slug: '006-how-the-internet-works', file: '006-how-the-internet-works.html', title: 'How the Internet works' },
-    { slug: '007-introduction-to-command-line', file: '007-introduction-to-command-line.html', title: 'Introduction to command line' },
-    { slug: '008-python-installation', file: '008-python-installation.html', title: 'Python installation' },
-    { slug: '009-code-editor', file: '009-code-editor.html', title: 'Code editor' },
-    { slug: '010-introduction-to-python', file: '010-introduction-to-python.html', title: 'Introduction to Python' },
-    { slug: '011-what-is-django', file: '011-what-is-django.html', title: 'What is Django?' },
-    { slug: '012-django-installation', file: '012-django-installation.html', title: 'Django installation' },
-    { slug: '013-your-first-django-project', file: '013-your-first-django-project.html', title: 'Your first Django project!' },
-    { slug: '014-django-models', file: '014-django-models.html', title: 'Django models' },
-    { slug: '015-django-admin', file: '015-django-admin.html', title: 'Django admin' },
-    { slug: '016-deploy', file: '016-deploy.html', title: 'Deploy!' },
-    { slug: '017-django-urls', file: '017-django-urls.html', title: 'Django URLs' },
-    { slug: '018-django-views-time-to-create', file: '018-django-views-time-to-create.html', title: 'Django views – time to create!' },
-    { slug: '019-introduction-to-html', file: '019-introduction-to-html.html', title: 'Introduction to HTML' },
-    { slug: '020-django-orm-querysets', file: '020-django-orm-querysets.html', title: 'Django ORM (Querysets)' },
-    { slug: '021-dynamic-data-in-templates', file: '021-dynamic-data-in-templates.html', title: 'Dynamic data in templates' },
-    { slug: '022-django-templates', file: '022-django-templates.html', title: 'Django templates' },
-    { slug: '023-css-make-it-pretty', file: '023-css-make-it-pretty.html', title: 'CSS – make it pretty' },
-    { slug: '024-template-extending', file: '024-template-extending.html', title: 'Template extending' },
-    { slug: '025-extend-your-application', file: '025-extend-your-application.html', title: 'Extend your application' },
-    { slug: '026-django-forms', file: '026-django-forms.html', title: 'Django Forms' },
-    { slug: '027-what-s-next', file: '027-what-s-next.html', title: "What's next?" }
-  ];
+  // Written into each page by convert_epub.py as a JSON block, so the
+  // navigation follows whichever tutorial the pages were converted from.
+  function readChapters() {
+    const block = document.getElementById('tutorial-chapters');
+    if (!block) {
+      return [];
+    }
+    try {
+      const list = JSON.parse(block.textContent);
+      return Array.isArray(list) ? list : [];
+    } catch (error) {
+      return [];
+    }
+  }
+
+  const chapters = readChapters();
 
   const icons = {
     menu: '≡',
@@ -36,6 +24,28 @@
     next: '→'
   };
 
+  const canMeasure = Boolean(window.performance && performance.mark && performance.measure);
+
+  // User Timing spans ("nav:<name>"), beaconed by rum.js when it is loaded.
+  function markStart(name) {
+    if (canMeasure) {
+      performance.mark(`nav:${name}:start`);
+    }
+  }
+
+  function measureSince(name) {
+    if (!canMeasure) {
+      return;
+    }
+    const start = `nav:${name}:start`;
+    try {
+      performance.measure(`nav:${name}`, { start, detail: { page: window.location.pathname } });
+    } catch (error) {
+      // Browsers without the options form of measure().
+      performance.measure(`nav:${name}`, start);
+    }
+  }
+
   function createElement(tag, attrs = {}, children = []) {
     const el = document.createElement(tag);
     Object.entries(attrs).forEach(([key, value]) => {
@@ -61,6 +71,10 @@
   }
 
 
+  function createSentinel(className) {
+    return createElement('div', { className: `scroll-sentinel ${className}`, 'aria-hidden': 'true' });
+  }
+
   function attachBackToTop() {
     if (document.querySelector('.back-to-top')) {
       return;
@@ -75,20 +89,163 @@
     button.addEventListener('click', () => {
       window.scrollTo({ top: 0, behavior: 'smooth' });
     });
-    const handleScroll = () => {
-      const doc = document.documentElement;
-      const scrollTop = doc.scrollTop || window.pageYOffset;
-      const scrollHeight = doc.scrollHeight - doc.clientHeight;
-      const nearBottom = scrollHeight > 0 && scrollTop >= scrollHeight - 32;
-      if (scrollTop > 80 || nearBottom) {
-        button.classList.add('visible');
-      } else {
-        button.classList.remove('visible');
+    document.body.appendChild(button);
+
+    if (!('IntersectionObserver' in window)) {
+      let queued = false;
+      const handleScroll = () => {
+        queued = false;
+        const doc = document.documentElement;
+        const scrollTop = doc.scrollTop || window.pageYOffset;
+        const scrollHeight = doc.scrollHeight - doc.clientHeight;
+        const nearBottom = scrollHeight > 0 && scrollTop >= scrollHeight - 32;
+        button.classList.toggle('visible', scrollTop > 80 || nearBottom);
+      };
+      window.addEventListener('scroll', () => {
+        if (!queued) {
+          queued = true;
+          window.requestAnimationFrame(handleScroll);
+        }
+      }, { passive: true });
+      handleScroll();
+      return;
+    }
+
+    // Sentinels replace per-scroll reads of scrollTop/scrollHeight: the observer
+    // reports when the reader passes 80px or reaches the end of the page.
+    const topSentinel = createSentinel('scroll-sentinel--top');
+    const bottomSentinel = createSentinel('scroll-sentinel--bottom');
+    document.body.insertBefore(topSentinel, document.body.firstChild);
+    document.body.appendChild(bottomSentinel);
+
+    const state = { pastTop: false, atBottom: false };
+    const observer = new IntersectionObserver((entries) => {
+      entries.forEach((entry) => {
+        if (entry.target === topSentinel) {
+          state.pastTop = !entry.isIntersecting && entry.boundingClientRect.top < 0;
+        } else {
+          state.atBottom = entry.isIntersecting;
+        }
+      });
+      button.classList.toggle('visible', state.pastTop || state.atBottom);
+    }, { rootMargin: '0px 0px 32px 0px' });
+    observer.observe(topSentinel);
+    observer.observe(bottomSentinel);
+  }
+
+  function attachReadingProgress() {
+    const main = document.querySelector('main');
+    if (!main || document.querySelector('.reading-progress')) {
+      return;
+    }
+    const bar = createElement('div', { className: 'reading-progress', 'aria-hidden': 'true' }, [
+      createElement('div', { className: 'reading-progress__bar' })
+    ]);
+    document.body.insertBefore(bar, document.body.firstChild);
+    const fill = bar.firstChild;
+
+    // Scrollable distance is measured only when the layout changes (ResizeObserver),
+    // so the scroll path reads nothing but scrollY and writes one transform.
+    let scrollable = 1;
+    let queued = false;
+    const measure = () => {
+      scrollable = Math.max(1, document.documentElement.scrollHeight - window.innerHeight);
+    };
+    const paint = () => {
+      queued = false;
+      const progress = Math.min(1, Math.max(0, window.scrollY / scrollable));
+      fill.style.transform = `scaleX(${progress})`;
+    };
+    const schedule = () => {
+      if (!queued) {
+        queued = true;
+        window.requestAnimationFrame(paint);
       }
     };
-    window.addEventListener('scroll', handleScroll, { passive: true });
-    handleScroll();
-    document.body.appendChild(button);
+    if ('ResizeObserver' in window) {
+      new ResizeObserver(() => {
+        measure();
+        schedule();
+      }).observe(document.body);
+    } else {
+      window.addEventListener('resize', () => {
+        measure();
+        schedule();
+      });
+    }
+    measure();
+    window.addEventListener('scroll', schedule, { passive: true });
+    schedule();
+  }
+
+  const POSITION_KEY_PREFIX = 'tutorial-position:';
+  let headingObserver = null;
+
+  function savePosition(slug, headingId) {
+    try {
+      window.localStorage.setItem(`${POSITION_KEY_PREFIX}${slug}`, headingId);
+    } catch (error) {
+      // Private mode or storage disabled: resuming is a nicety, not a requirement.
+    }
+  }
+
+  function loadPosition(slug) {
+    try {
+      return window.localStorage.getItem(`${POSITION_KEY_PREFIX}${slug}`);
+    } catch (error) {
+      return null;
+    }
+  }
+
+  function offerResume(slug) {
+    const previous = document.querySelector('.resume-reading');
+    if (previous) {
+      previous.remove();
+    }
+    const headingId = loadPosition(slug);
+    const heading = headingId ? document.getElementById(headingId) : null;
+    const main = document.querySelector('main');
+    if (!heading || !main || window.location.hash) {
+      return;
+    }
+    const button = createElement('button', { className: 'resume-reading', type: 'button' }, [
+      createElement('span', { className: 'icon', 'aria-hidden': 'true', text: '↓' }),
+      createElement('span', { className: 'label', text: `Continue reading: ${heading.textContent.trim()}` })
+    ]);
+    button.addEventListener('click', () => {
+      heading.scrollIntoView({ behavior: 'smooth', block: 'start' });
+      button.remove();
+    });
+    main.insertBefore(button, main.firstChild);
+  }
+
+  function trackReadingPosition() {
+    const slug = document.body.dataset.chapter;
+    const main = document.querySelector('main');
+    if (headingObserver) {
+      headingObserver.disconnect();
+      headingObserver = null;
+    }
+    if (!slug || slug === 'index' || !main || !('IntersectionObserver' in window)) {
+      return;
+    }
+    offerResume(slug);
+    const headings = Array.from(main.querySelectorAll('h1[id], h2[id], h3[id]'));
+    if (!headings.length) {
+      return;
+    }
+    let saveTimer = null;
+    // A heading becomes current as it crosses into the top 30% of the viewport.
+    headingObserver = new IntersectionObserver((entries) => {
+      const crossing = entries.filter((entry) => entry.isIntersecting);
+      if (!crossing.length) {
+        return;
+      }
+      const current = crossing[crossing.length - 1].target;
+      window.clearTimeout(saveTimer);
+      saveTimer = window.setTimeout(() => savePosition(slug, current.id), 500);
+    }, { rootMargin: '0px 0px -70% 0px' });
+    headings.forEach((heading) => headingObserver.observe(heading));
   }
 
   function buildNav(chapterSlug) {
@@ -197,11 +354,17 @@
     return { nav, panel, toggle };
   }
 
+  function detachNav() {
+    document.querySelectorAll('nav.book-nav, .nav-panel').forEach((el) => el.remove());
+  }
+
   function attachNav() {
     const slug = document.body.dataset.chapter;
     if (!slug) {
       return;
     }
+    // Replace any static navigation (converter output) or a nav from a previous chapter.
+    detachNav();
 
     const header = document.querySelector('header.book-header');
     const main = document.querySelector('main');
@@ -268,9 +431,274 @@
     });
   }
 
+  const fragmentCache = new Map();
+
+  function fragmentsEnabled() {
+    return Boolean(document.body.dataset.fragments) && 'fetch' in window && Boolean(window.history.pushState);
+  }
+
+  function chapterForUrl(url) {
+    if (url.origin !== window.location.origin) {
+      return null;
+    }
+    const dir = window.location.pathname.replace(/[^/]*$/, '');
+    if (!url.pathname.startsWith(dir)) {
+      return null;
+    }
+    const file = url.pathname.slice(dir.length) || 'index.html';
+    return chapters.find((ch) => ch.file === file && ch.slug !== 'index') || null;
+  }
+
+  function fetchFragment(chapter) {
+    if (!fragmentCache.has(chapter.file)) {
+      const request = fetch(`${document.body.dataset.fragments}${chapter.file}`).then((response) => {
+        if (!response.ok) {
+          throw new Error(`Failed to load fragment for ${chapter.file}: ${response.status}`);
+        }
+        return response.text();
+      });
+      request.catch(() => fragmentCache.delete(chapter.file));
+      fragmentCache.set(chapter.file, request);
+    }
+    return fragmentCache.get(chapter.file);
+  }
+
+  const PREFETCH_BUDGET_BYTES = 1500000;
+  const PREFETCH_BUDGET_KEY = 'tutorial-prefetch-bytes';
+  const PREFETCH_IMAGE_COUNT = 2;
+  const prefetched = new Set();
+
+  function prefetchBytesUsed() {
+    try {
+      return Number(window.sessionStorage.getItem(PREFETCH_BUDGET_KEY)) || 0;
+    } catch (error) {
+      return 0;
+    }
+  }
+
+  function recordPrefetchBytes(bytes) {
+    try {
+      window.sessionStorage.setItem(PREFETCH_BUDGET_KEY, String(prefetchBytesUsed() + bytes));
+    } catch (error) {
+      // Storage disabled: the per-page Set still prevents duplicate prefetches.
+    }
+  }
+
+  function prefetchAllowed() {
+    const connection = navigator.connection;
+    if (connection && (connection.saveData || /(^|-)2g$/.test(connection.effectiveType || ''))) {
+      return false;
+    }
+    return prefetchBytesUsed() < PREFETCH_BUDGET_BYTES;
+  }
+
+  function recordEntryBytes(url, fallback) {
+    const entries = window.performance && performance.getEntriesByName ? performance.getEntriesByName(url) : [];
+    const entry = entries[entries.length - 1];
+    recordPrefetchBytes(entry ? entry.transferSize || entry.encodedBodySize || fallback : fallback);
+  }
+
+  function prefetchLink(url, as) {
+    if (prefetched.has(url) || !prefetchAllowed()) {
+      return null;
+    }
+    prefetched.add(url);
+    const link = createElement('link', { rel: 'prefetch', href: url, as });
+    link.addEventListener('load', () => recordEntryBytes(link.href, 0));
+    document.head.appendChild(link);
+    return link;
+  }
+
+  function prefetchImagesFrom(html, baseUrl) {
+    const template = document.createElement('template');
+    template.innerHTML = html;
+    Array.from(template.content.querySelectorAll('img[src]'))
+      .map((img) => img.getAttribute('src'))
+      .filter((src) => src && !src.startsWith('data:'))
+      .slice(0, PREFETCH_IMAGE_COUNT)
+      .forEach((src) => prefetchLink(new URL(src, baseUrl).href, 'image'));
+  }
+
+  function prefetchChapter(chapter, withImages) {
+    if (!chapter || chapter.slug === document.body.dataset.chapter || !prefetchAllowed()) {
+      return;
+    }
+    if (fragmentsEnabled() && chapter.slug !== 'index') {
+      if (prefetched.has(chapter.file)) {
+        return;
+      }
+      prefetched.add(chapter.file);
+      fetchFragment(chapter)
+        .then((html) => {
+          recordEntryBytes(new URL(`${document.body.dataset.fragments}${chapter.file}`, window.location.href).href, html.length);
+          if (withImages) {
+            prefetchImagesFrom(html, window.location.href);
+          }
+        })
+        .catch(() => {});
+      return;
+    }
+    const url = new URL(chapter.file, window.location.href).href;
+    const link = prefetchLink(url, 'document');
+    if (link && withImages) {
+      link.addEventListener('load', () => {
+        // Served from the HTTP cache the prefetch just filled.
+        fetch(url, { cache: 'force-cache', credentials: 'same-origin' })
+          .then((response) => (response.ok ? response.text() : ''))
+          .then((html) => prefetchImagesFrom(html, url))
+          .catch(() => {});
+      });
+    }
+  }
+
+  function prefetchNeighbours(slug) {
+    const index = chapters.findIndex((ch) => ch.slug === slug);
+    prefetchChapter(chapters[index + 1], false);
+    prefetchChapter(chapters[index - 1], false);
+  }
+
+  function onIntentToNavigate(event) {
+    const link = event.target.closest ? event.target.closest('a[href]') : null;
+    if (link) {
+      prefetchChapter(chapterForUrl(new URL(link.href, window.location.href)), false);
+    }
+  }
+
+  function scheduleIdlePrefetch() {
+    const run = () => {
+      const index = chapters.findIndex((ch) => ch.slug === document.body.dataset.chapter);
+      if (index !== -1) {
+        prefetchChapter(chapters[index + 1], true);
+      }
+    };
+    if ('requestIdleCallback' in window) {
+      window.requestIdleCallback(run, { timeout: 5000 });
+    } else {
+      window.setTimeout(run, 2000);
+    }
+  }
+
+  function attachPrefetcher() {
+    if (document.body.dataset.chapter) {
+      // Sequential reading dominates, so warm the next chapter once the page is idle.
+      scheduleIdlePrefetch();
+    }
+    document.addEventListener('mouseover', onIntentToNavigate, { passive: true });
+    document.addEventListener('touchstart', onIntentToNavigate, { passive: true });
+    document.addEventListener('focusin', onIntentToNavigate);
+  }
+
+  function swapChapter(chapter, html, hash) {
+    const template = document.createElement('template');
+    template.innerHTML = html.trim();
+    const article = template.content.querySelector('.chapter-fragment');
+    const main = document.querySelector('main');
+    if (!article || !main) {
+      throw new Error(`Malformed fragment for ${chapter.file}`);
+    }
+    const title = article.dataset.title || chapter.title;
+    main.replaceChildren(...Array.from(article.childNodes));
+    document.title = title;
+    const heading = document.querySelector('header.book-header .page-title');
+    if (heading) {
+      heading.textContent = title;
+    }
+    document.body.dataset.chapter = chapter.slug;
+    attachNav();
+    document.dispatchEvent(new CustomEvent('tutorial:chapterchange', { detail: { chapter } }));
+    scheduleIdlePrefetch();
+
+    const target = hash ? document.getElementById(decodeURIComponent(hash.slice(1))) : null;
+    if (target) {
+      target.scrollIntoView();
+    } else {
+      window.scrollTo(0, 0);
+    }
+    prefetchNeighbours(chapter.slug);
+  }
+
+  function navigateTo(chapter, hash, mode) {
+    const url = `${chapter.file}${hash || ''}`;
+    markStart('swap-chapter');
+    return fetchFragment(chapter)
+      .then((html) => {
+        if (mode === 'push') {
+          window.history.pushState({ chapter: chapter.slug }, '', url);
+        } else if (mode === 'replace') {
+          window.history.replaceState({ chapter: chapter.slug }, '', url);
+        }
+        swapChapter(chapter, html, hash);
+        measureSince('swap-chapter');
+      })
+      .catch((error) => {
+        console.error(error);
+        // Full pages are always published, so fall back to a normal load.
+        if (mode === 'push') {
+          window.location.assign(url);
+        } else {
+          window.location.replace(url);
+        }
+      });
+  }
+
+  function onLinkClick(event) {
+    if (event.defaultPrevented || event.button !== 0 || event.metaKey || event.ctrlKey || event.shiftKey || event.altKey) {
+      return;
+    }
+    const link = event.target.closest('a[href]');
+    if (!link || (link.target && link.target !== '_self') || link.hasAttribute('download')) {
+      return;
+    }
+    const url = new URL(link.href, window.location.href);
+    const chapter = chapterForUrl(url);
+    if (!chapter || chapter.slug === document.body.dataset.chapter) {
+      return;
+    }
+    event.preventDefault();
+    navigateTo(chapter, url.hash, 'push');
+  }
+
+  function onPopState() {
+    const chapter = chapterForUrl(new URL(window.location.href));
+    if (!chapter) {
+      window.location.reload();
+    } else if (chapter.slug !== document.body.dataset.chapter) {
+      navigateTo(chapter, window.location.hash, 'none');
+    }
+  }
+
+  function attachFragmentRouting() {
+    if (!fragmentsEnabled()) {
+      return;
+    }
+    document.addEventListener('click', onLinkClick);
+    window.addEventListener('popstate', onPopState);
+
+    const shellDefault = document.body.dataset.shell;
+    if (shellDefault) {
+      // reader.html: pick the chapter from ?chapter=<slug>, then take over its real URL.
+      const requested = new URLSearchParams(window.location.search).get('chapter');
+      const chapter =
+        chapters.find((ch) => ch.slug === requested && ch.slug !== 'index') ||
+        chapters.find((ch) => ch.file === shellDefault) ||
+        chapters.find((ch) => ch.slug !== 'index');
+      navigateTo(chapter, window.location.hash, 'replace');
+      return;
+    }
+    window.history.replaceState({ chapter: document.body.dataset.chapter }, '');
+    prefetchNeighbours(document.body.dataset.chapter);
+  }
+
   function init() {
+    markStart('setup');
     attachNav();
     attachBackToTop();
+    attachReadingProgress();
+    trackReadingPosition();
+    document.addEventListener('tutorial:chapterchange', trackReadingPosition);
+    attachFragmentRouting();
+    attachPrefetcher();
+    measureSince('setup');
   }
 
   if (document.readyState === 'loading') {
@@ -0,0 +1,76 @@
+(function () {
+  // Real-user timings: pages record performance.measure() entries named
+  // "quiz:*" or "nav:*"; this script beacons them, with the navigation
+  // timings, to the collector when the page is hidden. No endpoint, no beacon
+  // (the measures still show up in the browser's performance panel).
+  const ENDPOINT = '';
+  const SAMPLE_RATE = 1;
+  const PREFIXES = ['quiz:', 'nav:'];
+
+  const meta = document.querySelector('meta[name="rum-endpoint"]');
+  const endpoint = meta ? meta.content : ENDPOINT;
+  if (!endpoint || !window.performance || !navigator.sendBeacon || Math.random() >= SAMPLE_RATE) {
+    return;
+  }
+
+  const sent = new Set();
+  let navigationSent = false;
+
+  function connectionType() {
+    const connection = navigator.connection;
+    return (connection && connection.effectiveType) || 'unknown';
+  }
+
+  function round(value) {
+    return Math.round(value * 10) / 10;
+  }
+
+  function navigationMetrics() {
+    const entry = performance.getEntriesByType('navigation')[0];
+    if (!entry || navigationSent || !entry.loadEventEnd) {
+      return [];
+    }
+    navigationSent = true;
+    const page = window.location.pathname;
+    return [
+      { name: 'page:ttfb', page, duration: round(entry.responseStart - entry.startTime) },
+      { name: 'page:dom-content-loaded', page, duration: round(entry.domContentLoadedEventEnd - entry.startTime) },
+      { name: 'page:load', page, duration: round(entry.loadEventEnd - entry.startTime) },
+    ];
+  }
+
+  function measureMetrics() {
+    const metrics = [];
+    performance.getEntriesByType('measure').forEach((entry) => {
+      const key = `${entry.name}@${entry.startTime}`;
+      if (sent.has(key) || !PREFIXES.some((prefix) => entry.name.startsWith(prefix))) {
+        return;
+      }
+      sent.add(key);
+      metrics.push({
+        name: entry.name,
+        // Chapters swapped in by nav.js record the page they belong to.
+        page: (entry.detail && entry.detail.page) || window.location.pathname,
+        duration: round(entry.duration),
+      });
+    });
+    return metrics;
+  }
+
+  function flush() {
+    const metrics = navigationMetrics().concat(measureMetrics());
+    if (!metrics.length) {
+      return;
+    }
+    const payload = JSON.stringify({ connection: connectionType(), metrics });
+    // text/plain keeps the beacon a "simple" request, so no CORS preflight.
+    navigator.sendBeacon(endpoint, new Blob([payload], { type: 'text/plain' }));
+  }
+
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') {
+      flush();
+    }
+  });
+  window.addEventListener('pagehide', flush);
+})();
@@ -1,8 +1,4 @@
 (function () {
-  if (document.body.dataset.chapter === "index") {
-    return;
-  }
-
   const slugCache = new Set();
 
   function slugify(text) {
@@ -22,6 +18,15 @@
   }
 
   function buildTOC() {
+    const previous = document.querySelector(".page-toc");
+    if (previous) {
+      previous.remove();
+    }
+    slugCache.clear();
+    if (document.body.dataset.chapter === "index") {
+      return;
+    }
+
     const main = document.querySelector("main");
     if (!main) {
       return;
@@ -114,4 +119,5 @@
   } else {
     buildTOC();
   }
+  document.addEventListener("tutorial:chapterchange", buildTOC);
 })();
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""Item analysis of captured quiz answers: difficulty, discrimination and distractors.
+
+The input is the JSONL that ``quiz_src/responses.js`` posts or downloads, one
+record per answered question (plain or ``.gz``, any number of files). Records
+are parsed in chunks into NumPy columns and every statistic is a grouped sum
+over those columns, so a year of logs needs one pass and a few arrays of ints.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import gzip
+import json
+import math
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from bank_validation import Issue
+from question_bank import QuestionBank
+
+try:  # Only the analysis needs NumPy; flag_questions() works without it.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+REPORT = Path("item_analysis.json")
+OPTION_COUNT = 4
+CHUNK_RECORDS = 1 << 16
+MIN_RESPONSES = 30
+# Proportion correct above which a question teaches nothing, and below which
+# (chance is 1 in 4) it is more likely broken than hard.
+EASY_ABOVE = 0.95
+HARD_BELOW = 0.25
+# Point-biserial correlation with the rest of the attempt.
+DISCRIMINATION_BELOW = 0.1
+# logit(p) of a Rasch item over N(0, 1) abilities shrinks by about
+# sqrt(1 + pi / 8); multiplying by it recovers the item's difficulty.
+RASCH_SCALE = math.sqrt(1 + math.pi / 8)
+
+ItemKey = Tuple[str, int, str]  # section id, question number, prompt hash
+FIELDS = ("attempt", "section", "question", "prompt", "answer", "selected")
+
+
+@dataclass
+class Responses:
+    """One row per answered question; ``item`` and ``attempt`` index ``items``/attempt ids."""
+
+    items: List[ItemKey]
+    attempts: int
+    item: "np.ndarray"
+    attempt: "np.ndarray"
+    answer: "np.ndarray"
+    selected: "np.ndarray"
+    skipped: int = 0
+
+    def __len__(self) -> int:
+        return len(self.item)
+
+
+def read_lines(paths: Iterable[Path]) -> Iterator[str]:
+    for path in paths:
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield line
+
+
+def parse_lines(lines: List[str]) -> List[object]:
+    # raw_decode skips json.loads' whitespace handling, a third of its time here.
+    decode = json.JSONDecoder().raw_decode
+    records: List[object] = []
+    for line in lines:
+        try:
+            records.append(decode(line)[0])
+        except ValueError:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                records.append(None)
+    return records
+
+
+def field_columns(records: List[object]) -> List[List[object]]:
+    """One list per entry of ``FIELDS``, for the records that have all of them."""
+    try:
+        # Column by column in C; almost every chunk is well-formed.
+        return [list(map(itemgetter(field), records)) for field in FIELDS]
+    except (KeyError, TypeError):
+        pass
+    get = itemgetter(*FIELDS)
+    rows = []
+    for record in records:
+        try:
+            rows.append(get(record))
+        except (KeyError, TypeError):
+            continue
+    return [[row[position] for row in rows] for position in range(len(FIELDS))]
+
+
+def read_responses(paths: Iterable[Path]) -> Responses:
+    item_ids: Dict[ItemKey, int] = {}
+    attempt_ids: Dict[str, int] = {}
+    columns: List[Tuple["np.ndarray", ...]] = []
+    read = 0
+
+    def convert(lines: List[str]) -> None:
+        attempts, sections, questions, prompts, answers, selected = field_columns(parse_lines(lines))
+        numbers = np.array(
+            [[value if type(value) is int else -1 for value in column] for column in (questions, answers, selected)],
+            dtype=np.int64,
+        ).reshape(3, -1)
+        valid = (numbers[0] >= 0) & (numbers[1:] >= 0).all(axis=0) & (numbers[1:] < OPTION_COUNT).all(axis=0)
+        keep = np.flatnonzero(valid).tolist()
+        if len(keep) < len(valid):
+            attempts, sections, prompts = ([column[index] for index in keep] for column in (attempts, sections, prompts))
+            numbers = numbers[:, valid]
+        keys = zip(map(str, sections), numbers[0].tolist(), map(str, prompts))
+        item = np.fromiter((item_ids.setdefault(key, len(item_ids)) for key in keys), np.int32, len(keep))
+        attempt = np.fromiter(
+            (attempt_ids.setdefault(key, len(attempt_ids)) for key in map(str, attempts)), np.int32, len(keep)
+        )
+        columns.append((item, attempt, numbers[1].astype(np.int8), numbers[2].astype(np.int8)))
+
+    # The parsed records hold no cycles, and the collector would otherwise walk
+    # each chunk's dicts over and over: a third of the run time.
+    collecting = gc.isenabled()
+    gc.disable()
+    try:
+        chunk: List[str] = []
+        for line in read_lines(paths):
+            read += 1
+            chunk.append(line)
+            if len(chunk) == CHUNK_RECORDS:
+                convert(chunk)
+                chunk = []
+        convert(chunk)
+    finally:
+        if collecting:
+            gc.enable()
+
+    item, attempt, answer, selected = (np.concatenate(column) for column in zip(*columns))
+    return Responses(list(item_ids), len(attempt_ids), item, attempt, answer, selected, read - len(item))
+
+
+def analyse(responses: Responses) -> Dict[str, "np.ndarray"]:
+    """Per-item statistics as arrays indexed like ``responses.items``."""
+    items = len(responses.items)
+    item = responses.item
+    correct = (responses.selected == responses.answer).astype(np.float64)
+
+    counts = np.bincount(item, minlength=items)
+    difficulty = np.bincount(item, weights=correct, minlength=items) / np.maximum(counts, 1)
+
+    # Discrimination: point-biserial correlation between answering this item
+    # correctly and the share of the attempt's *other* questions answered
+    # correctly, from grouped sums instead of one correlation per item.
+    sizes = np.bincount(responses.attempt, minlength=responses.attempts)[responses.attempt]
+    scores = np.bincount(responses.attempt, weights=correct, minlength=responses.attempts)[responses.attempt]
+    usable = sizes > 1
+    rest = np.where(usable, (scores - correct) / np.maximum(sizes - 1, 1), 0.0)
+    weight = usable.astype(np.float64)
+    n = np.bincount(item, weights=weight, minlength=items)
+    sum_c = np.bincount(item, weights=correct * weight, minlength=items)
+    sum_x = np.bincount(item, weights=rest * weight, minlength=items)
+    sum_xx = np.bincount(item, weights=rest * rest * weight, minlength=items)
+    sum_cx = np.bincount(item, weights=correct * rest * weight, minlength=items)
+    covariance = n * sum_cx - sum_c * sum_x
+    spread = (n * sum_c - sum_c * sum_c) * (n * sum_xx - sum_x * sum_x)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        discrimination = np.where(spread > 0, covariance / np.sqrt(spread), np.nan)
+
+    choices = np.bincount(
+        item.astype(np.int64) * OPTION_COUNT + responses.selected, minlength=items * OPTION_COUNT
+    ).reshape(items, OPTION_COUNT)
+    answers = np.zeros(items, dtype=np.int8)
+    answers[item] = responses.answer
+    return {
+        "responses": counts,
+        "difficulty": difficulty,
+        "discrimination": discrimination,
+        "option_rates": choices / np.maximum(counts, 1)[:, None],
+        "answer": answers,
+    }
+
+
+def item_flags(stats: Dict[str, "np.ndarray"], index: int, min_responses: int) -> List[str]:
+    if stats["responses"][index] < min_responses:
+        return []
+    flags: List[str] = []
+    difficulty = stats["difficulty"][index]
+    discrimination = stats["discrimination"][index]
+    rates = stats["option_rates"][index]
+    answer = stats["answer"][index]
+    if difficulty > EASY_ABOVE:
+        flags.append("too-easy")
+    if difficulty < HARD_BELOW:
+        flags.append("too-hard")
+    if not np.isnan(discrimination) and discrimination < DISCRIMINATION_BELOW:
+        flags.append("low-discrimination")
+    # A distractor picked more often than the key, by more than sampling noise
+    # (two standard errors of the count difference): often a wrong answerIndex.
+    chosen = rates * stats["responses"][index]
+    distractor = np.delete(chosen, answer).max()
+    if distractor - chosen[answer] > 2 * np.sqrt(distractor + chosen[answer]):
+        flags.append("distractor-beats-answer")
+    return flags
+
+
+def build_report(responses: Responses, min_responses: int = MIN_RESPONSES) -> Dict[str, object]:
+    stats = analyse(responses)
+    sections: Dict[str, List[Dict[str, object]]] = {}
+    for index, (section_id, number, prompt) in enumerate(responses.items):
+        discrimination = stats["discrimination"][index]
+        sections.setdefault(section_id, []).append(
+            {
+                "question": number,
+                "prompt": prompt,
+                "responses": int(stats["responses"][index]),
+                "difficulty": round(float(stats["difficulty"][index]), 4),
+                "discrimination": None if np.isnan(discrimination) else round(float(discrimination), 4),
+                "answer": int(stats["answer"][index]),
+                # Selection rate of every option, by its index in the bank.
+                "optionRates": [round(float(rate), 4) for rate in stats["option_rates"][index]],
+                "flags": item_flags(stats, index, min_responses),
+            }
+        )
+    report_sections = []
+    for section_id in sorted(sections):
+        questions = sorted(sections[section_id], key=lambda entry: (entry["question"], entry["prompt"]))
+        answered = sum(entry["responses"] for entry in questions)
+        correct = sum(entry["responses"] * entry["difficulty"] for entry in questions)
+        report_sections.append(
+            {
+                "id": section_id,
+                "responses": answered,
+                "difficulty": round(correct / answered, 4) if answered else None,
+                "questions": questions,
+            }
+        )
+    return {
+        "generated": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "records": len(responses),
+        "skipped": responses.skipped,
+        "attempts": responses.attempts,
+        "minResponses": min_responses,
+        "sections": report_sections,
+    }
+
+
+def flag_questions(report: Dict[str, object], bank: QuestionBank) -> List[Issue]:
+    """Warnings for flagged questions that are still in the bank unchanged."""
+    issues: List[Issue] = []
+    for section in report.get("sections", []):
+        for entry in section["questions"]:
+            if entry["flags"] and bank.find(section["id"], entry["question"], entry["prompt"]):
+                discrimination = entry["discrimination"]
+                detail = f"p={entry['difficulty']:.2f}, r={'n/a' if discrimination is None else f'{discrimination:.2f}'}"
+                issues.append(
+                    Issue(
+                        "warning",
+                        f"{section['id']}#{entry['question']}",
+                        f"{', '.join(entry['flags'])} ({detail}, {entry['responses']} responses)",
+                    )
+                )
+    return issues
+
+
+def rasch_difficulty(proportion_correct: float) -> float:
+    """Difficulty in logits of a question that this share of coaches answers correctly."""
+    proportion = min(max(proportion_correct, 0.02), 0.98)
+    return round(-math.log(proportion / (1 - proportion)) * RASCH_SCALE, 2)
+
+
+def calibrated_difficulties(report: Dict[str, object] | None, bank: QuestionBank) -> List[List[float | None]]:
+    """Per section, each question's difficulty for the adaptive quiz.
+
+    Estimated from the report once a question has ``minResponses`` answers,
+    otherwise the ``difficulty`` set in its data file, otherwise ``None``
+    (the quiz treats it as 0).
+    """
+    measured: Dict[ItemKey, float] = {}
+    if report is not None:
+        for section in report.get("sections", []):
+            for entry in section["questions"]:
+                if entry["responses"] >= report.get("minResponses", MIN_RESPONSES):
+                    measured[(section["id"], entry["question"], entry["prompt"])] = rasch_difficulty(entry["difficulty"])
+    return [
+        [
+            measured.get((question.section, question.number, question.prompt_hash), question.difficulty)
+            for question in bank.section_questions(section.id)
+        ]
+        for section in bank.sections
+    ]
+
+
+def load_report(path: Path) -> Dict[str, object] | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("logs", type=Path, nargs="+", help="JSONL response logs (.jsonl or .jsonl.gz).")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=REPORT,
+        help=f"Where to write the report (default: {REPORT}).",
+    )
+    parser.add_argument(
+        "--min-responses",
+        type=int,
+        default=MIN_RESPONSES,
+        help=f"Responses a question needs before it is flagged (default: {MIN_RESPONSES}).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    if np is None:
+        raise SystemExit("item_analysis.py needs NumPy: pip install numpy")
+    started = time.perf_counter()
+    responses = read_responses(args.logs)
+    report = build_report(responses, args.min_responses)
+    elapsed = time.perf_counter() - started
+    args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    flagged = sum(bool(entry["flags"]) for section in report["sections"] for entry in section["questions"])
+    if responses.skipped:
+        print(f"Skipped {responses.skipped} malformed records", file=sys.stderr)
+    print(
+        f"Analysed {len(responses)} responses from {responses.attempts} attempts in {elapsed:.2f}s; "
+        f"{flagged} of {len(responses.items)} questions flagged"
+    )
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
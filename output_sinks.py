@@ -0,0 +1,289 @@
+"""Output sinks the converter writes generated files through."""
+
+from __future__ import annotations
+
+import io
+import os
+import posixpath
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Set
+
+from deploy_manifest import Manifest, manifest_entry
+
+# Formats that are already compressed; deflating them again only costs CPU.
+STORED_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".woff", ".woff2", ".zip", ".gz", ".br")
+
+TAR_MODES = {
+    ".tar": "w|",
+    ".tar.gz": "w|gz",
+    ".tgz": "w|gz",
+    ".tar.bz2": "w|bz2",
+    ".tar.xz": "w|xz",
+}
+
+
+def normalize_output_path(path: str) -> str:
+    normalized = posixpath.normpath(path.replace("\\", "/"))
+    if normalized.startswith(("/", "../")) or normalized in (".", "..", ""):
+        raise ValueError(f"Refusing to write outside the output root: {path!r}")
+    return normalized
+
+
+class OutputSink:
+    """Receives generated files by POSIX path relative to the output root.
+
+    Every write is recorded in ``manifest`` (size and content hash) so the
+    deploy manifest can be produced without reading the files back, and the
+    time the caller spent inside writes is accumulated in ``blocked_seconds``.
+    """
+
+    # Whether _write may be called from several threads at once.
+    concurrent_writes = True
+
+    def __init__(self) -> None:
+        self.manifest: Manifest = {}
+        self.blocked_seconds = 0.0
+
+    def __enter__(self) -> "OutputSink":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        """Release resources after a failed build; defaults to ``close``."""
+        self.close()
+
+    def write_bytes(self, path: str, data: bytes) -> None:
+        path = normalize_output_path(path)
+        self.manifest[path] = manifest_entry(data)
+        started = time.perf_counter()
+        self._write(path, data)
+        self.blocked_seconds += time.perf_counter() - started
+
+    def write_text(self, path: str, text: str) -> None:
+        self.write_bytes(path, text.encode("utf-8"))
+
+    def _write(self, path: str, data: bytes) -> None:
+        raise NotImplementedError
+
+
+class DirectorySink(OutputSink):
+    """Write files below a directory on disk.
+
+    Files are replaced atomically (temporary file plus rename) and left alone
+    when their bytes are unchanged. With ``force`` an existing directory is
+    updated in place and files that were not written again are removed on
+    close, so the result matches a clean rebuild without rewriting
+    everything.
+    """
+
+    def __init__(self, root: Path, force: bool = False) -> None:
+        super().__init__()
+        self.root = root
+        self.force = force
+        self.written = 0
+        self.unchanged = 0
+        self._seen: Set[str] = set()
+        self._prune_stale = False
+        self._lock = threading.Lock()
+
+    def open(self) -> None:
+        if self.root.exists():
+            if not self.force:
+                raise SystemExit(
+                    f"Output directory {self.root} already exists. Use --force to overwrite."
+                )
+            self._prune_stale = True
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def close(self) -> None:
+        if self._prune_stale:
+            self.remove_stale()
+
+    def abort(self) -> None:
+        # Never prune after a failed build: most files were not rewritten yet.
+        pass
+
+    def remove_stale(self) -> None:
+        for path in sorted(self.root.rglob("*"), reverse=True):
+            relative = path.relative_to(self.root).as_posix()
+            if path.is_dir():
+                if not any(path.iterdir()):
+                    path.rmdir()
+            elif relative not in self._seen:
+                path.unlink()
+
+    def _write(self, path: str, data: bytes) -> None:
+        target = self.root / path
+        with self._lock:
+            self._seen.add(path)
+        if target.is_file() and target.stat().st_size == len(data) and target.read_bytes() == data:
+            with self._lock:
+                self.unchanged += 1
+            return
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            temporary.write_bytes(data)
+            os.replace(temporary, target)
+        finally:
+            if temporary.exists():
+                temporary.unlink()
+        with self._lock:
+            self.written += 1
+
+
+class MemorySink(OutputSink):
+    """Keep every file in a path -> bytes mapping, for embedding and tests."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.files: Dict[str, bytes] = {}
+
+    def _write(self, path: str, data: bytes) -> None:
+        self.files[path] = data
+
+
+class ArchiveSink(OutputSink):
+    """Stream files into a zip or tar archive without staging them on disk.
+
+    The format follows the target suffix (``.zip``, ``.tar``, ``.tar.gz``,
+    ``.tgz``, ``.tar.bz2``, ``.tar.xz``). Use ``-`` together with ``fmt`` to
+    stream to standard output.
+    """
+
+    concurrent_writes = False
+
+    def __init__(self, target: Path | str, fmt: str | None = None, prefix: str = "") -> None:
+        super().__init__()
+        self.target = str(target)
+        self.fmt = fmt or archive_format(self.target)
+        self.prefix = prefix.strip("/")
+        self._stream: BinaryIO | None = None
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._mtime = time.time()
+
+    def open(self) -> None:
+        if self.target == "-":
+            stream = sys.stdout.buffer
+        else:
+            Path(self.target).parent.mkdir(parents=True, exist_ok=True)
+            stream = open(self.target, "wb")
+        self._stream = stream
+        if self.fmt == ".zip":
+            self._zip = zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._tar = tarfile.open(fileobj=stream, mode=TAR_MODES[self.fmt])
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+        if self._tar is not None:
+            self._tar.close()
+            self._tar = None
+        if self._stream is not None and self._stream is not sys.stdout.buffer:
+            self._stream.close()
+        self._stream = None
+
+    def _write(self, path: str, data: bytes) -> None:
+        name = f"{self.prefix}/{path}" if self.prefix else path
+        if self._zip is not None:
+            compression = zipfile.ZIP_STORED if path.lower().endswith(STORED_SUFFIXES) else zipfile.ZIP_DEFLATED
+            self._zip.writestr(name, data, compress_type=compression)
+        elif self._tar is not None:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = self._mtime
+            info.mode = 0o644
+            self._tar.addfile(info, io.BytesIO(data))
+        else:
+            raise RuntimeError("ArchiveSink used before open().")
+
+
+class WriteBehindSink(OutputSink):
+    """Hand writes to a pool of writer threads through a bounded queue.
+
+    The caller only blocks when ``max_pending`` writes are already queued, so
+    parsing and rendering overlap with disk I/O. ``blocked_seconds`` counts the
+    time spent waiting for a free slot and for the final flush on close.
+    """
+
+    def __init__(self, inner: OutputSink, workers: int = 4, max_pending: int = 32) -> None:
+        super().__init__()
+        self.inner = inner
+        # Sinks that serialize into one stream keep their order with a single writer.
+        self.workers = workers if inner.concurrent_writes else 1
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: List[Future] = []
+
+    def open(self) -> None:
+        self.inner.open()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sink-writer")
+
+    def close(self) -> None:
+        started = time.perf_counter()
+        try:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            self._raise_errors()
+        except BaseException:
+            self.inner.abort()
+            raise
+        finally:
+            self.blocked_seconds += time.perf_counter() - started
+        self.inner.close()
+
+    def abort(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self.inner.abort()
+
+    def _raise_errors(self) -> None:
+        pending: List[Future] = []
+        for future in self._futures:
+            if not future.done():
+                pending.append(future)
+            elif future.exception() is not None:
+                raise future.exception()
+        self._futures = pending
+
+    def _write(self, path: str, data: bytes) -> None:
+        if self._executor is None:
+            raise RuntimeError("WriteBehindSink used before open().")
+        self._raise_errors()
+        self._slots.acquire()
+        future = self._executor.submit(self.inner._write, path, data)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._futures.append(future)
+
+
+def archive_format(target: str) -> str:
+    lowered = target.lower()
+    if lowered.endswith(".zip"):
+        return ".zip"
+    for suffix in sorted(TAR_MODES, key=len, reverse=True):
+        if lowered.endswith(suffix):
+            return suffix
+    raise ValueError(f"Cannot infer archive format from {target!r}; use .zip, .tar, .tar.gz, .tgz, .tar.bz2 or .tar.xz.")
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""Indexed, read-only view of the question bank for tools and servers.
+
+``QuestionBank`` keeps every question as a small ``__slots__`` record in one
+list, sections as slices of it, and dict indexes by section id, stable
+question id and prompt hash, so lookups never walk the bank. Per-section
+counts and the tables for sampling questions are computed once when the bank
+is loaded.
+
+A question's stable id is ``<section id>/<prompt hash>``: it survives
+reordering a section and changes when the prompt is reworded. The prompt hash
+is the one ``quiz_src/responses.js`` sends with every captured answer.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence
+
+OUTPUT = Path("docs/quiz/questions.json")
+
+
+def prompt_hash(text: str) -> str:
+    """32-bit FNV-1a of the UTF-8 prompt, matching ``promptHash`` in responses.js."""
+    value = 0x811C9DC5
+    for byte in text.encode("utf-8"):
+        value = ((value ^ byte) * 0x01000193) & 0xFFFFFFFF
+    return f"{value:08x}"
+
+
+def prompt_hashes(prompts: Sequence[str]) -> List[str]:
+    """``prompt_hash`` of every prompt, a byte column at a time across all of them with NumPy."""
+    if len(prompts) < 256:
+        return [prompt_hash(prompt) for prompt in prompts]
+    try:  # Optional, and imported only for banks this size.
+        import numpy as np
+    except ImportError:  # pragma: no cover - depends on the environment
+        return [prompt_hash(prompt) for prompt in prompts]
+    encoded = [prompt.encode("utf-8") for prompt in prompts]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    width = int(lengths.max())
+    data = np.frombuffer(b"".join(item.ljust(width, b"\0") for item in encoded), dtype=np.uint8)
+    data = data.reshape(len(encoded), width)
+    values = np.full(len(encoded), 0x811C9DC5, dtype=np.uint64)
+    for column in range(width):
+        active = lengths > column
+        values[active] = ((values[active] ^ data[active, column]) * 0x01000193) & 0xFFFFFFFF
+    return [f"{value:08x}" for value in values.tolist()]
+
+
+class Question:
+    __slots__ = ("id", "section", "number", "prompt", "prompt_hash", "options", "answer_index", "explanation", "difficulty", "anchor")
+
+    def __init__(
+        self, section: str, number: int, raw: Dict[str, object], hashed: str, difficulty: float | None = None
+    ) -> None:
+        self.section = section
+        self.number = number
+        self.prompt = raw["prompt"]
+        self.prompt_hash = hashed
+        self.id = f"{section}/{self.prompt_hash}"
+        # Options such as "True" or "None of the above" repeat across the bank.
+        self.options = tuple(sys.intern(option) for option in raw["options"])
+        self.answer_index = raw["answerIndex"]
+        self.explanation = raw.get("explanation")
+        # From the data file, else the compact bank's "d" (None where it recorded none).
+        self.difficulty = raw.get("difficulty", difficulty)
+        self.anchor = raw.get("anchor")
+
+    @property
+    def answer(self) -> str:
+        return self.options[self.answer_index]
+
+    def as_dict(self) -> Dict[str, object]:
+        """The question as it appears in ``questions.json``."""
+        from build_question_bank import q
+
+        return q(self.prompt, list(self.options), self.answer_index, self.explanation, self.difficulty, self.anchor)
+
+    def __repr__(self) -> str:
+        return f"Question({self.id!r}, number={self.number})"
+
+
+class Section:
+    __slots__ = ("id", "title", "tutorial_path", "start", "count")
+
+    def __init__(self, section_id: str, title: str, tutorial_path: str, start: int, count: int) -> None:
+        self.id = section_id
+        self.title = title
+        self.tutorial_path = tutorial_path
+        self.start = start  # position of the section's first question in QuestionBank.questions
+        self.count = count
+
+    def __repr__(self) -> str:
+        return f"Section({self.id!r}, count={self.count})"
+
+
+class QuestionBank:
+    """The bank as flat records with O(1) lookups; build it from section dicts or load the generated JSON."""
+
+    def __init__(self, sections: Iterable[Dict[str, object]]) -> None:
+        self.sections: List[Section] = []
+        self.questions: List[Question] = []
+        self._sections: Dict[str, Section] = {}
+        self._ids: Dict[str, Question] = {}
+        self._prompts: Dict[str, List[Question]] = {}
+        sections = list(sections)
+        missing = [raw["id"] for raw in sections if "questions" not in raw]
+        if missing:
+            raise ValueError(f"Section {missing[0]!r} has no questions (bank/index.json only lists them)")
+        hashes = iter(prompt_hashes([item["prompt"] for raw in sections for item in raw["questions"]]))
+        # Duplicate ids are bank_validation's to report; the first one is indexed.
+        for raw in sections:
+            difficulties = raw.get("difficulties") or ()
+            section = Section(raw["id"], raw["title"], raw["tutorialPath"], len(self.questions), len(raw["questions"]))
+            for number, item in enumerate(raw["questions"]):
+                question = Question(section.id, number, item, next(hashes), difficulties[number] if difficulties else None)
+                self.questions.append(question)
+                self._ids.setdefault(question.id, question)
+                self._prompts.setdefault(question.prompt_hash, []).append(question)
+            self.sections.append(section)
+            self._sections.setdefault(section.id, section)
+        self.counts = tuple(section.count for section in self.sections)
+        # Sampling tables: the non-empty sections, and cumulative weights that
+        # give every section the same share whatever its size.
+        self._sampled_sections = [section for section in self.sections if section.count]
+        self._section_weights = list(
+            accumulate(1 / section.count for section in self.sections for _ in range(section.count))
+        )
+
+    @classmethod
+    def load(cls, path: Path = OUTPUT) -> "QuestionBank":
+        """Load ``questions.json`` or the compact ``questions.min.json``."""
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if "v" in data:
+            from build_question_bank import decode_sections
+
+            return cls(decode_sections(data))
+        return cls(data["sections"])
+
+    @classmethod
+    def from_source(cls) -> "QuestionBank":
+        """The bank compiled from ``questions/``."""
+        from build_question_bank import load_bank
+
+        return cls(load_bank())
+
+    def __len__(self) -> int:
+        return len(self.questions)
+
+    def __iter__(self) -> Iterator[Question]:
+        return iter(self.questions)
+
+    def __contains__(self, question_id: object) -> bool:
+        return question_id in self._ids
+
+    def section(self, section_id: str) -> Section:
+        return self._sections[section_id]
+
+    def section_questions(self, section_id: str) -> List[Question]:
+        section = self._sections[section_id]
+        return self.questions[section.start : section.start + section.count]
+
+    def get(self, question_id: str) -> Question | None:
+        return self._ids.get(question_id)
+
+    def by_prompt_hash(self, value: str) -> List[Question]:
+        return list(self._prompts.get(value, ()))
+
+    def by_prompt(self, prompt: str) -> List[Question]:
+        """Questions with exactly this prompt (the hash alone can collide)."""
+        return [question for question in self._prompts.get(prompt_hash(prompt), ()) if question.prompt == prompt]
+
+    def find(self, section_id: str, number: int, value: str) -> Question | None:
+        """The question a captured answer refers to, or None if it has changed since."""
+        section = self._sections.get(section_id)
+        if section is None or not 0 <= number < section.count:
+            return None
+        question = self.questions[section.start + number]
+        return question if question.prompt_hash == value else None
+
+    def sample_quiz(self, rng: random.Random | None = None) -> List[Question]:
+        """One random question per section, like the quiz page."""
+        rng = rng or random
+        return [self.questions[section.start + rng.randrange(section.count)] for section in self._sampled_sections]
+
+    def sample(self, k: int, rng: random.Random | None = None, per_section: bool = True) -> List[Question]:
+        """``k`` questions drawn with replacement, each section equally likely unless ``per_section`` is off."""
+        rng = rng or random
+        if not self.questions:
+            return []
+        if per_section:
+            return rng.choices(self.questions, cum_weights=self._section_weights, k=k)
+        return rng.choices(self.questions, k=k)
+
+
+def show(questions: Sequence[Question]) -> None:
+    for question in questions:
+        print(f"{question.id}\t#{question.number}\t{question.prompt}\t-> {question.answer}")
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "bank",
+        nargs="?",
+        type=Path,
+        default=OUTPUT,
+        help=f"questions.json or questions.min.json to load (default: {OUTPUT}).",
+    )
+    parser.add_argument("--find", metavar="KEY", action="append", default=[], help="Show the question with this id or prompt hash (repeatable).")
+    parser.add_argument("--sample", action="store_true", help="Show one random question per section.")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    started = time.perf_counter()
+    try:
+        bank = QuestionBank.load(args.bank)
+    except (OSError, ValueError, KeyError) as error:
+        raise SystemExit(f"Could not load {args.bank}: {error}")
+    elapsed = time.perf_counter() - started
+    print(f"Loaded {len(bank)} questions in {len(bank.sections)} sections from {args.bank} in {elapsed:.3f}s")
+    for key in args.find:
+        found = [bank.get(key)] if key in bank else bank.by_prompt_hash(key)
+        if not found:
+            raise SystemExit(f"No question with id or prompt hash {key!r}")
+        show(found)
+    if args.sample:
+        show(bank.sample_quiz())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+(function () {
+  // Adaptive quiz: a Rasch model, P(correct) = 1 / (1 + e^(difficulty - ability)),
+  // with the coach's ability tracked as a posterior over a fixed grid (prior
+  // N(0, 1)). Each next question is the one with the most expected information
+  // about the ability, and the quiz stops once the 90% interval of the expected
+  // score on the full quiz lies inside one of the 80% / 50% / 30% bands.
+  // Difficulties come from bank/index.json ("d", see item_analysis.py).
+  const GRID = Array.from({ length: 81 }, (_, index) => -4 + index * 0.1);
+  const BANDS = [0.8, 0.5, 0.3];
+  const INTERVAL = 0.9;
+  const MIN_QUESTIONS = 4;
+
+  function band(score) {
+    const index = BANDS.findIndex((edge) => score >= edge);
+    return index === -1 ? BANDS.length : index;
+  }
+
+  function shuffle(array) {
+    const arr = array.slice();
+    for (let i = arr.length - 1; i > 0; i--) {
+      const j = Math.floor(Math.random() * (i + 1));
+      [arr[i], arr[j]] = [arr[j], arr[i]];
+    }
+    return arr;
+  }
+
+  function createSession(sections) {
+    const points = GRID.length;
+    // Shuffled once, so ties go to a random question but the choice is
+    // repeatable, which lets the quiz prefetch the next question.
+    const items = shuffle(
+      sections.flatMap((section) =>
+        Array.from({ length: section.count }, (_, number) => ({
+          section,
+          number,
+          difficulty: (section.difficulties && section.difficulties[number]) || 0,
+        }))
+      )
+    );
+    // probabilities[item * points + g]: chance of a correct answer at GRID[g].
+    const probabilities = new Float64Array(items.length * points);
+    items.forEach((item, index) => {
+      GRID.forEach((ability, g) => {
+        probabilities[index * points + g] = 1 / (1 + Math.exp(item.difficulty - ability));
+      });
+    });
+    // Expected share correct on the fixed quiz (one question per section).
+    const expectedScore = GRID.map((_, g) => {
+      const perSection = new Map();
+      items.forEach((item, index) => {
+        const entry = perSection.get(item.section) || { sum: 0, count: 0 };
+        entry.sum += probabilities[index * points + g];
+        entry.count += 1;
+        perSection.set(item.section, entry);
+      });
+      let total = 0;
+      perSection.forEach((entry) => {
+        total += entry.sum / entry.count;
+      });
+      return total / perSection.size;
+    });
+
+    const logPosterior = new Float64Array(GRID.map((ability) => (-ability * ability) / 2));
+    const asked = new Set();
+    const askedSections = new Set();
+    const answers = [];
+
+    function posterior(log) {
+      const max = Math.max(...log);
+      const weights = Array.from(log, (value) => Math.exp(value - max));
+      const total = weights.reduce((sum, value) => sum + value, 0);
+      return weights.map((value) => value / total);
+    }
+
+    function updated(log, itemIndex, correct) {
+      const next = Float64Array.from(log);
+      for (let g = 0; g < points; g++) {
+        const p = probabilities[itemIndex * points + g];
+        next[g] += Math.log(correct ? p : 1 - p);
+      }
+      return next;
+    }
+
+    function choose(log, excluded, excludedSection) {
+      const weights = posterior(log);
+      // Cover every section once before asking a section twice.
+      const uncovered = items.some(
+        (item, index) =>
+          index !== excluded &&
+          !asked.has(index) &&
+          !askedSections.has(item.section) &&
+          item.section !== excludedSection
+      );
+      let best = -1;
+      let bestInformation = -1;
+      items.forEach((item, index) => {
+        if (index === excluded || asked.has(index)) {
+          return;
+        }
+        if (uncovered && (askedSections.has(item.section) || item.section === excludedSection)) {
+          return;
+        }
+        let information = 0;
+        for (let g = 0; g < points; g++) {
+          const p = probabilities[index * points + g];
+          information += weights[g] * p * (1 - p);
+        }
+        if (information > bestInformation) {
+          best = index;
+          bestInformation = information;
+        }
+      });
+      return best === -1 ? null : best;
+    }
+
+    function interval() {
+      const weights = posterior(logPosterior);
+      const tail = (1 - INTERVAL) / 2;
+      let cumulative = 0;
+      let low = -1;
+      let high = -1;
+      weights.forEach((weight, g) => {
+        cumulative += weight;
+        if (low === -1 && cumulative >= tail) {
+          low = g;
+        }
+        if (high === -1 && cumulative >= 1 - tail) {
+          high = g;
+        }
+      });
+      const score = weights.reduce((sum, weight, g) => sum + weight * expectedScore[g], 0);
+      return { score, low: expectedScore[low], high: expectedScore[high], weights };
+    }
+
+    return {
+      // The question to ask now, as { section, number, difficulty } or null.
+      next() {
+        const index = choose(logPosterior, -1, null);
+        return index === null ? null : { ...items[index], index };
+      },
+      // What next() will return after `item` is answered, for prefetching.
+      nextAfter(item, correct) {
+        const index = choose(updated(logPosterior, item.index, correct), item.index, item.section);
+        return index === null ? null : { ...items[index], index };
+      },
+      record(item, correct) {
+        logPosterior.set(updated(logPosterior, item.index, correct));
+        asked.add(item.index);
+        askedSections.add(item.section);
+        answers.push({ item, correct });
+      },
+      finished() {
+        if (answers.length >= sections.length || asked.size === items.length) {
+          return true;
+        }
+        if (answers.length < MIN_QUESTIONS) {
+          return false;
+        }
+        const { low, high } = interval();
+        return band(low) === band(high);
+      },
+      // Estimated score on the full quiz, its 90% interval, and the sections
+      // answered wrongly or, if not asked, more likely failed than passed.
+      result() {
+        const { score, low, high, weights } = interval();
+        const weak = [];
+        sections.forEach((section) => {
+          const sectionAnswers = answers.filter((answer) => answer.item.section === section);
+          if (sectionAnswers.length) {
+            if (sectionAnswers.some((answer) => !answer.correct)) {
+              weak.push({ section, asked: true });
+            }
+            return;
+          }
+          let chance = 0;
+          let count = 0;
+          items.forEach((item, index) => {
+            if (item.section === section) {
+              for (let g = 0; g < points; g++) {
+                chance += weights[g] * probabilities[index * points + g];
+              }
+              count += 1;
+            }
+          });
+          if (count && chance / count < 0.5) {
+            weak.push({ section, asked: false });
+          }
+        });
+        return { score, low, high, weak };
+      },
+    };
+  }
+
+  window.QuizAdaptive = { createSession };
+})();
@@ -0,0 +1,33 @@
+(function () {
+  // Google tag bootstrap, kept off the critical path: the queue is ready
+  // immediately, gtag.js itself is only requested after the page has loaded.
+  const MEASUREMENT_ID = 'G-BN9REN07NH';
+
+  window.dataLayer = window.dataLayer || [];
+  window.gtag = function gtag() {
+    window.dataLayer.push(arguments);
+  };
+  window.gtag('js', new Date());
+  window.gtag('config', MEASUREMENT_ID);
+
+  function loadTag() {
+    const script = document.createElement('script');
+    script.async = true;
+    script.src = `https://www.googletagmanager.com/gtag/js?id=${MEASUREMENT_ID}`;
+    document.head.appendChild(script);
+  }
+
+  function scheduleLoad() {
+    if ('requestIdleCallback' in window) {
+      window.requestIdleCallback(loadTag, { timeout: 3000 });
+    } else {
+      window.setTimeout(loadTag, 1);
+    }
+  }
+
+  if (document.readyState === 'complete') {
+    scheduleLoad();
+  } else {
+    window.addEventListener('load', scheduleLoad, { once: true });
+  }
+})();
@@ -0,0 +1,126 @@
+(function () {
+  // Bank shards kept in localStorage between visits, one entry per section:
+  //   quiz:bank:<id> -> {"hash", "questions": {number: shard}, "section"?: shard}
+  // Entries are tagged with the section hash from bank/index.json ("h"), so
+  // when one chapter's questions change only that section is dropped and
+  // loaded again; the rest of the bank is answered from the cache.
+  const PREFIX = 'quiz:bank:';
+  const entries = new Map();
+
+  function storage() {
+    try {
+      return window.localStorage;
+    } catch (error) {
+      return null;
+    }
+  }
+
+  function read(store, key) {
+    try {
+      return JSON.parse(store.getItem(key));
+    } catch (error) {
+      return null;
+    }
+  }
+
+  // Load the entries still current for `sections` and forget the rest.
+  function sync(sections) {
+    const store = storage();
+    if (!store) {
+      return;
+    }
+    const hashes = new Map(sections.map((section) => [section.id, section.hash]));
+    const keys = [];
+    for (let i = 0; i < store.length; i++) {
+      keys.push(store.key(i));
+    }
+    keys
+      .filter((key) => key && key.startsWith(PREFIX))
+      .forEach((key) => {
+        const id = key.slice(PREFIX.length);
+        const entry = read(store, key);
+        if (entry && entry.hash && entry.hash === hashes.get(id)) {
+          entries.set(id, entry);
+        } else {
+          store.removeItem(key);
+        }
+      });
+  }
+
+  function current(section) {
+    const entry = entries.get(section.id);
+    return section.hash && entry && entry.hash === section.hash ? entry : null;
+  }
+
+  function entryFor(section) {
+    let entry = current(section);
+    if (!entry) {
+      entry = { hash: section.hash, questions: {} };
+      entries.set(section.id, entry);
+    }
+    return entry;
+  }
+
+  function save(section, entry) {
+    const store = storage();
+    if (!store) {
+      return;
+    }
+    try {
+      store.setItem(PREFIX + section.id, JSON.stringify(entry));
+    } catch (error) {
+      // Quota or private mode: this section is simply fetched next time.
+      store.removeItem(PREFIX + section.id);
+    }
+  }
+
+  // A cached question shard, cut from the section shard when only that is
+  // cached; null when it has to be fetched.
+  function question(section, number) {
+    const entry = current(section);
+    if (!entry) {
+      return null;
+    }
+    if (entry.questions[number]) {
+      return entry.questions[number];
+    }
+    const whole = entry.section;
+    if (whole && whole.q[number]) {
+      const shard = { v: whole.v, s: whole.s, q: [whole.q[number]] };
+      if (whole.a) {
+        shard.a = [whole.a[number]];
+      }
+      return shard;
+    }
+    return null;
+  }
+
+  function sectionShard(section) {
+    const entry = current(section);
+    return entry && entry.section ? entry.section : null;
+  }
+
+  function storeQuestion(section, number, data) {
+    if (!section.hash) {
+      return;
+    }
+    const entry = entryFor(section);
+    if (!entry.section) {
+      entry.questions[number] = data;
+      save(section, entry);
+    }
+  }
+
+  // The section shard has every question, so single-question shards go.
+  function storeSection(section, data) {
+    if (!section.hash) {
+      return;
+    }
+    const entry = entryFor(section);
+    entry.section = data;
+    entry.questions = {};
+    save(section, entry);
+  }
+
+  window.QuizBankCache = { sync, question, section: sectionShard, storeQuestion, storeSection };
+})();
@@ -0,0 +1,66 @@
+(function () {
+  // Decoder for the compact bank files written by build_question_bank.py:
+  // strings live once in "s" and rows refer to them by position.
+  //   sections:  {"v": 1, "s": [...], "b": [[id, title, tutorialPath, count, questions?], ...],
+  //               "a"?: [[anchor, ...], ...], "d"?: [[difficulty, ...], ...],
+  //               "h"?: [sectionHash, ...], "r"?: bankRevision}
+  //   questions: {"v": 1, "s": [...], "q": [[prompt, [options], answerIndex, explanation?], ...], "a"?: [anchor, ...]}
+  // Anchors are string references (or null) to the tutorial passage a question
+  // is about; difficulties are numbers for the adaptive quiz (null when not
+  // known, treated as 0); a section's hash changes whenever its shards do
+  // (see bank-cache.js).
+  const VERSION = 1;
+
+  function checkVersion(data) {
+    if (!data || data.v !== VERSION) {
+      throw new Error(`Unsupported question bank encoding: ${data && data.v}`);
+    }
+  }
+
+  function decodeQuestion(row, strings, anchor) {
+    const question = {
+      prompt: strings[row[0]],
+      options: row[1].map((index) => strings[index]),
+      answerIndex: row[2],
+    };
+    if (row.length > 3) {
+      question.explanation = strings[row[3]];
+    }
+    if (anchor !== undefined && anchor !== null) {
+      question.anchor = strings[anchor];
+    }
+    return question;
+  }
+
+  function decodeSections(data) {
+    checkVersion(data);
+    const strings = data.s;
+    return data.b.map((row, position) => {
+      const section = {
+        id: strings[row[0]],
+        title: strings[row[1]],
+        tutorialPath: strings[row[2]],
+        count: row[3],
+      };
+      if (row.length > 4) {
+        const anchors = (data.a && data.a[position]) || [];
+        section.questions = row[4].map((item, index) => decodeQuestion(item, strings, anchors[index]));
+      }
+      if (data.d) {
+        section.difficulties = data.d[position];
+      }
+      if (data.h) {
+        section.hash = data.h[position];
+      }
+      return section;
+    });
+  }
+
+  function decodeQuestions(data) {
+    checkVersion(data);
+    const anchors = data.a || [];
+    return data.q.map((row, index) => decodeQuestion(row, data.s, anchors[index]));
+  }
+
+  window.QuizBank = { decodeSections, decodeQuestions };
+})();
@@ -0,0 +1,583 @@
+(function () {
+  const screens = {
+    start: document.getElementById('screen-start'),
+    question: document.getElementById('screen-question'),
+    results: document.getElementById('screen-results'),
+  };
+
+  const elements = {
+    questionCount: document.getElementById('question-count'),
+    questionProgress: document.getElementById('question-progress'),
+    questionTitle: document.getElementById('question-title'),
+    optionList: document.getElementById('option-list'),
+    tutorialLink: document.getElementById('tutorial-link'),
+    alertSelection: document.getElementById('alert-selection'),
+    btnStart: document.getElementById('btn-start'),
+    btnAdaptive: document.getElementById('btn-adaptive'),
+    btnNext: document.getElementById('btn-next'),
+    btnQuit: document.getElementById('btn-quit'),
+    btnRetake: document.getElementById('btn-retake'),
+    questionForm: document.getElementById('question-form'),
+    reviewList: document.getElementById('review-list'),
+    scoreSummary: document.getElementById('score-summary'),
+    scoreMessage: document.getElementById('score-message'),
+    scoreBanner: document.getElementById('score-banner'),
+    questionBank: document.getElementById('question-bank'),
+    questionBankSections: document.getElementById('question-bank-sections'),
+    shareResponses: document.getElementById('share-responses'),
+    shareResponsesInput: document.getElementById('share-responses-input'),
+    btnDownload: document.getElementById('btn-download'),
+    weakSections: document.getElementById('weak-sections'),
+    weakSectionsList: document.getElementById('weak-sections-list'),
+  };
+
+  const state = {
+    sections: [],
+    quizQuestions: [],
+    responses: [],
+    attemptRecords: [],
+    currentIndex: 0,
+    questionRendered: false,
+    // "fixed": one question per section; "adaptive": see adaptive.js.
+    mode: 'fixed',
+    session: null,
+    // Adaptive question whose download failed; retried on the next submit.
+    pendingItem: null,
+  };
+
+  elements.btnStart.disabled = true;
+  elements.btnAdaptive.disabled = true;
+
+  const canMeasure = Boolean(window.performance && performance.mark && performance.measure);
+
+  // User Timing spans ("quiz:<name>"), beaconed by rum.js when it is loaded.
+  function markStart(name) {
+    if (canMeasure) {
+      performance.mark(`quiz:${name}:start`);
+    }
+  }
+
+  function measureSince(name) {
+    if (canMeasure) {
+      performance.measure(`quiz:${name}`, `quiz:${name}:start`);
+    }
+  }
+
+  function timed(name, fn) {
+    markStart(name);
+    const result = fn();
+    measureSince(name);
+    return result;
+  }
+
+  function shuffle(array) {
+    const arr = array.slice();
+    for (let i = arr.length - 1; i > 0; i--) {
+      const j = Math.floor(Math.random() * (i + 1));
+      [arr[i], arr[j]] = [arr[j], arr[i]];
+    }
+    return arr;
+  }
+
+  // Shards of the bank (see build_question_bank.py): bank/index.json lists the
+  // sections, bank/<id>/<n>.json holds one question, bank/<id>.json a section.
+  const BANK_URL = 'bank/';
+  const shardCache = new Map();
+
+  function fetchJson(path) {
+    if (!shardCache.has(path)) {
+      const request = fetch(`${BANK_URL}${path}`).then((response) => {
+        if (!response.ok) {
+          throw new Error(`Failed to load ${path}: ${response.status}`);
+        }
+        return response.json();
+      });
+      // Let a failed shard be retried on the next attempt.
+      request.catch(() => shardCache.delete(path));
+      shardCache.set(path, request);
+    }
+    return shardCache.get(path);
+  }
+
+  // Shards come from QuizBankCache when their section hash is unchanged. The
+  // hash also goes into the URL, so an edited section bypasses stale copies
+  // in the HTTP cache.
+  function versioned(section, path) {
+    return section.hash ? `${path}?v=${section.hash}` : path;
+  }
+
+  function loadQuestion(section, number) {
+    const cached = window.QuizBankCache.question(section, number);
+    if (cached) {
+      return Promise.resolve(cached);
+    }
+    return fetchJson(versioned(section, `${section.id}/${number}.json`)).then((data) => {
+      window.QuizBankCache.storeQuestion(section, number, data);
+      return data;
+    });
+  }
+
+  function loadSection(section) {
+    const cached = window.QuizBankCache.section(section);
+    if (cached) {
+      return Promise.resolve(cached);
+    }
+    return fetchJson(versioned(section, `${section.id}.json`)).then((data) => {
+      window.QuizBankCache.storeSection(section, data);
+      return data;
+    });
+  }
+
+  function loadSampledQuestions() {
+    return Promise.all(
+      state.sections.map((section) => {
+        const number = Math.floor(Math.random() * section.count);
+        return loadQuestion(section, number).then((data) =>
+          pickQuestion(section, window.QuizBank.decodeQuestions(data)[0], number)
+        );
+      })
+    );
+  }
+
+  function pickQuestion(section, question, number) {
+    const paired = question.options.map((text, idx) => ({
+      text,
+      index: idx,
+      isCorrect: idx === question.answerIndex,
+    }));
+    const shuffled = shuffle(paired);
+    const answerIndex = shuffled.findIndex((opt) => opt.isCorrect);
+    return {
+      sectionId: section.id,
+      sectionTitle: section.title,
+      // Deep link to the passage the question is about, when the bank has one.
+      tutorialPath: question.anchor ? `${section.tutorialPath}#${question.anchor}` : section.tutorialPath,
+      hasAnchor: Boolean(question.anchor),
+      questionNumber: number,
+      prompt: question.prompt,
+      options: shuffled.map((opt) => opt.text),
+      // Original option indexes in the order they are shown (for QuizResponses).
+      optionOrder: shuffled.map((opt) => opt.index),
+      answerIndex,
+    };
+  }
+
+  function loadAdaptiveQuestion(item) {
+    return loadQuestion(item.section, item.number).then((data) => ({
+      ...pickQuestion(item.section, window.QuizBank.decodeQuestions(data)[0], item.number),
+      adaptiveItem: item,
+    }));
+  }
+
+  // Either answer picks a known next question, so both can load while the
+  // coach is still reading this one.
+  function prefetchAdaptive(item) {
+    [true, false].forEach((correct) => {
+      const next = state.session.nextAfter(item, correct);
+      if (next) {
+        loadQuestion(next.section, next.number).catch(() => {});
+      }
+    });
+  }
+
+  function setStartButtonsDisabled(disabled) {
+    elements.btnStart.disabled = disabled;
+    elements.btnAdaptive.disabled = disabled;
+    elements.btnRetake.disabled = disabled;
+  }
+
+  function prepareQuiz(mode) {
+    if (!state.sections.length) {
+      return Promise.resolve();
+    }
+    setStartButtonsDisabled(true);
+    state.mode = mode;
+    state.pendingItem = null;
+    markStart('fetch-sampled-questions');
+    let loading;
+    if (mode === 'adaptive') {
+      state.session = window.QuizAdaptive.createSession(state.sections);
+      loading = loadAdaptiveQuestion(state.session.next()).then((question) => [question]);
+    } else {
+      state.session = null;
+      loading = loadSampledQuestions();
+    }
+    return loading
+      .then((questions) => {
+        measureSince('fetch-sampled-questions');
+        startQuiz(questions);
+      })
+      .catch((error) => {
+        console.error(error);
+        alert("We couldn't load the questions. Please check your connection and try again.");
+      })
+      .finally(() => {
+        setStartButtonsDisabled(false);
+      });
+  }
+
+  function loadNextAdaptive(item) {
+    elements.btnNext.disabled = true;
+    loadAdaptiveQuestion(item)
+      .then((question) => {
+        state.pendingItem = null;
+        state.quizQuestions.push(question);
+        state.currentIndex += 1;
+        renderQuestion();
+      })
+      .catch((error) => {
+        console.error(error);
+        state.pendingItem = item;
+        alert("We couldn't load the next question. Please check your connection and press Next again.");
+      })
+      .finally(() => {
+        elements.btnNext.disabled = false;
+      });
+  }
+
+  function advanceAdaptive() {
+    const response = state.responses[state.responses.length - 1];
+    state.session.record(response.adaptiveItem, response.isCorrect);
+    if (state.session.finished()) {
+      finishQuiz();
+      return;
+    }
+    loadNextAdaptive(timed('adaptive-next', () => state.session.next()));
+  }
+
+  function startQuiz(questions) {
+    state.quizQuestions = questions;
+    state.responses = [];
+    state.currentIndex = 0;
+    elements.btnNext.textContent = 'Next';
+    showScreen('question');
+    if (state.questionRendered) {
+      renderQuestion();
+    } else {
+      timed('first-render-question', renderQuestion);
+      state.questionRendered = true;
+    }
+  }
+
+  function renderQuestion() {
+    const current = state.quizQuestions[state.currentIndex];
+    elements.questionProgress.textContent =
+      state.mode === 'adaptive'
+        ? `Question ${state.currentIndex + 1}`
+        : `Question ${state.currentIndex + 1} of ${state.quizQuestions.length}`;
+    elements.questionTitle.textContent = current.prompt;
+    elements.tutorialLink.href = current.tutorialPath;
+    elements.tutorialLink.textContent = `Read more in “${current.sectionTitle}”`;
+    elements.optionList.innerHTML = '';
+    elements.alertSelection.style.display = 'none';
+
+    current.options.forEach((option, index) => {
+      const id = `option-${state.currentIndex}-${index}`;
+      const wrapper = document.createElement('label');
+      wrapper.className = 'option';
+      wrapper.setAttribute('for', id);
+
+      const radio = document.createElement('input');
+      radio.type = 'radio';
+      radio.name = 'answer';
+      radio.value = String(index);
+      radio.id = id;
+
+      const span = document.createElement('span');
+      span.textContent = option;
+
+      wrapper.appendChild(radio);
+      wrapper.appendChild(span);
+      elements.optionList.appendChild(wrapper);
+    });
+
+    if (state.mode === 'fixed' && state.currentIndex === state.quizQuestions.length - 1) {
+      elements.btnNext.textContent = 'Finish quiz';
+    } else {
+      elements.btnNext.textContent = 'Next';
+    }
+    if (state.mode === 'adaptive') {
+      prefetchAdaptive(current.adaptiveItem);
+    }
+  }
+
+  function renderQuestionBank() {
+    const container = elements.questionBank;
+    const sectionList = elements.questionBankSections;
+    if (!container || !sectionList) {
+      return;
+    }
+    if (!state.sections.length) {
+      container.hidden = true;
+      sectionList.innerHTML = '';
+      return;
+    }
+    sectionList.innerHTML = '';
+    state.sections.forEach((section) => {
+      const details = document.createElement('details');
+      details.className = 'question-bank__item';
+
+      const summary = document.createElement('summary');
+      summary.textContent = `${section.title} (${section.count})`;
+      details.appendChild(summary);
+
+      if (section.count) {
+        const list = document.createElement('ol');
+        list.className = 'question-bank__questions';
+        details.appendChild(list);
+        // The prompts are only downloaded when a section is opened.
+        details.addEventListener('toggle', () => {
+          if (details.open && !list.childElementCount) {
+            renderSectionQuestions(section, list);
+          }
+        });
+      }
+
+      sectionList.appendChild(details);
+    });
+    container.hidden = false;
+  }
+
+  function renderSectionQuestions(section, list) {
+    const loading = document.createElement('li');
+    loading.textContent = 'Loading questions…';
+    list.appendChild(loading);
+    loadSection(section)
+      .then((data) => {
+        list.innerHTML = '';
+        window.QuizBank.decodeQuestions(data).forEach((question) => {
+          const item = document.createElement('li');
+          item.textContent = question.prompt;
+          list.appendChild(item);
+        });
+      })
+      .catch((error) => {
+        console.error(error);
+        // Cleared so the next toggle tries again.
+        list.innerHTML = '';
+        const details = list.closest('details');
+        if (details) {
+          details.open = false;
+        }
+      });
+  }
+
+  function recordResponse(selectedIndex) {
+    const question = state.quizQuestions[state.currentIndex];
+    const isCorrect = Number(selectedIndex) === question.answerIndex;
+    state.responses.push({
+      ...question,
+      selectedIndex: Number(selectedIndex),
+      isCorrect,
+    });
+  }
+
+  function showScreen(target) {
+    screens.start.hidden = target !== 'start';
+    screens.question.hidden = target !== 'question';
+    screens.results.hidden = target !== 'results';
+  }
+
+  function evaluateScore() {
+    const total = state.responses.length;
+    const correct = state.responses.filter((resp) => resp.isCorrect).length;
+    let percentage = Math.round((correct / total) * 100);
+    let summary = `You answered ${correct} of ${total} questions correctly (${percentage}%).`;
+    if (state.mode === 'adaptive') {
+      const result = state.session.result();
+      percentage = Math.round(result.score * 100);
+      summary =
+        `You answered ${correct} of ${total} questions correctly. ` +
+        `Your estimated score on the full quiz is ${percentage}% ` +
+        `(most likely between ${Math.round(result.low * 100)}% and ${Math.round(result.high * 100)}%).`;
+      renderWeakSections(result.weak);
+    } else {
+      renderWeakSections([]);
+    }
+    let message = '';
+    let bannerClass = 'success';
+    if (percentage >= 80) {
+      message = "Fantastic! You're ready to be a coach for this course.";
+      bannerClass = 'success';
+    } else if (percentage >= 50) {
+      message = "You're almost ready—review a few chapters and you'll be confident.";
+      bannerClass = 'mid';
+    } else if (percentage >= 30) {
+      message = "You're on the right path. A little more reading and practice will get you there.";
+      bannerClass = 'mid';
+    } else {
+      message = "Take some extra time with the tutorial to build up your confidence.";
+      bannerClass = 'low';
+    }
+    elements.scoreSummary.textContent = summary;
+    elements.scoreMessage.textContent = message;
+    elements.scoreBanner.classList.remove('success', 'mid', 'low');
+    elements.scoreBanner.classList.add(bannerClass);
+    timed('render-review', renderReview);
+  }
+
+  function renderWeakSections(weak) {
+    if (!elements.weakSections) {
+      return;
+    }
+    const list = elements.weakSectionsList;
+    list.innerHTML = '';
+    weak.forEach(({ section, asked }) => {
+      const item = document.createElement('li');
+      const anchor = document.createElement('a');
+      anchor.href = section.tutorialPath;
+      anchor.target = '_blank';
+      anchor.rel = 'noopener';
+      anchor.textContent = section.title;
+      item.appendChild(anchor);
+      if (!asked) {
+        item.appendChild(document.createTextNode(' (not asked, but likely hard for you)'));
+      }
+      list.appendChild(item);
+    });
+    elements.weakSections.hidden = !weak.length;
+  }
+
+  function renderReview() {
+    const list = elements.reviewList;
+    list.innerHTML = '';
+    state.responses.forEach((resp, index) => {
+      const item = document.createElement('article');
+      item.className = `review-item ${resp.isCorrect ? 'correct' : 'incorrect'}`;
+
+      const heading = document.createElement('h3');
+      heading.textContent = `Question ${index + 1}: ${resp.sectionTitle}`;
+
+      const prompt = document.createElement('p');
+      prompt.innerHTML = `<strong>Prompt:</strong> ${resp.prompt}`;
+
+      const userAnswer = document.createElement('p');
+      userAnswer.innerHTML = `<strong>Your answer:</strong> ${resp.options[resp.selectedIndex] || 'No answer selected'}`;
+
+      const correctAnswer = document.createElement('p');
+      correctAnswer.innerHTML = `<strong>Correct answer:</strong> ${resp.options[resp.answerIndex]}`;
+
+      const status = document.createElement('p');
+      status.innerHTML = resp.isCorrect
+        ? '✅ Well done!'
+        : '❌ Take another look at this topic.';
+
+      const link = document.createElement('p');
+      const anchor = document.createElement('a');
+      anchor.href = resp.tutorialPath;
+      anchor.target = '_blank';
+      anchor.rel = 'noopener';
+      anchor.textContent = resp.hasAnchor
+        ? `Review this topic in “${resp.sectionTitle}”`
+        : `Review the “${resp.sectionTitle}” chapter`;
+      link.appendChild(anchor);
+
+      item.appendChild(heading);
+      item.appendChild(prompt);
+      item.appendChild(userAnswer);
+      item.appendChild(correctAnswer);
+      item.appendChild(status);
+      item.appendChild(link);
+
+      list.appendChild(item);
+    });
+  }
+
+  function finishQuiz() {
+    state.attemptRecords = window.QuizResponses.attemptRecords(state.responses);
+    window.QuizResponses.send(state.attemptRecords);
+    showScreen('results');
+    evaluateScore();
+    window.scrollTo({ top: 0, behavior: 'smooth' });
+  }
+
+  elements.questionForm.addEventListener('submit', (event) => {
+    event.preventDefault();
+    const data = new FormData(elements.questionForm);
+    const selected = data.get('answer');
+    if (state.pendingItem) {
+      loadNextAdaptive(state.pendingItem);
+      return;
+    }
+    if (selected === null) {
+      elements.alertSelection.style.display = 'block';
+      return;
+    }
+    elements.alertSelection.style.display = 'none';
+    recordResponse(selected);
+    if (state.mode === 'adaptive') {
+      advanceAdaptive();
+    } else if (state.currentIndex === state.quizQuestions.length - 1) {
+      finishQuiz();
+    } else {
+      state.currentIndex += 1;
+      renderQuestion();
+    }
+  });
+
+  elements.btnQuit.addEventListener('click', () => {
+    if (confirm('End the quiz and return to the introduction?')) {
+      showScreen('start');
+    }
+  });
+
+  elements.btnRetake.addEventListener('click', () => {
+    prepareQuiz(state.mode);
+  });
+
+  elements.btnStart.addEventListener('click', () => {
+    prepareQuiz('fixed');
+  });
+
+  elements.btnAdaptive.addEventListener('click', () => {
+    prepareQuiz('adaptive');
+  });
+
+  if (elements.btnDownload) {
+    elements.btnDownload.addEventListener('click', () => {
+      window.QuizResponses.download(state.attemptRecords);
+    });
+  }
+
+  // The opt-in is only offered when there is somewhere to send the answers.
+  if (elements.shareResponses && window.QuizResponses.canShare) {
+    elements.shareResponsesInput.checked = window.QuizResponses.optedIn();
+    elements.shareResponsesInput.addEventListener('change', () => {
+      window.QuizResponses.setOptIn(elements.shareResponsesInput.checked);
+    });
+    elements.shareResponses.hidden = false;
+  }
+
+  markStart('fetch-questions');
+  // Always revalidated: the index is the bank's version manifest, and usually
+  // a 304 that leaves every cached section in use.
+  fetch(`${BANK_URL}index.json`, { cache: 'no-cache' })
+    .then((response) => {
+      if (!response.ok) {
+        throw new Error(`HTTP ${response.status}`);
+      }
+      return response.text();
+    })
+    .then((text) => {
+      measureSince('fetch-questions');
+      return timed('parse-questions', () => window.QuizBank.decodeSections(JSON.parse(text)));
+    })
+    .then((sections) => {
+      window.QuizBankCache.sync(sections);
+      state.sections = sections;
+      elements.questionCount.textContent = String(sections.length);
+      elements.btnStart.disabled = false;
+      elements.btnAdaptive.disabled = false;
+      timed('render-question-bank', renderQuestionBank);
+    })
+    .catch((error) => {
+      console.error('Failed to load the question bank index', error);
+      screens.start.innerHTML = `
+        <h2>Quiz unavailable</h2>
+        <p>We couldn't load the question bank. Please refresh the page or try again later.</p>
+        <div class="quiz-actions">
+          <a class="secondary button-like" href="../index.html" role="button">Return home</a>
+        </div>
+      `;
+    });
+})();
@@ -0,0 +1,99 @@
+(function () {
+  // Opt-in capture of finished attempts for item_analysis.py. Each answered
+  // question becomes one JSON line:
+  //   {"attempt", "time", "section", "question", "prompt", "order", "answer", "selected"}
+  // "question" is the question's position in its section, "prompt" a hash of
+  // its text (so stale records can be told apart), "order" the original option
+  // indexes in the order they were shown, and "answer"/"selected" original
+  // option indexes. Attempts are only posted when an endpoint is configured
+  // and the visitor ticked the box; anyone can download their own.
+  const ENDPOINT = '';
+  const STORAGE_KEY = 'quiz:share-responses';
+
+  const meta = document.querySelector('meta[name="quiz-response-endpoint"]');
+  const endpoint = meta ? meta.content : ENDPOINT;
+
+  // 32-bit FNV-1a of the UTF-8 prompt, as question_bank.prompt_hash computes it.
+  function promptHash(text) {
+    let hash = 0x811c9dc5;
+    new TextEncoder().encode(text).forEach((byte) => {
+      hash = Math.imul(hash ^ byte, 0x01000193) >>> 0;
+    });
+    return hash.toString(16).padStart(8, '0');
+  }
+
+  function attemptId() {
+    if (window.crypto && crypto.randomUUID) {
+      return crypto.randomUUID();
+    }
+    return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+  }
+
+  function attemptRecords(responses) {
+    const attempt = attemptId();
+    const time = new Date().toISOString();
+    return responses.map((resp) => ({
+      attempt,
+      time,
+      section: resp.sectionId,
+      question: resp.questionNumber,
+      prompt: promptHash(resp.prompt),
+      order: resp.optionOrder,
+      answer: resp.optionOrder[resp.answerIndex],
+      selected: resp.optionOrder[resp.selectedIndex],
+    }));
+  }
+
+  function toJsonl(records) {
+    return records.map((record) => `${JSON.stringify(record)}\n`).join('');
+  }
+
+  function optedIn() {
+    try {
+      return window.localStorage.getItem(STORAGE_KEY) === '1';
+    } catch (error) {
+      return false;
+    }
+  }
+
+  function setOptIn(value) {
+    try {
+      window.localStorage.setItem(STORAGE_KEY, value ? '1' : '0');
+    } catch (error) {
+      // Private mode: the choice just isn't remembered.
+    }
+  }
+
+  function send(records) {
+    if (!endpoint || !optedIn() || !records.length) {
+      return false;
+    }
+    // text/plain keeps it a "simple" request, so no CORS preflight.
+    const body = new Blob([toJsonl(records)], { type: 'text/plain' });
+    if (navigator.sendBeacon && navigator.sendBeacon(endpoint, body)) {
+      return true;
+    }
+    fetch(endpoint, { method: 'POST', body, keepalive: true, mode: 'no-cors' }).catch(() => {});
+    return true;
+  }
+
+  function download(records) {
+    const url = URL.createObjectURL(new Blob([toJsonl(records)], { type: 'application/x-ndjson' }));
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = `quiz-responses-${records.length ? records[0].time.slice(0, 10) : 'empty'}.jsonl`;
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    setTimeout(() => URL.revokeObjectURL(url), 0);
+  }
+
+  window.QuizResponses = {
+    canShare: Boolean(endpoint),
+    attemptRecords,
+    optedIn,
+    setOptIn,
+    send,
+    download,
+  };
+})();
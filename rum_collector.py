@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""Collect real-user timing beacons from rum.js and flush percentiles to JSONL.
+
+POSTs to ``/responses`` (quiz answers shared from ``quiz_src/responses.js``)
+are appended as they arrive to a separate JSONL file for item_analysis.py.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+PERCENTILES = (0.5, 0.75, 0.95, 0.99)
+# Per metric/page/connection and flush window; later samples replace random ones.
+MAX_SAMPLES = 5000
+MAX_BODY_BYTES = 64 * 1024
+MAX_DURATION_MS = 10 * 60 * 1000
+METRIC_RE = re.compile(r"^[a-z]+:[a-z0-9-]{1,64}$")
+CONNECTION_TYPES = frozenset({"slow-2g", "2g", "3g", "4g", "unknown"})
+
+Key = Tuple[str, str, str]
+
+
+@dataclass
+class Samples:
+    seen: int = 0
+    values: List[float] = field(default_factory=list)
+
+    def add(self, value: float) -> None:
+        self.seen += 1
+        if len(self.values) < MAX_SAMPLES:
+            self.values.append(value)
+            return
+        # Reservoir sampling keeps an unbiased sample of the whole window.
+        slot = random.randrange(self.seen)
+        if slot < MAX_SAMPLES:
+            self.values[slot] = value
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class Aggregator:
+    """In-memory samples for the current window, keyed by metric, page and connection."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._samples: Dict[Key, Samples] = {}
+        self.window_start = time.time()
+
+    def add_beacon(self, payload: object) -> int:
+        if not isinstance(payload, dict) or not isinstance(payload.get("metrics"), list):
+            raise ValueError("beacon must be an object with a metrics list")
+        connection = payload.get("connection")
+        if connection not in CONNECTION_TYPES:
+            connection = "unknown"
+        accepted = 0
+        with self._lock:
+            for metric in payload["metrics"]:
+                if not isinstance(metric, dict):
+                    continue
+                name = metric.get("name")
+                page = metric.get("page")
+                duration = metric.get("duration")
+                if not isinstance(name, str) or not METRIC_RE.match(name):
+                    continue
+                if not isinstance(page, str) or not page.startswith("/"):
+                    continue
+                if not isinstance(duration, (int, float)) or not 0 <= duration <= MAX_DURATION_MS:
+                    continue
+                key = (name, page[:200], connection)
+                self._samples.setdefault(key, Samples()).add(float(duration))
+                accepted += 1
+        return accepted
+
+    def summary(self, reset: bool = False) -> List[Dict[str, object]]:
+        with self._lock:
+            samples, start = self._samples, self.window_start
+            if reset:
+                self._samples = {}
+                self.window_start = time.time()
+        end = time.time()
+        rows: List[Dict[str, object]] = []
+        for (name, page, connection), bucket in sorted(samples.items()):
+            ordered = sorted(bucket.values)
+            row: Dict[str, object] = {
+                "window_start": round(start, 3),
+                "window_end": round(end, 3),
+                "metric": name,
+                "page": page,
+                "connection": connection,
+                "count": bucket.seen,
+            }
+            for fraction in PERCENTILES:
+                row[f"p{round(fraction * 100)}"] = round(percentile(ordered, fraction), 1)
+            row["max"] = round(ordered[-1], 1)
+            rows.append(row)
+        return rows
+
+    def flush(self, output: Path) -> int:
+        rows = self.summary(reset=True)
+        if rows:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            with output.open("a", encoding="utf-8") as handle:
+                for row in rows:
+                    handle.write(json.dumps(row) + "\n")
+        return len(rows)
+
+
+class ResponseLog:
+    """Appends shared quiz answers, one JSON object per line, to a file."""
+
+    def __init__(self, output: Path) -> None:
+        self.output = output
+        self._lock = threading.Lock()
+
+    def append(self, body: bytes) -> int:
+        lines: List[str] = []
+        for line in body.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("responses must be JSON objects, one per line")
+            lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+        with self._lock:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            with self.output.open("a", encoding="utf-8") as handle:
+                handle.writelines(lines)
+        return len(lines)
+
+
+def make_handler(aggregator: Aggregator, responses: ResponseLog) -> type:
+    class BeaconHandler(BaseHTTPRequestHandler):
+        def end_headers(self) -> None:
+            # Beacons come from the published site, which lives on another origin.
+            self.send_header("Access-Control-Allow-Origin", "*")
+            super().end_headers()
+
+        def do_OPTIONS(self) -> None:
+            self.send_response(204)
+            self.send_header("Access-Control-Allow-Methods", "POST, GET")
+            self.send_header("Access-Control-Allow-Headers", "Content-Type")
+            self.end_headers()
+
+        def do_POST(self) -> None:
+            header = self.headers.get("Content-Length") or "0"
+            if not header.isdigit():
+                # The body cannot be skipped without a length, so drop the connection after answering.
+                self.close_connection = True
+                self.send_error(400, "Invalid Content-Length")
+                return
+            length = int(header)
+            if length <= 0 or length > MAX_BODY_BYTES:
+                self.send_error(413 if length else 411)
+                return
+            body = self.rfile.read(length)
+            try:
+                if self.path.rstrip("/") == "/responses":
+                    responses.append(body)
+                else:
+                    aggregator.add_beacon(json.loads(body))
+            except ValueError as error:
+                self.send_error(400, str(error))
+                return
+            self.send_response(204)
+            self.end_headers()
+
+        def do_GET(self) -> None:
+            if self.path.rstrip("/") != "/summary":
+                self.send_error(404)
+                return
+            body = json.dumps(aggregator.summary(), indent=2).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return BeaconHandler
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1).")
+    parser.add_argument("--port", type=int, default=8787, help="Port to listen on (default: 8787).")
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("rum.jsonl"),
+        help="JSONL file that flushed windows are appended to (default: rum.jsonl).",
+    )
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between flushes of the in-memory window (default: 60).",
+    )
+    parser.add_argument(
+        "--responses",
+        type=Path,
+        default=Path("responses.jsonl"),
+        help="JSONL file that quiz answers posted to /responses are appended to (default: responses.jsonl).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    aggregator = Aggregator()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(aggregator, ResponseLog(args.responses)))
+    stop = threading.Event()
+
+    def flush_periodically() -> None:
+        while not stop.wait(args.flush_interval):
+            aggregator.flush(args.output)
+
+    flusher = threading.Thread(target=flush_periodically, name="rum-flush", daemon=True)
+    flusher.start()
+    print(f"Collecting beacons on http://{args.host}:{args.port}/ (summary at /summary, answers at /responses)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+        rows = aggregator.flush(args.output)
+        print(f"Wrote {rows} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,645 @@
+#!/usr/bin/env python3
+"""Serve the generated docs/ tree over asyncio and load-test it with realistic navigation."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import email.utils
+import gzip
+import mimetypes
+import random
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from deploy_manifest import hash_file
+
+try:  # Optional: only needed to write .br siblings with ``precompress``.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# Server preference when the client accepts several encodings equally.
+ENCODING_PREFERENCE = ("br", "gzip")
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".json", ".svg", ".txt", ".xml")
+MAX_HEADER_BYTES = 16 * 1024
+CACHEABLE_FILE_BYTES = 64 * 1024
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+# Content-hashed names (see build_quiz_assets.py) never change content.
+IMMUTABLE_RE = re.compile(r"\.[0-9a-f]{10}\.(?:css|js)$")
+# Share of journeys that start with a cold browser cache.
+NEW_VISITOR_SHARE = 0.5
+REFERENCE_RE = re.compile(r'(?:src|href)="([^"#?]+)')
+
+REASONS = {
+    200: "OK",
+    206: "Partial Content",
+    301: "Moved Permanently",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    416: "Range Not Satisfiable",
+    431: "Request Header Fields Too Large",
+}
+
+mimetypes.add_type("text/javascript", ".js")
+mimetypes.add_type("image/webp", ".webp")
+
+
+@dataclass
+class Representation:
+    path: Path
+    size: int
+    etag: str
+    encoding: str = "identity"
+
+
+@dataclass
+class Resource:
+    content_type: str
+    last_modified: str
+    mtime: int
+    cache_control: str
+    representations: Dict[str, Representation] = field(default_factory=dict)
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve = subparsers.add_parser("serve", help="Serve a directory.")
+    serve.add_argument("root", type=Path, nargs="?", default=Path("docs"), help="Directory to serve (default: docs).")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: 127.0.0.1).")
+    serve.add_argument("--port", type=int, default=8000, help="Port to listen on (default: 8000).")
+    serve.add_argument(
+        "--cache-bytes",
+        type=int,
+        default=DEFAULT_CACHE_BYTES,
+        help="Memory budget for small hot files; 0 disables the cache (default: 32 MiB).",
+    )
+    serve.add_argument("--log", action="store_true", help="Print one access-log line per request.")
+
+    load = subparsers.add_parser("loadtest", help="Replay tutorial and quiz navigation against a server.")
+    load.add_argument("root", type=Path, nargs="?", default=Path("docs"), help="Served directory, used to plan journeys.")
+    load.add_argument(
+        "--url",
+        default=None,
+        help="Server to test (default: start an in-process server on a free port).",
+    )
+    load.add_argument("--clients", type=int, default=50, help="Concurrent simulated readers (default: 50).")
+    load.add_argument("--duration", type=float, default=15.0, help="Seconds to run (default: 15).")
+    load.add_argument("--think-ms", type=float, default=0.0, help="Pause between page views (default: 0).")
+    load.add_argument("--seed", type=int, default=None, help="Seed for reproducible journeys.")
+
+    precompress = subparsers.add_parser(
+        "precompress", help="Write .gz (and .br when the brotli module is installed) siblings for text files."
+    )
+    precompress.add_argument("root", type=Path, nargs="?", default=Path("docs"), help="Directory to process.")
+    return parser.parse_args(argv)
+
+
+def build_index(root: Path) -> Dict[str, Resource]:
+    """Map every URL path below ``root`` to its file and precompressed siblings."""
+    index: Dict[str, Resource] = {}
+    files = sorted(path for path in root.rglob("*") if path.is_file())
+    present = set(files)
+    for path in files:
+        encoded_sibling = path.suffix in (".br", ".gz") and path.with_suffix("") in present
+        if encoded_sibling or path.name.startswith("."):
+            continue
+        stat = path.stat()
+        url = "/" + path.relative_to(root).as_posix()
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        if content_type.startswith("text/") or content_type in ("application/json", "image/svg+xml"):
+            content_type += "; charset=utf-8"
+        resource = Resource(
+            content_type=content_type,
+            last_modified=email.utils.formatdate(stat.st_mtime, usegmt=True),
+            mtime=int(stat.st_mtime),
+            cache_control="public, max-age=31536000, immutable" if IMMUTABLE_RE.search(path.name) else "no-cache",
+        )
+        resource.representations["identity"] = Representation(path, stat.st_size, f'"{hash_file(path)[:32]}"')
+        for encoding, suffix in ENCODING_SUFFIXES.items():
+            sibling = path.with_name(path.name + suffix)
+            if sibling in present:
+                digest = hash_file(sibling)[:32]
+                resource.representations[encoding] = Representation(
+                    sibling, sibling.stat().st_size, f'"{digest}-{encoding}"', encoding
+                )
+        index[url] = resource
+    return index
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    weights: Dict[str, float] = {}
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        weight = 1.0
+        match = re.search(r"q=([0-9.]+)", params)
+        if match:
+            try:
+                weight = float(match.group(1))
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+    return weights
+
+
+def choose_representation(resource: Resource, accept_encoding: str) -> Representation:
+    weights = parse_accept_encoding(accept_encoding)
+    best: Optional[Representation] = None
+    best_weight = 0.0
+    for encoding in ENCODING_PREFERENCE:
+        representation = resource.representations.get(encoding)
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if representation is not None and weight > best_weight:
+            best, best_weight = representation, weight
+    return best or resource.representations["identity"]
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Return the inclusive byte range, or ``None`` to send the whole file.
+
+    Multi-range requests are answered with the full body, which RFC 9110 allows.
+    """
+    match = re.fullmatch(r"\s*bytes=(\d*)-(\d*)\s*", header)
+    if not match or (not match.group(1) and not match.group(2)):
+        return None
+    first, last = match.groups()
+    if not first:
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise RangeNotSatisfiable()
+    return start, end
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison, as required for If-None-Match."""
+    if header.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+class LruCache:
+    """Bytes of small files, evicted least-recently-used beyond ``max_bytes``."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Path, bytes]" = OrderedDict()
+
+    def get(self, path: Path) -> Optional[bytes]:
+        data = self._entries.get(path)
+        if data is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(path)
+        self.hits += 1
+        return data
+
+    def put(self, path: Path, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        self._entries[path] = data
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+
+class StaticServer:
+    def __init__(self, root: Path, cache_bytes: int = DEFAULT_CACHE_BYTES, log: bool = False) -> None:
+        self.root = root
+        self.index = build_index(root)
+        self.cache = LruCache(cache_bytes)
+        self.log = log
+        self.requests = 0
+
+    async def start(self, host: str, port: int) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port, limit=MAX_HEADER_BYTES)
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                except asyncio.LimitOverrunError:
+                    await self.send_simple(writer, 431, keep_alive=False)
+                    break
+                keep_alive = await self.handle_request(head, reader, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError, asyncio.IncompleteReadError):
+            # IncompleteReadError: the client closed before sending the body it announced.
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(
+        self, head: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            await self.send_simple(writer, 400, keep_alive=False)
+            return False
+        method, target, version = parts
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+        length = headers.get("content-length") or "0"
+        if not length.isdigit():
+            await self.send_simple(writer, 400, keep_alive=False)
+            return False
+        if int(length):
+            await reader.readexactly(int(length))
+
+        self.requests += 1
+        status = await self.respond(method, target, headers, writer, keep_alive)
+        if self.log:
+            print(f'{method} {target} {status}')
+        return keep_alive
+
+    async def respond(
+        self, method: str, target: str, headers: Dict[str, str], writer: asyncio.StreamWriter, keep_alive: bool
+    ) -> int:
+        if method not in ("GET", "HEAD"):
+            await self.send_simple(writer, 405, keep_alive, {"Allow": "GET, HEAD"})
+            return 405
+        path = unquote(urlsplit(target).path)
+        if path.endswith("/"):
+            path += "index.html"
+        resource = self.index.get(path)
+        if resource is None:
+            if f"{path}/index.html" in self.index:
+                await self.send_simple(writer, 301, keep_alive, {"Location": f"{path}/"})
+                return 301
+            await self.send_simple(writer, 404, keep_alive)
+            return 404
+
+        representation = choose_representation(resource, headers.get("accept-encoding", ""))
+        response_headers = {
+            "Content-Type": resource.content_type,
+            "ETag": representation.etag,
+            "Last-Modified": resource.last_modified,
+            "Cache-Control": resource.cache_control,
+            "Accept-Ranges": "bytes",
+        }
+        if len(resource.representations) > 1:
+            response_headers["Vary"] = "Accept-Encoding"
+        if representation.encoding != "identity":
+            response_headers["Content-Encoding"] = representation.encoding
+
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            not_modified = etag_matches(if_none_match, representation.etag)
+        else:
+            since = email.utils.parsedate_tz(headers.get("if-modified-since", ""))
+            not_modified = since is not None and resource.mtime <= email.utils.mktime_tz(since)
+        if not_modified:
+            self.write_head(writer, 304, response_headers, keep_alive)
+            await writer.drain()
+            return 304
+
+        status = 200
+        start, end = 0, representation.size - 1
+        range_header = headers.get("range")
+        if range_header and headers.get("if-range", representation.etag) == representation.etag:
+            try:
+                selected = parse_range(range_header, representation.size)
+            except RangeNotSatisfiable:
+                await self.send_simple(
+                    writer, 416, keep_alive, {"Content-Range": f"bytes */{representation.size}"}
+                )
+                return 416
+            if selected is not None:
+                status = 206
+                start, end = selected
+                response_headers["Content-Range"] = f"bytes {start}-{end}/{representation.size}"
+
+        count = end - start + 1
+        response_headers["Content-Length"] = str(count)
+        self.write_head(writer, status, response_headers, keep_alive)
+        if method == "HEAD" or count <= 0:
+            await writer.drain()
+            return status
+        await self.write_body(writer, representation, start, count)
+        return status
+
+    async def write_body(self, writer: asyncio.StreamWriter, representation: Representation, start: int, count: int) -> None:
+        if representation.size <= CACHEABLE_FILE_BYTES and self.cache.max_bytes:
+            data = self.cache.get(representation.path)
+            if data is None:
+                data = representation.path.read_bytes()
+                self.cache.put(representation.path, data)
+            writer.write(data[start : start + count])
+            await writer.drain()
+            return
+        await writer.drain()
+        with representation.path.open("rb") as handle:
+            # Zero-copy where the platform supports it; asyncio falls back to reads otherwise.
+            await asyncio.get_running_loop().sendfile(writer.transport, handle, start, count)
+
+    def write_head(self, writer: asyncio.StreamWriter, status: int, headers: Dict[str, str], keep_alive: bool) -> None:
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}", f"Date: {email.utils.formatdate(usegmt=True)}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+    async def send_simple(
+        self, writer: asyncio.StreamWriter, status: int, keep_alive: bool, extra: Optional[Dict[str, str]] = None
+    ) -> None:
+        body = f"{status} {REASONS[status]}\n".encode("ascii")
+        headers = {"Content-Type": "text/plain; charset=utf-8", "Content-Length": str(len(body)), **(extra or {})}
+        self.write_head(writer, status, headers, keep_alive)
+        writer.write(body)
+        await writer.drain()
+
+
+# --- Load generator -------------------------------------------------------
+
+
+@dataclass
+class Page:
+    url: str
+    resources: List[str]
+
+
+@dataclass
+class LoadStats:
+    latencies: List[float] = field(default_factory=list)
+    statuses: Dict[int, int] = field(default_factory=dict)
+    bytes_received: int = 0
+    errors: int = 0
+    page_views: int = 0
+
+
+def page_resources(root: Path, url: str, index: Dict[str, Resource]) -> List[str]:
+    """Same-site subresources (CSS, JS, images) a browser would fetch for a page."""
+    html = (root / url.lstrip("/")).read_text(encoding="utf-8", errors="replace")
+    base = url.rsplit("/", 1)[0] + "/"
+    resources: List[str] = []
+    for reference in REFERENCE_RE.findall(html):
+        if "://" in reference or reference.startswith(("data:", "mailto:")):
+            continue
+        resolved = "/" + "/".join(resolve_segments(base + reference))
+        if resolved in index and not resolved.endswith(".html") and resolved not in resources:
+            resources.append(resolved)
+    return resources
+
+
+def resolve_segments(path: str) -> List[str]:
+    segments: List[str] = []
+    for segment in path.split("/"):
+        if segment == "..":
+            if segments:
+                segments.pop()
+        elif segment and segment != ".":
+            segments.append(segment)
+    return segments
+
+
+def plan_pages(root: Path, index: Dict[str, Resource]) -> Tuple[Page, List[Page], Page, List[List[str]]]:
+    def page(url: str, extra: Tuple[str, ...] = ()) -> Page:
+        return Page(url, page_resources(root, url, index) + [item for item in extra if item in index])
+
+    contents = page("/tutorial/index.html")
+    chapters = [
+        page(url) for url in sorted(index) if re.fullmatch(r"/tutorial/\d{3}-[^/]+\.html", url)
+    ]
+    # The quiz script fetches the bank index after the page has loaded ...
+    quiz = page("/quiz/index.html", ("/quiz/bank/index.json",))
+    # ... and one question shard per section once the quiz starts.
+    shards: Dict[str, List[str]] = {}
+    for url in sorted(index):
+        match = re.fullmatch(r"/quiz/bank/([^/]+)/\d+\.json", url)
+        if match:
+            shards.setdefault(match.group(1), []).append(url)
+    return contents, chapters, quiz, list(shards.values())
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class HttpClient:
+    """Minimal keep-alive HTTP/1.1 client with a browser-like validator cache."""
+
+    def __init__(self, host: str, port: int, stats: LoadStats) -> None:
+        self.host = host
+        self.port = port
+        self.stats = stats
+        self.etags: Dict[str, str] = {}
+        self.immutable: set = set()
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def forget(self) -> None:
+        """Become a first-time visitor: empty cache, new connection."""
+        self.etags.clear()
+        self.immutable.clear()
+        await self.close()
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    async def get(self, url: str) -> None:
+        if url in self.immutable:
+            return
+        request = [f"GET {url} HTTP/1.1", f"Host: {self.host}", "Accept-Encoding: br, gzip"]
+        if url in self.etags:
+            request.append(f"If-None-Match: {self.etags[url]}")
+        payload = ("\r\n".join(request) + "\r\n\r\n").encode("latin-1")
+        started = time.perf_counter()
+        try:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            self._writer.write(payload)
+            status, headers = await self.read_head()
+            length = int(headers.get("content-length") or 0)
+            if length:
+                await self._reader.readexactly(length)
+        except (ConnectionError, asyncio.IncompleteReadError, OSError):
+            self.stats.errors += 1
+            await self.close()
+            return
+        self.stats.latencies.append(time.perf_counter() - started)
+        self.stats.statuses[status] = self.stats.statuses.get(status, 0) + 1
+        self.stats.bytes_received += length
+        if status == 200 and "etag" in headers:
+            self.etags[url] = headers["etag"]
+            if "immutable" in headers.get("cache-control", ""):
+                self.immutable.add(url)
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+
+    async def read_head(self) -> Tuple[int, Dict[str, str]]:
+        head = (await self._reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+        lines = head.split("\r\n")
+        status = int(lines[0].split(" ")[1])
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        return status, headers
+
+
+async def simulate_reader(
+    client: HttpClient,
+    plan: Tuple[Page, List[Page], Page, List[List[str]]],
+    deadline: float,
+    think: float,
+    rng: random.Random,
+) -> None:
+    contents, chapters, quiz, question_shards = plan
+
+    async def view(page: Page) -> None:
+        await client.get(page.url)
+        for resource in page.resources:
+            await client.get(resource)
+        client.stats.page_views += 1
+        if think:
+            await asyncio.sleep(think)
+
+    while time.perf_counter() < deadline:
+        if rng.random() < NEW_VISITOR_SHARE:
+            await client.forget()
+        if rng.random() < 0.65 and chapters:
+            # Reader: contents page, then a run of consecutive chapters.
+            await view(contents)
+            first = rng.randrange(len(chapters))
+            for chapter in chapters[first : first + rng.randint(1, 4)]:
+                await view(chapter)
+        else:
+            # Coach: takes the quiz, then follows a few review links.
+            await view(quiz)
+            for shards in question_shards:
+                await client.get(rng.choice(shards))
+            for chapter in rng.sample(chapters, min(len(chapters), rng.randint(0, 3))):
+                await view(chapter)
+
+
+async def run_loadtest(args: argparse.Namespace) -> LoadStats:
+    server = None
+    if args.url:
+        parts = urlsplit(args.url)
+        host, port = parts.hostname or "127.0.0.1", parts.port or 80
+        index = build_index(args.root)
+    else:
+        static = StaticServer(args.root)
+        server = await static.start("127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        index = static.index
+    plan = plan_pages(args.root, index)
+    stats = LoadStats()
+    rng = random.Random(args.seed)
+    clients = [HttpClient(host, port, stats) for _ in range(args.clients)]
+    deadline = time.perf_counter() + args.duration
+    try:
+        await asyncio.gather(
+            *(
+                simulate_reader(client, plan, deadline, args.think_ms / 1000, random.Random(rng.random()))
+                for client in clients
+            )
+        )
+    finally:
+        for client in clients:
+            await client.close()
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+    return stats
+
+
+def print_report(stats: LoadStats, elapsed: float, clients: int) -> None:
+    ordered = sorted(stats.latencies)
+    requests = len(ordered)
+    print(f"Clients:      {clients}")
+    print(f"Duration:     {elapsed:.1f}s")
+    print(f"Page views:   {stats.page_views}")
+    print(f"Requests:     {requests} ({requests / elapsed:.0f} req/s)")
+    print(f"Transferred:  {stats.bytes_received / 1e6:.1f} MB ({stats.bytes_received / 1e6 / elapsed:.1f} MB/s)")
+    print(f"Latency p50:  {percentile(ordered, 0.50) * 1000:.2f} ms")
+    print(f"Latency p99:  {percentile(ordered, 0.99) * 1000:.2f} ms")
+    print("Statuses:     " + ", ".join(f"{code}={count}" for code, count in sorted(stats.statuses.items())))
+    if stats.errors:
+        print(f"Errors:       {stats.errors}")
+
+
+def precompress(root: Path) -> None:
+    written = 0
+    for path in sorted(root.rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE_SUFFIXES:
+            continue
+        data = path.read_bytes()
+        encoders = [(".gz", lambda raw: gzip.compress(raw, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            encoders.append((".br", lambda raw: brotli.compress(raw, quality=11)))
+        for suffix, encode in encoders:
+            target = path.with_name(path.name + suffix)
+            if target.exists() and target.stat().st_mtime >= path.stat().st_mtime:
+                continue
+            compressed = encode(data)
+            if len(compressed) < len(data):
+                target.write_bytes(compressed)
+                written += 1
+    note = "" if brotli is not None else " (install brotli for .br files)"
+    print(f"Wrote {written} compressed files below {root}{note}")
+
+
+async def serve(args: argparse.Namespace) -> None:
+    static = StaticServer(args.root, args.cache_bytes, args.log)
+    server = await static.start(args.host, args.port)
+    print(f"Serving {args.root} ({len(static.index)} files) on http://{args.host}:{args.port}/")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    if args.command == "precompress":
+        precompress(args.root)
+    elif args.command == "serve":
+        try:
+            asyncio.run(serve(args))
+        except KeyboardInterrupt:
+            pass
+    else:
+        started = time.perf_counter()
+        stats = asyncio.run(run_loadtest(args))
+        print_report(stats, time.perf_counter() - started, args.clients)
+
+
+if __name__ == "__main__":
+    main()
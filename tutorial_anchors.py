@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""Match every quiz question to the tutorial passage that answers it.
+
+The generated tutorial pages are split into passages at their headings, and
+each question (prompt plus correct answer) is scored against the passages of
+its section's page with BM25. The whole bank is one matrix product: questions
+by terms times terms by passages. The best passage's heading id becomes the
+question's ``anchor``, so review links can point at ``page.html#anchor``
+instead of the top of the chapter.
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from bank_validation import QUIZ_DIR, TUTORIAL_DIR, tutorial_target
+
+try:  # Optional: without NumPy questions keep linking to the top of the page.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+TOKEN_RE = re.compile(r"[a-z0-9_]+")
+# h2-h6 without an id attribute; h1 is the page title.
+HEADING_RE = re.compile(r"<h([2-6])((?:\s+(?![^>]*\bid=)[^>]*)?)>(.*?)</h\1>", re.DOTALL | re.IGNORECASE)
+ID_RE = re.compile(r'\bid="([^"]*)"')
+TAG_RE = re.compile(r"<[^>]+>")
+SKIPPED_TAGS = {"script", "style", "template"}
+# Headings inside the chapter quiz are ours, not the tutorial's.
+SKIPPED_CLASSES = {"chapter-quiz"}
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+@dataclass
+class Passage:
+    page: str
+    anchor: str  # "" for the text before the first heading with an id
+    heading: str
+    words: List[str] = field(default_factory=list)
+
+
+def slugify(value: str) -> str:
+    """Same rule as ``convert_epub.slugify``, so ids match a fresh conversion."""
+    value = re.sub(r"[^a-z0-9]+", "-", value.lower().strip())
+    return re.sub(r"-{2,}", "-", value).strip("-") or "page"
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def add_heading_ids(html_text: str) -> Tuple[str, int]:
+    """Give every h2-h6 without an id one made from its text; returns the page and the count."""
+    used = set(ID_RE.findall(html_text))
+    added = 0
+
+    def assign(match: re.Match) -> str:
+        nonlocal added
+        level, attributes, inner = match.groups()
+        if "chapter-quiz__heading" in attributes:
+            return match.group(0)
+        base = slugify(html.unescape(TAG_RE.sub("", inner)))
+        anchor, suffix = base, 2
+        while anchor in used:
+            anchor, suffix = f"{base}-{suffix}", suffix + 1
+        used.add(anchor)
+        added += 1
+        return f'<h{level}{attributes} id="{anchor}">{inner}</h{level}>'
+
+    return HEADING_RE.sub(assign, html_text), added
+
+
+class PassageSplitter(HTMLParser):
+    """Collects the words of ``<main>``, starting a passage at every heading with an id."""
+
+    def __init__(self, page: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.page = page
+        self.passages = [Passage(page, "", "")]
+        self._in_main = False
+        self._skip_depth = 0
+        self._stack: List[bool] = []  # per open element: does it start a skipped region?
+        self._heading: Passage | None = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str | None]]) -> None:
+        attributes = dict(attrs)
+        if tag == "main":
+            self._in_main = True
+        if tag in ("br", "img", "hr", "input", "meta", "link", "source", "wbr"):
+            return
+        classes = set((attributes.get("class") or "").split())
+        skipped = tag in SKIPPED_TAGS or bool(classes & SKIPPED_CLASSES)
+        self._stack.append(skipped)
+        self._skip_depth += skipped
+        if self._in_main and not self._skip_depth and re.fullmatch(r"h[2-6]", tag) and attributes.get("id"):
+            self._heading = Passage(self.page, attributes["id"], "")
+            self.passages.append(self._heading)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "main":
+            self._in_main = False
+        if re.fullmatch(r"h[2-6]", tag):
+            self._heading = None
+        if self._stack:
+            self._skip_depth -= self._stack.pop()
+
+    def handle_data(self, data: str) -> None:
+        if not self._in_main or self._skip_depth:
+            return
+        if self._heading is not None:
+            self._heading.heading += data
+        self.passages[-1].words.extend(tokenize(data))
+
+
+def split_passages(html_text: str, page: str) -> List[Passage]:
+    splitter = PassageSplitter(page)
+    splitter.feed(html_text)
+    splitter.close()
+    return [passage for passage in splitter.passages if passage.words]
+
+
+def section_pages(sections: List[Dict[str, object]], quiz_dir: Path, tutorial_dir: Path) -> List[str]:
+    pages = []
+    for section in sections:
+        target = tutorial_target(section["tutorialPath"], quiz_dir, tutorial_dir)
+        if target is None:
+            raise ValueError(f"{section['id']}: tutorialPath {section['tutorialPath']!r} is not a tutorial page")
+        pages.append(str(target))
+    return pages
+
+
+def load_passages(pages: Sequence[str], add_ids: bool = True) -> Tuple[List[Passage], int]:
+    """Passages of the given pages, adding missing heading ids to the files first."""
+    passages: List[Passage] = []
+    added = 0
+    for page in dict.fromkeys(pages):
+        path = Path(page)
+        html_text = path.read_text(encoding="utf-8")
+        if add_ids:
+            updated, count = add_heading_ids(html_text)
+            if count:
+                temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+                temporary.write_text(updated, encoding="utf-8")
+                os.replace(temporary, path)
+                html_text, added = updated, added + count
+        passages.extend(split_passages(html_text, page))
+    return passages, added
+
+
+def bm25_weights(documents: List[List[int]], vocabulary_size: int) -> "np.ndarray":
+    """Passages by terms: the BM25 weight of each term in each passage."""
+    lengths = np.array([len(terms) for terms in documents], dtype=np.float64)
+    rows = np.repeat(np.arange(len(documents)), lengths.astype(np.int64))
+    columns = np.fromiter((term for terms in documents for term in terms), dtype=np.int64, count=len(rows))
+    counts = np.zeros((len(documents), vocabulary_size))
+    np.add.at(counts, (rows, columns), 1.0)
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log1p((len(documents) - document_frequency + 0.5) / (document_frequency + 0.5))
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / lengths.mean())
+    return idf * counts * (BM25_K1 + 1) / (counts + norm[:, None])
+
+
+def question_text(question: Dict[str, object]) -> str:
+    parts = [question["prompt"], question["options"][question["answerIndex"]]]
+    if question.get("explanation"):
+        parts.append(question["explanation"])
+    return " ".join(parts)
+
+
+def match_anchors(
+    sections: List[Dict[str, object]], pages: List[str], passages: List[Passage]
+) -> List[List[str | None]]:
+    """Per section, each question's best passage anchor (``None``: top of the page)."""
+    vocabulary: Dict[str, int] = {}
+    documents = [[vocabulary.setdefault(word, len(vocabulary)) for word in passage.words] for passage in passages]
+    weights = bm25_weights(documents, len(vocabulary))
+
+    questions = [(position, question) for position, section in enumerate(sections) for question in section["questions"]]
+    query = np.zeros((len(questions), len(vocabulary)))
+    for row, (_, question) in enumerate(questions):
+        terms = [vocabulary[word] for word in tokenize(question_text(question)) if word in vocabulary]
+        query[row, terms] = 1.0
+    scores = query @ weights.T
+
+    # Only passages of the question's own chapter are eligible.
+    page_ids = {page: index for index, page in enumerate(dict.fromkeys(pages))}
+    passage_pages = np.array([page_ids.get(passage.page, -1) for passage in passages])
+    question_pages = np.array([page_ids[pages[position]] for position, _ in questions])
+    scores[question_pages[:, None] != passage_pages[None, :]] = -np.inf
+    best = scores.argmax(axis=1)
+    found = np.isfinite(scores[np.arange(len(questions)), best]) & (scores.max(axis=1) > 0)
+
+    anchors: List[List[str | None]] = [[] for _ in sections]
+    for row, (position, _) in enumerate(questions):
+        anchor = passages[best[row]].anchor if found[row] else ""
+        anchors[position].append(anchor or None)
+    return anchors
+
+
+def bank_anchors(
+    sections: List[Dict[str, object]],
+    quiz_dir: Path = QUIZ_DIR,
+    tutorial_dir: Path = TUTORIAL_DIR,
+    add_ids: bool = True,
+) -> Tuple[List[List[str | None]] | None, int]:
+    """Anchors for the whole bank (``None`` without NumPy) and how many heading ids were added."""
+    if np is None:
+        return None, 0
+    pages = section_pages(sections, quiz_dir, tutorial_dir)
+    passages, added = load_passages(pages, add_ids)
+    return match_anchors(sections, pages, passages), added
+
+
+def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--tutorial-dir",
+        type=Path,
+        default=TUTORIAL_DIR,
+        help=f"Generated tutorial pages (default: {TUTORIAL_DIR}).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(argv)
+    if np is None:
+        raise SystemExit("tutorial_anchors.py needs NumPy: pip install numpy")
+    from build_question_bank import load_bank
+
+    sections = load_bank()
+    started = time.perf_counter()
+    anchors, _ = bank_anchors(sections, tutorial_dir=args.tutorial_dir, add_ids=False)
+    elapsed = time.perf_counter() - started
+    for section, section_anchors in zip(sections, anchors):
+        for question, anchor in zip(section["questions"], section_anchors):
+            print(f"{section['id']}#{anchor or ''}\t{question['prompt']}")
+    matched = sum(anchor is not None for section_anchors in anchors for anchor in section_anchors)
+    print(f"Matched {matched} of {sum(map(len, anchors))} questions to a passage in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()